@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+수집기 부하/백오프 벤치마크 (네트워크 없음)
+
+프로세스 안에서 가짜 주가 API 서버(fake_market_server.py)를 띄우고, HTTPCollector로
+동시 수집할 때의 처리량, 종목별 지연(p50/p95), 재시도(429/5xx) 횟수를 측정합니다.
+이어서 같은 응답을 카세트로 기록한 뒤 ReplayCollector 재생 처리량을 측정하고,
+수집/재생 결과가 합성 데이터와 일치하는지 확인합니다 (불일치/실패 시 종료 코드 1).
+
+사용법:
+    python benchmarks/bench_collectors.py --symbols 200 --workers 1 4 16
+    python benchmarks/bench_collectors.py --latency 0.05 --error-rate 0.1 --rate-limit 50
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from collectors import HTTPCollector, ReplayCollector, SyntheticCollector
+from fake_market_server import FakeMarketServer
+
+START, END = '2025-01-01', '2025-12-31'
+
+
+def collect_all(collector, universe: list, workers: int) -> dict:
+    """
+    종목 동시 수집
+
+    Returns:
+        {'seconds', 'latencies': [종목별 초], 'data': {code: rows}}
+    """
+    def one(stock):
+        start = time.perf_counter()
+        rows = collector.collect(stock['code'], stock['market'], START, END)
+        return stock['code'], rows, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(one, universe))
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': seconds,
+        'latencies': [latency for _, _, latency in results],
+        'data': {code: rows for code, rows, _ in results},
+    }
+
+
+def percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수집기 부하/백오프 벤치마크')
+    parser.add_argument('--symbols', type=int, default=100, help='종목 수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16], help='동시 수집 스레드 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='서버 평균 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='서버 지연 편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.05, help='서버 500 응답 확률')
+    parser.add_argument('--rate-limit', type=float, default=100, help='서버 초당 허용 요청 수 (0: 제한 없음)')
+    parser.add_argument('--backoff', type=float, default=0.05, help='수집기 백오프 기준 (초)')
+    parser.add_argument('--max-retries', type=int, default=8, help='수집기 최대 재시도')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    universe = SyntheticCollector.make_universe('kr', args.symbols)
+    synthetic = SyntheticCollector()
+    expected = {stock['code']: synthetic.collect(stock['code'], stock['market'], START, END)
+                for stock in universe}
+
+    server = FakeMarketServer(port=0, latency=args.latency, jitter=args.jitter,
+                              error_rate=args.error_rate, rate_limit=args.rate_limit)
+    server.start()
+
+    result = {'http': {}, 'replay': {}}
+    failed = False
+
+    try:
+        for workers in args.workers:
+            collector = HTTPCollector(server.url, backoff=args.backoff, max_retries=args.max_retries,
+                                      max_backoff=2.0)
+            run = collect_all(collector, universe, workers)
+            mismatched = sum(run['data'][code] != rows for code, rows in expected.items())
+            failed |= bool(mismatched)
+            result['http'][workers] = {
+                'seconds': run['seconds'],
+                'symbols_per_s': len(universe) / run['seconds'],
+                'p50_s': statistics.median(run['latencies']),
+                'p95_s': percentile(run['latencies'], 0.95),
+                'mismatched': mismatched,
+                **collector.stats,
+            }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = HTTPCollector(server.url, backoff=args.backoff, max_retries=args.max_retries,
+                                   max_backoff=2.0)
+            recorder = ReplayCollector(tmp, mode='record', source=source)
+            with contextlib.redirect_stdout(io.StringIO()):
+                record = collect_all(recorder, universe, max(args.workers))
+
+            player = ReplayCollector(tmp, mode='replay')
+            for workers in args.workers:
+                run = collect_all(player, universe, workers)
+                mismatched = sum(run['data'][code] != rows for code, rows in expected.items())
+                failed |= bool(mismatched)
+                result['replay'][workers] = {
+                    'seconds': run['seconds'],
+                    'symbols_per_s': len(universe) / run['seconds'],
+                    'p50_s': statistics.median(run['latencies']),
+                    'p95_s': percentile(run['latencies'], 0.95),
+                    'mismatched': mismatched,
+                }
+            result['record_seconds'] = record['seconds']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    result['server'] = dict(server.stats)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if failed else 0)
+
+    print(f"\n📊 {args.symbols}종목, 서버 지연 {args.latency * 1000:.0f}±{args.jitter * 1000:.0f}ms, "
+          f"오류율 {args.error_rate:.0%}, rate limit {args.rate_limit or '없음'}/s\n")
+    print(f"{'수집기':<14}{'스레드':>6}{'종목/s':>10}{'p50':>10}{'p95':>10}{'재시도':>8}{'429':>6}{'5xx':>6}{'실패':>6}")
+    for workers, item in result['http'].items():
+        print(f"{'http':<14}{workers:>6}{item['symbols_per_s']:>10.1f}{item['p50_s'] * 1000:>8.1f}ms"
+              f"{item['p95_s'] * 1000:>8.1f}ms{item['retries']:>8}{item['throttled']:>6}"
+              f"{item['server_errors']:>6}{item['failures']:>6}")
+    for workers, item in result['replay'].items():
+        print(f"{'replay':<14}{workers:>6}{item['symbols_per_s']:>10.1f}{item['p50_s'] * 1000:>8.1f}ms"
+              f"{item['p95_s'] * 1000:>8.1f}ms{'-':>8}{'-':>6}{'-':>6}{'-':>6}")
+
+    print(f"\n카세트 기록: {result['record_seconds']:.2f}s, 서버 통계: {result['server']}")
+    print("❌ 수집 결과 불일치" if failed else "✅ 수집/재생 결과 일치 (합성 데이터 기준)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+내보내기(export) 벤치마크
+
+합성 주가/평가 데이터를 만든 뒤 형식별 내보내기 시간과 처리량, 파일 크기,
+최대 메모리 사용량(tracemalloc, 별도 실행)을 측정합니다. 청크 단위로 기록하므로
+행 수가 늘어도 메모리 사용량은 거의 일정해야 합니다.
+
+사용법:
+    python benchmarks/bench_export.py --symbols 400 --bars 2500 --workers 2
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database import StockDatabase
+from exporter import DataExporter, EXPORT_COLUMNS
+from synthetic import generate_bars
+
+
+def build_db(path: Path, symbols: int, bars: int) -> dict:
+    """주가 + 최근 20일 평가 결과가 있는 DB 생성, {시장 구분: {종목: 시장}} 반환"""
+    db = StockDatabase(str(path), cache_entries=0)
+    markets = {'kr': {}, 'us': {}}
+
+    for i in range(symbols):
+        code = f"{i:06d}"
+        group, market = ('kr', 'KRX') if i % 2 == 0 else ('us', 'NASDAQ')
+        markets[group][code] = market
+
+        rows = generate_bars(code, bars)
+        db.save_price_data(code, market, rows)
+        for row in rows[-20:]:
+            db.save_evaluation(code, row['date'], 'bollinger', 3.0, {'position': 42.0})
+            db.save_evaluation(code, row['date'], 'ichimoku', 2.0, {'cloud_top': 1.0})
+
+    db.close()
+    return markets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='내보내기 벤치마크')
+    parser.add_argument('--symbols', type=int, default=400, help='종목 수')
+    parser.add_argument('--bars', type=int, default=2500, help='종목당 일봉 수')
+    parser.add_argument('--chunk-size', type=int, default=50_000, help='청크 크기')
+    parser.add_argument('--workers', type=int, default=2, help='시장별 병렬 기록 수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        markets = build_db(tmp / "bench.db", args.symbols, args.bars)
+        db = StockDatabase(str(tmp / "bench.db"), cache_entries=0)
+        exporter = DataExporter(db, weights={'bollinger': 1.0, 'ichimoku': 1.0}, chunk_size=args.chunk_size)
+
+        for format in ('arrow', 'parquet', 'csv'):
+            for workers in sorted({1, args.workers}):
+                output = tmp / f"{format}_{workers}"
+
+                def run():
+                    return exporter.export(markets, list(EXPORT_COLUMNS), str(output),
+                                           format=format, workers=workers)
+
+                start = time.perf_counter()
+                exported = run()
+                elapsed = time.perf_counter() - start
+
+                # tracemalloc은 실행을 느리게 하므로 메모리는 별도 실행으로 측정
+                # (workers > 1은 자식 프로세스에서 기록하므로 측정하지 않음)
+                peak = None
+                if workers == 1:
+                    tracemalloc.start()
+                    run()
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+                rows = sum(table['rows'] for tables in exported.values() for table in tables.values())
+                size = sum(path.stat().st_size for path in output.iterdir())
+                results[f"{format}_w{workers}"] = {
+                    'seconds': elapsed,
+                    'rows': rows,
+                    'rows_per_s': rows / elapsed,
+                    'bytes': size,
+                    'peak_mem_bytes': peak,
+                }
+
+        db.close()
+
+    if args.json:
+        print(json.dumps({'symbols': args.symbols, 'bars': args.bars, 'results': results}, indent=2))
+        return
+
+    print(f"\n📊 {args.symbols}종목 x {args.bars}일봉, 청크 {args.chunk_size:,}행\n")
+    print(f"{'항목':<14}{'시간':>10}{'행/초':>14}{'파일':>12}{'최대 메모리':>14}")
+    for name, result in results.items():
+        peak = result['peak_mem_bytes']
+        peak = f"{peak / 1e6:>12.1f}MB" if peak is not None else f"{'-':>14}"
+        print(f"{name:<14}{result['seconds']:>9.2f}s{result['rows_per_s']:>14,.0f}"
+              f"{result['bytes'] / 1e6:>10.1f}MB{peak}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+LLM 해설 동시 생성 벤치마크 (로컬 스텁 서버, API 키/네트워크 없음)
+
+프로세스 안에서 가짜 Messages API 서버(fake_llm_server.py)를 띄우고
+ClaudeCommentGenerator.generate_batch()를 동시 요청 수별로 실행해 소요 시간, 재시도,
+대체 코멘트 수를 측정합니다. 여러 종목을 한 요청으로 묶는 배치 모드(JSON 응답,
+누락 항목은 종목별 요청으로 대체)도 같은 방식으로 측정합니다. 결과 순서가 입력 순서와
+같은지, 동시 요청 수가 상한을 넘지 않는지, 영구 캐시로 재실행하면 API 요청 없이 같은
+해설이 나오는지 확인하고 어긋나면 종료 코드 1로 실패합니다.
+
+사용법:
+    python benchmarks/bench_llm.py --stocks 50 --concurrency 1 4 8
+    python benchmarks/bench_llm.py --latency 1.0 --rate-limit 5 --error-rate 0.1
+    python benchmarks/bench_llm.py --stocks 200 --concurrency 4 --batch-size 20 --drop-rate 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake_llm_server import FakeLLMServer
+from metrics import METRICS
+from reporters.llm_cache import LLMCommentCache
+from reporters.llm_generator import ClaudeCommentGenerator
+from synthetic import make_results
+
+
+def run_batch(stocks: list, args, concurrency: int, cache=None, batch_size: int = 1) -> dict:
+    """
+    스텁 서버를 띄우고 generate_batch() 1회 실행
+
+    Returns:
+        {'comments', 'seconds', 'counters', 'server', 'generator'}
+    """
+    server = FakeLLMServer(port=0, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, rate_limit=args.rate_limit,
+                           drop_rate=args.drop_rate)
+    server.start()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = ClaudeCommentGenerator(api_key='stub', base_url=server.url,
+                                           max_concurrency=concurrency, timeout=args.timeout,
+                                           max_retries=args.max_retries, backoff=0.2, max_backoff=2.0,
+                                           cache=cache, batch_size=batch_size)
+
+    METRICS.enabled = True
+    METRICS.reset()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        comments = generator.generate_batch(stocks)
+    seconds = time.perf_counter() - start
+    counters = METRICS.snapshot()['counters']
+    METRICS.enabled = False
+
+    server.shutdown()
+    server.server_close()
+
+    return {'comments': comments, 'seconds': seconds, 'counters': counters,
+            'server': dict(server.stats), 'generator': generator}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LLM 해설 동시 생성 벤치마크')
+    parser.add_argument('--stocks', type=int, default=30, help='종목 수')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8], help='동시 요청 수')
+    parser.add_argument('--latency', type=float, default=0.3, help='스텁 서버 평균 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='스텁 서버 지연 편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.05, help='529 응답 확률')
+    parser.add_argument('--rate-limit', type=float, default=20, help='초당 허용 요청 수 (0: 제한 없음)')
+    parser.add_argument('--max-retries', type=int, default=3, help='재시도 횟수')
+    parser.add_argument('--timeout', type=float, default=10.0, help='요청 타임아웃 (초)')
+    parser.add_argument('--batch-size', type=int, default=10, help='배치 요청 종목 수 (1: 배치 측정 생략)')
+    parser.add_argument('--drop-rate', type=float, default=0.1, help='배치 응답 종목 누락 확률')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    stocks = make_results(args.stocks)
+    result = {'concurrency': {}}
+    failed = False
+
+    def summarize(run: dict, concurrency: int) -> dict:
+        nonlocal failed
+        comments, generator = run['comments'], run['generator']
+
+        fallbacks = sum(comment == generator._fallback_stock_comment(stock)
+                        for stock, comment in zip(stocks, comments))
+        misordered = sum(not (comment.startswith('[stub]') and stock['code'] in comment)
+                         and comment != generator._fallback_stock_comment(stock)
+                         for stock, comment in zip(stocks, comments))
+        over_limit = run['server']['max_in_flight'] > concurrency
+        failed |= bool(misordered) or over_limit or len(comments) != len(stocks)
+
+        return {
+            'seconds': run['seconds'],
+            'stocks_per_s': len(stocks) / run['seconds'],
+            'requests': run['server']['requests'],
+            'retries': sum(item['value'] for item in run['counters'].get('llm_retries', [])),
+            'fallbacks': fallbacks,
+            'misordered': misordered,
+            'max_in_flight': run['server']['max_in_flight'],
+            'server': run['server'],
+        }
+
+    for concurrency in args.concurrency:
+        result['concurrency'][concurrency] = summarize(run_batch(stocks, args, concurrency), concurrency)
+
+    # 배치 요청: 누락 항목은 종목별 요청으로 대체되므로 순서/대응 관계는 그대로여야 함
+    if args.batch_size > 1:
+        concurrency = max(args.concurrency)
+        result['batch'] = summarize(run_batch(stocks, args, concurrency, batch_size=args.batch_size),
+                                    concurrency)
+
+    # 영구 캐시: 같은 입력으로 두 번 실행하면 두 번째는 API 요청 없이 같은 해설
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMCommentCache(str(Path(tmp) / "llm_cache.db"))
+        cold = run_batch(stocks, args, max(args.concurrency), cache)
+        warm = run_batch(stocks, args, max(args.concurrency), cache)
+        stats = cache.stats()
+        cache.close()
+
+    cached = sum(comment.startswith('[stub]') for comment in cold['comments'])
+    cache_ok = warm['server']['requests'] == len(stocks) - cached and all(
+        a == b for a, b in zip(cold['comments'], warm['comments']) if a.startswith('[stub]'))
+    failed |= not cache_ok
+    result['cache'] = {
+        'cold_seconds': cold['seconds'],
+        'warm_seconds': warm['seconds'],
+        'warm_requests': warm['server']['requests'],
+        'cached': cached,
+        'ok': cache_ok,
+        **stats,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if failed else 0)
+
+    print(f"\n📊 {args.stocks}종목, 스텁 지연 {args.latency * 1000:.0f}±{args.jitter * 1000:.0f}ms, "
+          f"오류율 {args.error_rate:.0%}, rate limit {args.rate_limit or '없음'}/s\n")
+    print(f"{'방식':<10}{'동시':>4}{'소요':>10}{'종목/s':>10}{'요청':>6}{'재시도':>8}{'대체':>6}{'최대 동시':>10}")
+    rows = [('종목별', concurrency, item) for concurrency, item in result['concurrency'].items()]
+    if 'batch' in result:
+        rows.append((f"배치 {args.batch_size}", max(args.concurrency), result['batch']))
+    for label, concurrency, item in rows:
+        print(f"{label:<10}{concurrency:>4}{item['seconds']:>9.2f}s{item['stocks_per_s']:>10.1f}"
+              f"{item['requests']:>6}{item['retries']:>8}{item['fallbacks']:>6}{item['max_in_flight']:>10}")
+    if 'batch' in result:
+        print(f"   배치 응답 누락 {result['batch']['server']['dropped']}종목 → 종목별 요청으로 대체")
+
+    item = result['cache']
+    print(f"\n💾 캐시: 첫 실행 {item['cold_seconds']:.2f}s, 재실행 {item['warm_seconds']:.3f}s "
+          f"(API 요청 {item['warm_requests']}건, 적중 {item['hits']}/{item['hits'] + item['misses']})")
+
+    print("❌ 순서 불일치, 동시 요청 상한 초과 또는 캐시 불일치" if failed
+          else "✅ 입력 순서 유지, 동시 요청 상한 준수, 재실행은 캐시 사용")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+계측(metrics) 오버헤드 벤치마크
+
+비활성화/활성화 상태의 timer() / timed() / incr() 호출 비용과, 계측이 들어간
+StockDatabase 조회 + 평가 도구 실행 루프의 시간을 비교합니다. 비활성화 상태의
+오버헤드는 호출당 수백 ns 이하여야 합니다.
+
+사용법:
+    python benchmarks/bench_metrics.py --calls 200000 --symbols 100
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database import StockDatabase
+from evaluators import BollingerEvaluator, IchimokuEvaluator
+from metrics import METRICS, Metrics
+from synthetic import generate_bars
+
+
+def per_call_ns(metrics: Metrics, calls: int) -> dict:
+    """호출당 비용 (ns, 빈 루프 시간 제외)"""
+    @metrics.timed('bench_seconds', op='noop')
+    def noop():
+        pass
+
+    def plain():
+        pass
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        pass
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        with metrics.timer('bench_seconds', stage='noop', symbol='000000'):
+            pass
+    timer_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.incr('bench', symbol='000000')
+    incr_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        plain()
+    plain_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        noop()
+    timed_s = time.perf_counter() - start
+
+    return {
+        'timer_ns': (timer_s - loop_s) / calls * 1e9,
+        'incr_ns': (incr_s - loop_s) / calls * 1e9,
+        'timed_ns': (timed_s - plain_s) / calls * 1e9,
+    }
+
+
+def evaluate_loop(db: StockDatabase, codes: list, evaluators: list) -> float:
+    """종목별 조회 + 평가 (main.py evaluate_stock과 같은 계측 지점)"""
+    start = time.perf_counter()
+    for code in codes:
+        with METRICS.timer('stage_seconds', stage='collect', symbol=code):
+            data = db.get_price_data(code, limit=60)
+        for evaluator in evaluators:
+            with METRICS.timer('evaluator_seconds', evaluator=evaluator.get_name(), symbol=code):
+                evaluator.evaluate(data)
+                evaluator.get_details(data)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='계측 오버헤드 벤치마크')
+    parser.add_argument('--calls', type=int, default=200_000, help='호출 횟수')
+    parser.add_argument('--symbols', type=int, default=100, help='평가 루프 종목 수')
+    parser.add_argument('--rounds', type=int, default=5, help='평가 루프 반복 (최소값 사용)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    result = {
+        'disabled': per_call_ns(Metrics(enabled=False), args.calls),
+        'enabled': per_call_ns(Metrics(enabled=True), args.calls),
+    }
+
+    evaluators = [BollingerEvaluator(), IchimokuEvaluator()]
+    codes = [f"{i:06d}" for i in range(args.symbols)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 캐시를 끄고 매번 SQLite에서 읽어 실제 조회 비용 포함
+        db = StockDatabase(str(Path(tmp) / "bench.db"), cache_entries=0)
+        for code in codes:
+            db.save_price_data(code, 'KRX', generate_bars(code, 250))
+
+        for enabled in (False, True):
+            METRICS.enabled = enabled
+            METRICS.reset()
+            seconds = min(evaluate_loop(db, codes, evaluators) for _ in range(args.rounds))
+            result['loop_enabled_s' if enabled else 'loop_disabled_s'] = seconds
+
+        METRICS.enabled = False
+        db.close()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"\n📊 호출당 비용 ({args.calls:,}회)\n")
+    print(f"{'항목':<10}{'비활성화':>12}{'활성화':>12}")
+    for name in ('timer_ns', 'incr_ns', 'timed_ns'):
+        print(f"{name:<10}{result['disabled'][name]:>10.0f}ns{result['enabled'][name]:>10.0f}ns")
+
+    disabled, enabled = result['loop_disabled_s'], result['loop_enabled_s']
+    print(f"\n{args.symbols}종목 조회 + 평가: 비활성화 {disabled * 1000:.1f}ms, "
+          f"활성화 {enabled * 1000:.1f}ms ({(enabled / disabled - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+memmap OHLCV 캐시 벤치마크
+
+같은 종목들을 SQLite 조회(get_price_data) 경로와 memmap 캐시(get_price_series) 경로로
+읽어 평가 도구까지 실행하는 시간을 비교하고, 두 경로의 평가 결과가 같은지 확인합니다.
+
+사용법:
+    python benchmarks/bench_ohlcv_cache.py --symbols 200 --bars 2500 --limit 250
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database import StockDatabase
+from evaluators import BollingerEvaluator, IchimokuEvaluator
+from synthetic import generate_bars
+
+
+def main():
+    parser = argparse.ArgumentParser(description='memmap OHLCV 캐시 벤치마크')
+    parser.add_argument('--symbols', type=int, default=200, help='종목 수')
+    parser.add_argument('--bars', type=int, default=2500, help='종목당 일봉 수')
+    parser.add_argument('--limit', type=int, default=250, help='평가에 사용할 최근 일봉 수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    evaluators = [BollingerEvaluator(), IchimokuEvaluator()]
+    codes = [f"{i:06d}" for i in range(args.symbols)]
+
+    def evaluate(data):
+        return [(ev.evaluate(data), ev.get_details(data)) for ev in evaluators]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = StockDatabase(str(Path(tmp) / "bench.db"), cache_entries=0,
+                           ohlcv_dir=str(Path(tmp) / "ohlcv"))
+        for code in codes:
+            db.save_price_data(code, 'KRX', generate_bars(code, args.bars))
+
+        start = time.perf_counter()
+        for code in codes:
+            db.get_price_series(code, 'KRX')
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sqlite_results = [evaluate(db.get_price_data(code, limit=args.limit)) for code in codes]
+        sqlite_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mmap_results = [evaluate(db.get_price_series(code, 'KRX', limit=args.limit)) for code in codes]
+        mmap_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for code in codes:
+            db.save_price_data(code, 'KRX', [{'date': '2100-01-04', 'open': 1.0, 'high': 1.0,
+                                              'low': 1.0, 'close': 1.0, 'volume': 1}])
+        append_s = time.perf_counter() - start
+
+        db.close()
+
+    if sqlite_results != mmap_results:
+        print("❌ SQLite / memmap 평가 결과 불일치")
+        sys.exit(1)
+
+    result = {
+        'symbols': args.symbols,
+        'bars': args.bars,
+        'limit': args.limit,
+        'build_s': build_s,
+        'sqlite_evaluate_s': sqlite_s,
+        'mmap_evaluate_s': mmap_s,
+        'append_day_s': append_s,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print("✅ 평가 결과 일치 (SQLite == memmap)")
+    print(f"\n📊 {args.symbols}종목 x {args.bars}일봉, 최근 {args.limit}일 평가\n")
+    print(f"캐시 생성 (전체 이력):   {build_s * 1000:>10.1f}ms")
+    print(f"SQLite 조회 + 평가:      {sqlite_s * 1000:>10.1f}ms")
+    print(f"memmap 조회 + 평가:      {mmap_s * 1000:>10.1f}ms ({mmap_s / sqlite_s:.2f}x)")
+    print(f"일별 추가 (DB + 캐시):   {append_s * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
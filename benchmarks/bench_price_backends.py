@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+주가 저장소(SQLite / Parquet) 적합성 검사 및 전체 종목 스캔 벤치마크
+
+두 저장소에 같은 합성 데이터를 저장한 뒤 PriceStore 인터페이스의 모든 조회가
+같은 결과를 반환하는지 확인하고, 대량 저장과 전체 종목(유니버스) 스캔 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_price_backends.py --symbols 500 --bars 2500
+    python benchmarks/bench_price_backends.py --check-only
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database import StockDatabase
+from storage import ParquetPriceStore
+from synthetic import generate_bars
+
+
+def open_backends(tmp: Path) -> dict:
+    return {
+        'sqlite': StockDatabase(str(tmp / "sqlite.db"), cache_entries=0),
+        'parquet': StockDatabase(str(tmp / "parquet.db"), cache_entries=0,
+                                 price_store=ParquetPriceStore(str(tmp / "prices"))),
+    }
+
+
+def check_conformance(tmp: Path) -> list:
+    """
+    두 저장소의 조회 결과 비교
+
+    Returns:
+        불일치 항목 이름 리스트 (빈 리스트: 통과)
+    """
+    backends = open_backends(tmp)
+    universe = [('005930', 'KRX'), ('000660', 'KRX'), ('AAPL', 'NASDAQ'), ('IBM', 'NYSE')]
+
+    for db in backends.values():
+        for code, market in universe:
+            db.save_price_data(code, market, generate_bars(code, 600))
+        # 기존 날짜 덮어쓰기 + 새 날짜 추가
+        db.save_price_data('005930', 'KRX', [
+            {'date': '2000-01-03', 'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 7},
+            {'date': '2030-01-02', 'open': 3.0, 'high': 4.0, 'low': 2.5, 'close': 3.5, 'volume': 9},
+        ])
+
+    cases = {
+        'latest_60': lambda db: db.get_price_data('005930', limit=60),
+        'range_limit': lambda db: db.get_price_data('000660', '2000-06-01', '2001-03-31', limit=40),
+        'range_all': lambda db: db.get_price_data('AAPL', '2000-01-01', '2001-12-31', limit=10_000),
+        'overwritten': lambda db: db.get_price_data('005930', end_date='2000-01-03', limit=1),
+        'missing_code': lambda db: db.get_price_data('NONE'),
+        'latest_date': lambda db: [db.get_latest_date(code) for code, _ in universe],
+        'latest_date_missing': lambda db: db.get_latest_date('NONE'),
+        'scan_all': lambda db: db.scan_prices(),
+        'scan_range': lambda db: db.scan_prices('2001-01-01', '2001-06-30'),
+        'scan_codes': lambda db: db.scan_prices(codes=['IBM', '005930']),
+        'scan_market': lambda db: db.scan_prices(market='KRX', start_date='2002-01-01'),
+        'scan_empty': lambda db: db.scan_prices('2050-01-01'),
+    }
+
+    failures = []
+    for name, case in cases.items():
+        results = [case(db) for db in backends.values()]
+        if results[0] != results[1]:
+            failures.append(name)
+
+    for db in backends.values():
+        db.close()
+
+    return failures
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(tmp: Path, symbols: int, bars: int) -> dict:
+    """대량 저장, 전체 종목 스캔, 단일 종목 조회 시간 측정"""
+    backends = open_backends(tmp)
+    codes = [f"{i:06d}" for i in range(symbols)]
+    data = {code: generate_bars(code, bars) for code in codes}
+
+    results = {}
+    for name, db in backends.items():
+        def bulk_append():
+            for code in codes:
+                db.save_price_data(code, 'KRX', data[code])
+            db.prices.flush()
+
+        if name == 'parquet':
+            compact = lambda: db.prices.compact()
+        else:
+            compact = lambda: None
+
+        results[name] = {
+            'bulk_append_s': timed(bulk_append),
+            'compact_s': timed(compact),
+            'scan_all_s': timed(lambda: db.scan_prices()),
+            'scan_recent_year_s': timed(lambda: db.scan_prices(start_date='2008-01-01')),
+            'scan_50_codes_s': timed(lambda: db.scan_prices(codes=codes[:50])),
+            'latest_60_s': timed(lambda: [db.get_price_data(code, limit=60) for code in codes[:100]]),
+        }
+        db.close()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주가 저장소 적합성 검사 / 스캔 벤치마크')
+    parser.add_argument('--symbols', type=int, default=500, help='종목 수')
+    parser.add_argument('--bars', type=int, default=2500, help='종목당 일봉 수')
+    parser.add_argument('--check-only', action='store_true', help='적합성 검사만 실행')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        failures = check_conformance(Path(tmp) / "check")
+
+    if failures:
+        print(f"❌ 저장소 결과 불일치: {', '.join(failures)}")
+        sys.exit(1)
+
+    if args.check_only:
+        print("✅ 적합성 검사 통과 (sqlite == parquet)")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = run_benchmark(Path(tmp), args.symbols, args.bars)
+
+    if args.json:
+        print(json.dumps({'symbols': args.symbols, 'bars': args.bars, 'results': results}, indent=2))
+        return
+
+    print("✅ 적합성 검사 통과 (sqlite == parquet)")
+    print(f"\n📊 {args.symbols}종목 x {args.bars}일봉 ({args.symbols * args.bars:,}행)\n")
+    print(f"{'항목':<20}{'sqlite':>12}{'parquet':>12}{'비율':>10}")
+    for key in results['sqlite']:
+        sqlite_s = results['sqlite'][key]
+        parquet_s = results['parquet'][key]
+        ratio = f"{parquet_s / sqlite_s:>9.2f}x" if sqlite_s > 0.001 else f"{'-':>10}"
+        print(f"{key:<20}{sqlite_s * 1000:>10.1f}ms{parquet_s * 1000:>10.1f}ms{ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+리포트 렌더링 벤치마크 (종목 수별 시간 / 최대 메모리)
+
+합성 분석 결과(synthetic.make_results)로 HTML 리포트를 문자열로 만드는 경우(generate)와
+템플릿 출력을 파일로 바로 쓰는 경우(write), Markdown 리포트 생성 시간을 종목 수별로
+측정합니다. virtual 모드(JSON 데이터 + 보이는 행만 렌더링)도 같은 방식으로 측정해 파일 크기를
+비교합니다. 최대 메모리는 tracemalloc으로 별도 실행해 측정하며, 종목 수가 늘어도
+종목당 시간은 거의 일정하고 write의 메모리는 generate보다 작아야 합니다.
+write 결과가 generate와 다르거나 virtual 리포트의 JSON 데이터를 읽을 수 없으면 종료 코드 1로 실패합니다.
+
+사용법:
+    python benchmarks/bench_render.py --symbols 1000 5000 20000
+    python benchmarks/bench_render.py --symbols 2000 --repeat 5 --json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from reporters import HTMLReporter, MarkdownReporter
+from synthetic import make_results
+
+DATE = '2026-02-10'
+
+PAYLOAD_PATTERN = re.compile(r'<script type="application/json" id="report-data">\s*(.*?)\s*</script>', re.S)
+
+
+def measure(func, repeat: int) -> float:
+    """중앙값 실행 시간 (초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def peak_memory(func) -> int:
+    """실행 중 최대 메모리 증가량 (bytes, tracemalloc)"""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - base
+
+
+def payload_ok(html: str, symbols: int) -> bool:
+    """virtual 리포트의 JSON 데이터가 파싱되고 종목 수가 맞는지"""
+    match = PAYLOAD_PATTERN.search(html)
+    if not match:
+        return False
+    try:
+        data = json.loads(match.group(1))
+    except ValueError:
+        return False
+    return len(data['rows']) == symbols and all(len(row) == len(data['columns']) for row in data['rows'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리포트 렌더링 벤치마크')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[1000, 5000, 20000], help='종목 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (중앙값)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    result = {}
+    failed = False
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        html = HTMLReporter({'use_llm': False, 'output_dir': tmp, 'html_mode': 'standard'})
+        virtual = HTMLReporter({'use_llm': False, 'output_dir': str(Path(tmp) / 'virtual'),
+                                'html_mode': 'virtual'})
+        markdown = MarkdownReporter({'use_llm': False, 'output_dir': tmp})
+
+        for symbols in args.symbols:
+            results = make_results(symbols, llm_analysis=True)
+
+            cases = {
+                'html.generate': lambda: html.generate('kr', DATE, results),
+                'html.write': lambda: html.write('kr', DATE, results),
+                'html_virtual.write': lambda: virtual.write('kr', DATE, results),
+                'markdown.generate': lambda: markdown.generate('kr', DATE, results),
+            }
+
+            path = html.write('kr', DATE, results)
+            size = Path(path).stat().st_size
+            failed |= Path(path).read_text(encoding='utf-8') != html.generate('kr', DATE, results)
+
+            virtual_path = virtual.write('kr', DATE, results)
+            virtual_size = Path(virtual_path).stat().st_size
+            virtual_html = Path(virtual_path).read_text(encoding='utf-8')
+            failed |= virtual_html != virtual.generate('kr', DATE, results)
+            failed |= not payload_ok(virtual_html, symbols)
+
+            result[symbols] = {
+                name: {
+                    'seconds': (seconds := measure(func, args.repeat)),
+                    'us_per_symbol': seconds / symbols * 1e6,
+                    'peak_mb': peak_memory(func) / 1024 / 1024,
+                }
+                for name, func in cases.items()
+            }
+            result[symbols]['html_mb'] = size / 1024 / 1024
+            result[symbols]['html_virtual_mb'] = virtual_size / 1024 / 1024
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if failed else 0)
+
+    print(f"\n{'종목 수':>8}  {'항목':<20}{'소요':>10}{'종목당':>12}{'최대 메모리':>14}")
+    for symbols, items in result.items():
+        for name, item in items.items():
+            if name in ('html_mb', 'html_virtual_mb'):
+                continue
+            print(f"{symbols:>8}  {name:<20}{item['seconds'] * 1000:>8.1f}ms{item['us_per_symbol']:>10.1f}us"
+                  f"{item['peak_mb']:>12.1f}MB")
+        print(f"{'':>8}  HTML 파일 {items['html_mb']:.1f}MB (virtual {items['html_virtual_mb']:.1f}MB)")
+
+    if failed:
+        print("❌ write 결과가 generate와 다르거나 virtual 리포트 JSON 데이터 오류")
+    else:
+        print("✅ write(스트리밍) 결과가 generate와 동일, virtual 리포트 JSON 데이터 정상")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
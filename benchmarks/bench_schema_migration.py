@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+stock_prices 스키마 마이그레이션(v1 -> v2) 전후 벤치마크
+
+v1(AUTOINCREMENT id, market/created_at 반복, 중복 인덱스) DB를 합성 데이터로 만든 뒤
+파일 크기와 주요 조회/삽입 시간을 측정하고, StockDatabase로 열어 v2로 마이그레이션한
+후 같은 항목을 다시 측정합니다.
+
+사용법:
+    python benchmarks/bench_schema_migration.py --symbols 200 --bars 2500
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from database import StockDatabase
+from synthetic import generate_bars
+
+
+def build_legacy_db(path: Path, symbols: int, bars: int) -> list:
+    """v1 스키마 DB 생성"""
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    StockDatabase._create_base_schema(cursor)
+
+    codes = [f"{i:06d}" for i in range(symbols)]
+    for code in codes:
+        cursor.executemany("""
+            INSERT INTO stock_prices (code, market, date, open, high, low, close, volume)
+            VALUES (?, 'KRX', ?, ?, ?, ?, ?, ?)
+        """, [(code, row['date'], row['open'], row['high'], row['low'], row['close'], row['volume'])
+              for row in generate_bars(code, bars)])
+
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    return codes
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure_legacy(path: Path, codes: list) -> dict:
+    """v1 스키마에서 기존 쿼리 측정"""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+
+    def latest_60():
+        for code in codes:
+            rows = conn.execute(
+                "SELECT * FROM stock_prices WHERE code = ? ORDER BY date DESC LIMIT ?", (code, 60)
+            ).fetchall()
+            [dict(row) for row in rows]
+
+    def latest_date():
+        for code in codes:
+            conn.execute("SELECT MAX(date) FROM stock_prices WHERE code = ?", (code,)).fetchone()
+
+    def range_scan():
+        conn.execute(
+            "SELECT code, date, close FROM stock_prices WHERE date >= ? ORDER BY code, date",
+            ("2005-01-01",)
+        ).fetchall()
+
+    def insert_day():
+        # 기존 save_price_data와 동일하게 종목별 삽입 + 커밋
+        for code in codes:
+            conn.execute("""
+                INSERT OR REPLACE INTO stock_prices (code, market, date, open, high, low, close, volume)
+                VALUES (?, 'KRX', '2100-01-04', 1, 1, 1, 1, 1)
+            """, (code,))
+            conn.commit()
+
+    result = {
+        'size_bytes': path.stat().st_size,
+        'latest_60_s': timed(latest_60),
+        'latest_date_s': timed(latest_date),
+        'range_scan_s': timed(range_scan),
+        'insert_day_s': timed(insert_day),
+    }
+    conn.close()
+    return result
+
+
+def measure_migrated(path: Path, codes: list) -> dict:
+    """StockDatabase(v2)로 마이그레이션 후 측정"""
+    start = time.perf_counter()
+    db = StockDatabase(str(path))
+    migrate_s = time.perf_counter() - start
+    db.conn.execute("VACUUM")
+
+    def latest_60():
+        for code in codes:
+            db.get_price_data(code, limit=60)
+
+    def latest_date():
+        for code in codes:
+            db.get_latest_date(code)
+
+    def range_scan():
+        db.conn.execute("""
+            SELECT s.code, p.date, p.close FROM stock_prices p
+            JOIN symbols s ON s.symbol_id = p.symbol_id
+            WHERE p.date >= ? ORDER BY s.code, p.date
+        """, (20050101,)).fetchall()
+
+    def insert_day():
+        for code in codes:
+            db.save_price_data(code, 'KRX', [{'date': '2100-01-05', 'open': 1, 'high': 1,
+                                              'low': 1, 'close': 1, 'volume': 1}])
+
+    result = {
+        'migrate_s': migrate_s,
+        'size_bytes': path.stat().st_size,
+        'latest_60_s': timed(latest_60),
+        'latest_date_s': timed(latest_date),
+        'range_scan_s': timed(range_scan),
+        'insert_day_s': timed(insert_day),
+    }
+    db.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='stock_prices 스키마 마이그레이션 벤치마크')
+    parser.add_argument('--symbols', type=int, default=200, help='종목 수')
+    parser.add_argument('--bars', type=int, default=2500, help='종목당 일봉 수')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        codes = build_legacy_db(path, args.symbols, args.bars)
+        before = measure_legacy(path, codes)
+        after = measure_migrated(path, codes)
+
+    if args.json:
+        print(json.dumps({'symbols': args.symbols, 'bars': args.bars,
+                          'before': before, 'after': after}, indent=2))
+        return
+
+    print(f"\n📊 {args.symbols}종목 x {args.bars}일봉 ({args.symbols * args.bars:,}행)")
+    print(f"   마이그레이션 시간: {after['migrate_s']:.2f}s\n")
+    print(f"{'항목':<16}{'v1':>14}{'v2':>14}{'비율':>10}")
+    for key in ('size_bytes', 'latest_60_s', 'latest_date_s', 'range_scan_s', 'insert_day_s'):
+        ratio = after[key] / before[key] if before[key] else 0
+        if key == 'size_bytes':
+            print(f"{key:<16}{before[key] / 1e6:>12.1f}MB{after[key] / 1e6:>12.1f}MB{ratio:>9.2f}x")
+        else:
+            print(f"{key:<16}{before[key] * 1000:>12.1f}ms{after[key] * 1000:>12.1f}ms{ratio:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
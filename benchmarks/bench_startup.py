@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+시작 시간(cold start) 예산 검사
+
+새 인터프리터에서 main 모듈 import 시간과 `main.py --help` 전체 실행 시간을 여러 번
+측정해 중앙값을 예산과 비교하고, 무거운 의존성(pandas, pyarrow, FinanceDataReader,
+anthropic 등)이 시작 시 import되지 않는지 확인합니다. 예산을 넘거나 무거운 의존성이
+로드되면 종료 코드 1로 실패합니다.
+
+사용법:
+    python benchmarks/bench_startup.py --runs 5 --import-budget-ms 250 --help-budget-ms 600
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from profiling import HEAVY_MODULES
+
+IMPORT_SNIPPET = f"""
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({{'import_s': elapsed, 'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import() -> dict:
+    """새 프로세스에서 import main 시간과 로드된 무거운 의존성"""
+    proc = subprocess.run([sys.executable, '-c', IMPORT_SNIPPET], cwd=SRC_DIR,
+                          capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure_command(args: list) -> float:
+    """새 프로세스로 명령 전체 실행 시간 (인터프리터 시작 포함)"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, cwd=SRC_DIR, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 시간 예산 검사')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (중앙값 사용)')
+    parser.add_argument('--import-budget-ms', type=float, default=250, help='import main 예산')
+    parser.add_argument('--help-budget-ms', type=float, default=600, help='main.py --help 예산')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    import_ms = statistics.median(run['import_s'] for run in imports) * 1000
+    heavy = sorted({name for run in imports for name in run['heavy']})
+
+    python_ms = statistics.median(measure_command(['-c', 'pass']) for _ in range(args.runs)) * 1000
+    help_ms = statistics.median(measure_command(['main.py', '--help']) for _ in range(args.runs)) * 1000
+
+    failures = []
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import main {import_ms:.0f}ms > 예산 {args.import_budget_ms:.0f}ms")
+    if help_ms > args.help_budget_ms:
+        failures.append(f"main.py --help {help_ms:.0f}ms > 예산 {args.help_budget_ms:.0f}ms")
+    if heavy:
+        failures.append(f"시작 시 무거운 의존성 import: {', '.join(heavy)}")
+
+    result = {
+        'runs': args.runs,
+        'python_ms': python_ms,
+        'import_main_ms': import_ms,
+        'help_ms': help_ms,
+        'heavy_modules': heavy,
+        'import_budget_ms': args.import_budget_ms,
+        'help_budget_ms': args.help_budget_ms,
+        'ok': not failures,
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"\n📊 시작 시간 (중앙값, {args.runs}회)\n")
+        print(f"인터프리터 시작 (python -c pass): {python_ms:>8.1f}ms")
+        print(f"import main:                     {import_ms:>8.1f}ms (예산 {args.import_budget_ms:.0f}ms)")
+        print(f"main.py --help:                  {help_ms:>8.1f}ms (예산 {args.help_budget_ms:.0f}ms)")
+        print()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if not failures:
+            print("✅ 시작 시간 예산 통과")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
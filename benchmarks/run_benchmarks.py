@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+합성 유니버스 벤치마크 모음
+
+결정적 합성 OHLCV(synthetic.py)로 다음 항목을 측정하고 결과를 JSON으로 저장하며,
+저장된 기준(baseline) 결과와 비교해 허용 범위를 넘게 느려진 항목이 있으면
+종료 코드 1로 실패합니다.
+
+- db: 주가 대량 저장, 종목별 최근 60일 조회 (캐시 없음/있음), 전체 종목 스캔
+- evaluator: 평가 도구별 evaluate + get_details, 기간 백필용 시점별 평가 (evaluate_history)
+- analyze: 가짜 수집기를 사용한 StockAnalyzer.analyze_market 전체 (수집 -> DB -> 평가, 입력이 같은 재실행)
+- render: Markdown / HTML 리포트 생성, HTML 파일 스트리밍 기록, 종목별 스파크라인 (캐시 없음/적중)
+
+사용법:
+    python benchmarks/run_benchmarks.py --symbols 200 --bars 500 -o results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --tolerance 0.25
+    python benchmarks/run_benchmarks.py --suite db --suite evaluator
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from collectors import SyntheticCollector
+from database import StockDatabase
+from evaluators import BollingerEvaluator, IchimokuEvaluator
+from synthetic import generate_bars
+
+SUITES = ['db', 'evaluator', 'analyze', 'render']
+
+# 분석/렌더링 기준 날짜 (합성 데이터 기간과 무관하게 고정)
+ANALYSIS_DATE = '2026-02-10'
+
+
+class FixtureCollector:
+    """미리 만든 합성 데이터를 돌려주는 수집기 (네트워크/생성 비용 없음)"""
+
+    def __init__(self, data: dict):
+        """
+        Args:
+            data: {종목 코드: 주가 리스트 (최신 순)}
+        """
+        self.data = data
+
+    def collect(self, code: str, market: str = "KRX", start_date: str = None,
+                end_date: str = None) -> list:
+        return list(self.data.get(code, []))
+
+
+@contextlib.contextmanager
+def quiet():
+    """분석/저장 중 진행 메시지 출력 숨김"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(func, repeat: int, setup=None) -> list:
+    """
+    실행 시간 측정
+
+    Args:
+        func: 측정할 함수 (setup 반환값을 인자로 받음, setup 없으면 인자 없음)
+        repeat: 반복 횟수
+        setup: 매 반복 전에 실행할 준비 함수 (측정 제외)
+
+    Returns:
+        반복별 소요 시간 (초)
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state) if setup else func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def summarize(times: list, ops: int, unit: str) -> dict:
+    median = statistics.median(times)
+    return {
+        'median_s': median,
+        'min_s': min(times),
+        'max_s': max(times),
+        'runs': len(times),
+        'ops': ops,
+        'unit': unit,
+        'ops_per_s': ops / median if median else None,
+    }
+
+
+def bench_db(ctx: dict) -> dict:
+    """주가 저장 / 조회 / 스캔, 전일 대비 점수 변화 조회"""
+    universe, data, tmp, repeat = ctx['universe'], ctx['data'], ctx['tmp'], ctx['repeat']
+    rows = sum(len(data[stock['code']]) for stock in universe)
+    results = {}
+    counter = iter(range(1_000_000))
+
+    def fresh_db():
+        return StockDatabase(str(tmp / f"ingest_{next(counter)}.db"), cache_entries=0)
+
+    def ingest(db):
+        for stock in universe:
+            db.save_price_data(stock['code'], stock['market'], data[stock['code']])
+        db.close()
+
+    results['db.ingest'] = summarize(measure(ingest, repeat, setup=fresh_db), rows, 'rows')
+
+    db = StockDatabase(str(tmp / "query.db"), cache_entries=0)
+    cached = StockDatabase(str(tmp / "query.db"))
+    for stock in universe:
+        db.save_price_data(stock['code'], stock['market'], data[stock['code']])
+
+    def latest(target):
+        for stock in universe:
+            target.get_price_data(stock['code'], limit=60)
+
+    results['db.get_price_data'] = summarize(measure(lambda: latest(db), repeat), len(universe), 'symbols')
+
+    latest(cached)
+    results['db.get_price_data.cached'] = summarize(measure(lambda: latest(cached), repeat),
+                                                    len(universe), 'symbols')
+
+    results['db.scan_prices'] = summarize(measure(lambda: db.scan_prices(), repeat), rows, 'rows')
+
+    # 전 거래일 대비 종합 점수 변화 (최근 30거래일 평가 결과 중 마지막 날 기준)
+    dates = sorted({row['date'] for stock in universe for row in data[stock['code']]})[-30:]
+    db.save_evaluations(
+        (stock['code'], date, evaluator, float((i + j) % 5), {})
+        for i, stock in enumerate(universe)
+        for j, date in enumerate(dates)
+        for evaluator in ('bollinger', 'ichimoku')
+    )
+    codes = [stock['code'] for stock in universe]
+    weights = {'bollinger': 1.0, 'ichimoku': 1.0}
+    results['db.overall_changes'] = summarize(
+        measure(lambda: db.get_overall_changes(codes, dates[-1], weights), repeat), len(universe), 'symbols')
+
+    cached.close()
+    db.close()
+    return results
+
+
+def bench_evaluator(ctx: dict) -> dict:
+    """평가 도구별 evaluate + get_details (최근 60일)"""
+    windows = [ctx['data'][stock['code']][-60:][::-1] for stock in ctx['universe']]
+    results = {}
+
+    for evaluator in (BollingerEvaluator(), IchimokuEvaluator()):
+        def run():
+            for window in windows:
+                evaluator.evaluate(window)
+                evaluator.get_details(window)
+
+        results[f"evaluator.{evaluator.get_name()}"] = summarize(
+            measure(run, ctx['repeat']), len(windows), 'symbols')
+
+    # 기간 백필: 종목별 전체 일봉의 시점별 평가 (evaluate_history)
+    histories = [{field: [row[field] for row in ctx['data'][stock['code']]]
+                  for field in ('date', 'open', 'high', 'low', 'close', 'volume')}
+                 for stock in ctx['universe']]
+    bars = sum(len(history['date']) for history in histories)
+
+    for evaluator in (BollingerEvaluator(), IchimokuEvaluator()):
+        def run_history():
+            for history in histories:
+                evaluator.evaluate_history(history)
+
+        results[f"evaluator.{evaluator.get_name()}.history"] = summarize(
+            measure(run_history, ctx['repeat']), bars, 'bars')
+
+    return results
+
+
+def make_analyzer(ctx: dict, db_path: str):
+    """가짜 수집기와 합성 종목 목록을 사용하는 StockAnalyzer (LLM 비활성화)"""
+    from main import StockAnalyzer
+
+    analyzer = StockAnalyzer(config_dir=str(ROOT / "config"), db_path=db_path, use_archives=False)
+    analyzer.stocks_config['kr_stocks'] = ctx['universe']
+    analyzer._collector = FixtureCollector(
+        {code: rows[::-1] for code, rows in ctx['data'].items()}
+    )
+    analyzer.report_config.update({'use_llm': False, 'output_dir': str(ctx['tmp'] / "reports"),
+                                   'charts': {**(analyzer.report_config.get('charts') or {}),
+                                              'cache_path': str(ctx['tmp'] / "chart_cache.db")}})
+    analyzer.reporters = analyzer.init_reporters()
+    return analyzer
+
+
+def bench_analyze(ctx: dict) -> dict:
+    """analyze_market 전체 (빈 DB에서 수집 -> 저장 -> 평가)"""
+    counter = iter(range(1_000_000))
+
+    def setup():
+        with quiet():
+            return make_analyzer(ctx, str(ctx['tmp'] / f"analyze_{next(counter)}.db"))
+
+    def run(analyzer):
+        with quiet():
+            ctx['results'] = analyzer.analyze_market('kr', ANALYSIS_DATE)
+            analyzer.close()
+
+    times = measure(run, ctx['repeat'], setup=setup)
+    results = {'analyze.kr': summarize(times, len(ctx['universe']), 'symbols')}
+
+    # 같은 데이터로 재실행 (입력 fingerprint가 같아 평가/평가 저장 생략)
+    with quiet():
+        analyzer = make_analyzer(ctx, str(ctx['tmp'] / "analyze_unchanged.db"))
+        analyzer.analyze_market('kr', ANALYSIS_DATE)
+
+    def rerun():
+        with quiet():
+            analyzer.analyze_market('kr', ANALYSIS_DATE, skip_unchanged=True)
+
+    results['analyze.kr.unchanged'] = summarize(measure(rerun, ctx['repeat']), len(ctx['universe']), 'symbols')
+    analyzer.close()
+
+    return results
+
+
+def bench_render(ctx: dict) -> dict:
+    """Markdown / HTML 리포트 생성 (파일 저장 제외), HTML 파일 스트리밍 기록"""
+    from reporters import MarkdownReporter, HTMLReporter
+
+    if 'results' not in ctx:
+        with quiet():
+            analyzer = make_analyzer(ctx, str(ctx['tmp'] / "render.db"))
+            ctx['results'] = analyzer.analyze_market('kr', ANALYSIS_DATE)
+            analyzer.close()
+
+    results = {}
+    for name, reporter_class in (('markdown', MarkdownReporter), ('html', HTMLReporter)):
+        with quiet():
+            reporter = reporter_class({'use_llm': False})
+
+        def run():
+            with quiet():
+                reporter.generate('kr', ANALYSIS_DATE, ctx['results'])
+
+        results[f"render.{name}"] = summarize(measure(run, ctx['repeat']),
+                                              len(ctx['results']), 'symbols')
+
+    # HTML 템플릿 출력을 파일로 바로 기록 (main.py 리포트 생성 경로)
+    with quiet():
+        html = HTMLReporter({'use_llm': False, 'output_dir': str(ctx['tmp'] / "reports")})
+
+    def write():
+        with quiet():
+            html.write('kr', ANALYSIS_DATE, ctx['results'])
+
+    results['render.html.write'] = summarize(measure(write, ctx['repeat']), len(ctx['results']), 'symbols')
+
+    # 스파크라인: 전체 종목 스캔 결과로 SVG 생성 (캐시 없음: 배치 계산, 적중: 캐시 조회만)
+    from reporters.sparkline import SparklineCache, SparklineRenderer
+
+    db = StockDatabase(str(ctx['tmp'] / "charts.db"), cache_entries=0)
+    for stock in ctx['universe']:
+        db.save_price_data(stock['code'], stock['market'], ctx['data'][stock['code']])
+    columns = db.scan_prices()
+    db.close()
+
+    renderer = SparklineRenderer()
+    results['render.sparkline'] = summarize(measure(lambda: renderer.render_columns(columns), ctx['repeat']),
+                                            len(ctx['universe']), 'symbols')
+
+    cached = SparklineRenderer(cache=SparklineCache(str(ctx['tmp'] / "chart_cache.db")))
+    cached.render_columns(columns)
+    results['render.sparkline.cached'] = summarize(measure(lambda: cached.render_columns(columns), ctx['repeat']),
+                                                   len(ctx['universe']), 'symbols')
+    cached.close()
+
+    return results
+
+
+BENCHMARKS = {
+    'db': bench_db,
+    'evaluator': bench_evaluator,
+    'analyze': bench_analyze,
+    'render': bench_render,
+}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    기준 결과와 비교
+
+    Args:
+        results: 현재 결과 ({'meta', 'results'})
+        baseline: 기준 결과 (같은 형식)
+        tolerance: 허용 비율 (0.2: 중앙값이 20% 넘게 느려지면 회귀)
+
+    Returns:
+        [(항목, 기준 중앙값, 현재 중앙값, 비율, 회귀 여부)]
+    """
+    rows = []
+    for name, current in results['results'].items():
+        base = baseline['results'].get(name)
+        if not base:
+            continue
+        ratio = current['median_s'] / base['median_s'] if base['median_s'] else float('inf')
+        rows.append((name, base['median_s'], current['median_s'], ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 유니버스 벤치마크')
+    parser.add_argument('--symbols', type=int, default=200, help='종목 수')
+    parser.add_argument('--bars', type=int, default=500, help='종목당 일봉 수')
+    parser.add_argument('--repeat', type=int, default=5, help='항목별 반복 횟수 (중앙값 비교)')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터 시드')
+    parser.add_argument('--suite', action='append', choices=SUITES,
+                        help='실행할 묶음 (여러 번 지정 가능, 기본: 전체)')
+    parser.add_argument('-o', '--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--save-baseline', help='현재 결과를 기준 결과로 저장할 경로')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='회귀 허용 비율 (기준 대비 중앙값 증가율)')
+    parser.add_argument('--json', action='store_true', help='JSON으로 결과 출력')
+    args = parser.parse_args()
+
+    suites = args.suite or SUITES
+    universe = SyntheticCollector.make_universe('kr', args.symbols)
+    data = {stock['code']: generate_bars(stock['code'], args.bars, seed=args.seed)
+            for stock in universe}
+
+    output = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'symbols': args.symbols,
+            'bars': args.bars,
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = {'universe': universe, 'data': data, 'tmp': Path(tmp), 'repeat': args.repeat}
+        for suite in suites:
+            if not args.json:
+                print(f"⏱️  {suite} ...", file=sys.stderr)
+            output['results'].update(BENCHMARKS[suite](ctx))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(output, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    comparison = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        comparison = compare(output, baseline, args.tolerance)
+        output['comparison'] = [
+            {'name': name, 'baseline_s': base, 'current_s': current, 'ratio': ratio, 'regression': bad}
+            for name, base, current, ratio, bad in comparison
+        ]
+
+    regressions = [row for row in comparison if row[4]]
+
+    if args.json:
+        print(json.dumps(output, indent=2, ensure_ascii=False))
+    else:
+        print(f"\n📊 {args.symbols}종목 x {args.bars}일봉, {args.repeat}회 반복 (중앙값)\n")
+        print(f"{'항목':<28}{'중앙값':>12}{'처리량':>22}")
+        for name, result in output['results'].items():
+            rate = f"{result['ops_per_s']:,.0f} {result['unit']}/s" if result['ops_per_s'] else '-'
+            print(f"{name:<28}{result['median_s'] * 1000:>10.2f}ms{rate:>22}")
+
+        if args.baseline:
+            print(f"\n📐 기준 결과 비교 ({args.baseline}, 허용 +{args.tolerance:.0%})\n")
+            for name, base, current, ratio, bad in comparison:
+                mark = '❌' if bad else '✅'
+                print(f"{mark} {name:<26}{base * 1000:>10.2f}ms -> {current * 1000:>10.2f}ms ({ratio:.2f}x)")
+
+            if regressions:
+                print(f"\n❌ 성능 회귀 {len(regressions)}건")
+            else:
+                print("\n✅ 성능 회귀 없음")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+벤치마크용 결정적 합성 데이터
+
+일봉과 종목 목록은 SyntheticCollector(--synthetic 실행과 같은 생성기)를 사용합니다.
+같은 (시드, 종목 코드, 일봉 수)는 항상 같은 데이터를 만들므로 실행/머신 간
+결과를 비교할 수 있습니다.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Dict, List
+
+from collectors import SyntheticCollector
+from collectors.synthetic_collector import ORIGIN_YEAR
+from evaluators import BaseEvaluator
+
+
+def generate_bars(code: str, bars: int, seed: int = 42) -> List[Dict]:
+    """
+    종목별 합성 일봉 bars개 (ORIGIN_YEAR 첫 월요일부터, 오래된 순)
+
+    Args:
+        code: 종목 코드
+        bars: 일봉 수
+        seed: 시드
+
+    Returns:
+        save_price_data() 입력 형식 [{'date', 'open', 'high', 'low', 'close', 'volume'}, ...]
+    """
+    start = date(ORIGIN_YEAR, 1, 1)
+    start += timedelta(days=-start.weekday() % 7)
+    # 주 5거래일 기준으로 bars개를 덮는 기간만 생성
+    end = start + timedelta(days=bars // 5 * 7 + 7)
+    return SyntheticCollector(seed=seed).generate(code, start.isoformat(), end.isoformat())[:bars]
+
+
+def make_results(count: int, seed: int = 42, llm_analysis: bool = False) -> List[Dict]:
+    """
+    리포터 입력 형식의 합성 분석 결과 (analyze_market 결과와 같은 키)
+
+    Args:
+        count: 종목 수
+        seed: 시드
+        llm_analysis: LLM 해설(llm_analysis) 포함 여부 (세 종목 중 하나)
+
+    Returns:
+        [{'code', 'name', 'current_price', 'price_change_rate', 'evaluations', 'overall_score', ...}, ...]
+    """
+    rng = random.Random(seed)
+    results = []
+
+    for i, stock in enumerate(SyntheticCollector.make_universe('kr', count)):
+        bb_score = rng.choice([0.0, 1.0, 2.0, 3.0, 4.0])
+        ich_score = rng.choice([0.0, 1.0, 2.0, 3.0, 4.0])
+        overall = (bb_score + ich_score) / 2
+        result = {
+            'code': stock['code'],
+            'name': stock['name'],
+            'current_price': round(rng.uniform(1_000, 500_000), -1),
+            'price_change_rate': round(rng.gauss(0, 2), 2),
+            'evaluations': {
+                'bollinger': {'score': bb_score, 'emoji': '🟢' if bb_score >= 3 else '🔴',
+                              'comment': f"밴드 {i % 100}%", 'details': {'position': float(i % 100)}},
+                'ichimoku': {'score': ich_score, 'emoji': '☀️' if ich_score >= 3 else '☁️',
+                             'comment': "중립, 추세 전환 중"},
+            },
+            'overall_score': overall,
+            'overall_emoji': BaseEvaluator.get_overall_emoji(overall),
+        }
+        if llm_analysis and i % 3 == 0:
+            result['llm_analysis'] = f"{result['name']}은 밴드 중단 부근에서 횡보 중입니다. " * (1 + i % 4)
+        results.append(result)
+
+    return results
@@ -6,6 +6,7 @@ cd "$(dirname "$0")/src"
 # 기본값
 MARKET="kr"
 FORCE=""
+DAEMON=""
 
 # 인자 파싱
 while [[ $# -gt 0 ]]; do
@@ -18,12 +19,17 @@ while [[ $# -gt 0 ]]; do
       FORCE="-f"
       shift
       ;;
+    -D|--daemon)
+      DAEMON="1"
+      shift
+      ;;
     -h|--help)
-      echo "사용법: $0 [-m kr|us|all] [-f]"
+      echo "사용법: $0 [-m kr|us|all] [-f] [-D]"
       echo ""
       echo "옵션:"
       echo "  -m, --market  분석할 시장 (kr, us, all) [기본값: kr]"
       echo "  -f, --force   캐시 무시하고 강제 업데이트"
+      echo "  -D, --daemon  데몬 모드로 실행 (장 마감 후 자동 분석, config/daemon.yml)"
       echo "  -h, --help    도움말 출력"
       exit 0
       ;;
@@ -35,6 +41,10 @@ while [[ $# -gt 0 ]]; do
   esac
 done
 
+if [ -n "$DAEMON" ]; then
+  exec python main.py daemon
+fi
+
 echo "🚀 주식 분석 시작..."
 echo "📊 시장: $MARKET"
 echo ""
@@ -0,0 +1,170 @@
+"""
+조회 결과 메모리 캐시 (LRU + TTL + 메모리 상한)
+StockDatabase 읽기 결과를 프로세스 내에서 재사용
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def estimate_size(value: Any) -> int:
+    """
+    캐시 값의 대략적인 메모리 사용량 (bytes, 리스트는 첫 항목 기준 추정)
+
+    Args:
+        value: list / dict / 스칼라 값
+
+    Returns:
+        추정 크기
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)) and value:
+        # 조회 결과는 같은 형태의 행이므로 첫 행 기준으로 추정
+        size += estimate_size(value[0]) * len(value)
+
+    return size
+
+
+class ReadCache:
+    """
+    LRU/TTL 읽기 캐시
+
+    키는 (namespace, code, ...) 형태의 튜플이며, (namespace, code) 태그 단위로
+    무효화할 수 있습니다. 반환된 값은 캐시와 공유되므로 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024,
+                 ttl: Optional[float] = None):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 메모리 사용량 (bytes, 추정치 기준)
+            ttl: 항목 유효 시간 (초, None 또는 0: 만료 없음)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl or None
+
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._tags: Dict[Tuple[Hashable, Hashable], set] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (적중 여부, 값)
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        value, _, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def put(self, key: Tuple, value: Any):
+        """
+        캐시 저장 (상한 초과 시 가장 오래 사용되지 않은 항목부터 제거)
+
+        Args:
+            key: 캐시 키 (namespace, code, ...)
+            value: 저장할 값
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[key] = (value, size, expires_at)
+        self._tags.setdefault(key[:2], set()).add(key)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, namespace: Hashable, code: Hashable):
+        """
+        (namespace, code) 태그의 모든 항목 무효화
+
+        Args:
+            namespace: 캐시 구분 (price, latest, evaluations 등)
+            code: 종목 코드
+        """
+        for key in list(self._tags.get((namespace, code), ())):
+            self._remove(key)
+            self.invalidations += 1
+
+    def discard(self, key: Tuple):
+        """단일 항목 무효화"""
+        if key in self._entries:
+            self._remove(key)
+            self.invalidations += 1
+
+    def clear(self):
+        """전체 무효화"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._tags.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Tuple):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+        tag = key[:2]
+        keys = self._tags.get(tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계
+
+        Returns:
+            {'entries', 'bytes', 'hits', 'misses', 'evictions', 'expirations', 'invalidations', 'hit_rate'}
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
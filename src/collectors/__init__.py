@@ -1,7 +1,21 @@
 """데이터 수집 모듈"""
 
-try:
-    from .fdr_collector import FDRCollector
-    __all__ = ['FDRCollector']
-except ImportError:
-    __all__ = []
+__all__ = ['FDRCollector', 'JSONCollector', 'SyntheticCollector', 'HTTPCollector', 'ReplayCollector']
+
+# 수집기는 첫 사용 시점에 import (FinanceDataReader가 pandas/requests/plotly까지 불러옴)
+_LAZY = {
+    'FDRCollector': '.fdr_collector',
+    'JSONCollector': '.json_collector',
+    'SyntheticCollector': '.synthetic_collector',
+    'HTTPCollector': '.http_collector',
+    'ReplayCollector': '.replay_collector',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
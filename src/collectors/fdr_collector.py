@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import time
 
+from metrics import METRICS
+
 
 class FDRCollector:
     """FinanceDataReader 기반 데이터 수집기"""
@@ -47,7 +49,8 @@ class FDRCollector:
             # 데이터 수집
             print(f"📥 [{code}] 데이터 수집 중... ({start_date} ~ {end_date})")
             
-            df = fdr.DataReader(code, start_date, end_date)
+            with METRICS.timer('collector_seconds', collector='fdr', step='fetch', symbol=code):
+                df = fdr.DataReader(code, start_date, end_date)
             
             if df is None or df.empty:
                 print(f"⚠️  [{code}] 데이터 없음")
@@ -55,32 +58,36 @@ class FDRCollector:
             
             # DataFrame -> List[Dict] 변환
             data = []
-            for date, row in df.iterrows():
-                try:
-                    data.append({
-                        'date': date.strftime('%Y-%m-%d'),
-                        'open': float(row.get('Open', 0)),
-                        'high': float(row.get('High', 0)),
-                        'low': float(row.get('Low', 0)),
-                        'close': float(row.get('Close', 0)),
-                        'volume': int(row.get('Volume', 0))
-                    })
-                except Exception as e:
-                    print(f"⚠️  [{code}] 행 변환 오류: {e}")
-                    continue
+            with METRICS.timer('collector_seconds', collector='fdr', step='convert', symbol=code):
+                for date, row in df.iterrows():
+                    try:
+                        data.append({
+                            'date': date.strftime('%Y-%m-%d'),
+                            'open': float(row.get('Open', 0)),
+                            'high': float(row.get('High', 0)),
+                            'low': float(row.get('Low', 0)),
+                            'close': float(row.get('Close', 0)),
+                            'volume': int(row.get('Volume', 0))
+                        })
+                    except Exception as e:
+                        print(f"⚠️  [{code}] 행 변환 오류: {e}")
+                        continue
             
             # 최신 데이터가 앞에 오도록 정렬
             data.reverse()
             
             print(f"✅ [{code}] {len(data)}건 수집 완료")
+            METRICS.incr('collector_rows', len(data), collector='fdr')
             
             # API rate limit 방지
-            time.sleep(self.delay)
+            with METRICS.timer('collector_seconds', collector='fdr', step='sleep', symbol=code):
+                time.sleep(self.delay)
             
             return data
         
         except Exception as e:
             print(f"❌ [{code}] 수집 실패: {e}")
+            METRICS.incr('collector_errors', collector='fdr')
             return []
     
     def collect_multiple(self, stocks: List[Dict]) -> Dict[str, List[Dict]]:
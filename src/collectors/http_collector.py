@@ -0,0 +1,184 @@
+"""
+HTTP 주가 API 수집기
+재시도/지수 백오프(지터)와 429 Retry-After 처리를 포함한 JSON API 클라이언트
+"""
+
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+
+from metrics import METRICS
+
+# 재시도할 HTTP 상태 (429: rate limit, 5xx: 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HTTPCollector:
+    """
+    HTTP JSON API 기반 데이터 수집기 (FDRCollector와 같은 인터페이스)
+
+    GET {base_url}/prices/{market}/{code}?start=YYYY-MM-DD&end=YYYY-MM-DD 요청에
+    {"code", "market", "data": [최신 순 일봉]} 형식으로 응답하는 서버를 사용합니다
+    (fake_market_server.py 참고). 여러 스레드에서 동시에 collect()를 호출해도 됩니다.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8765", days: int = 60,
+                 timeout: float = 10.0, max_retries: int = 5, backoff: float = 0.5,
+                 max_backoff: float = 30.0, delay: float = 0.0):
+        """
+        Args:
+            base_url: API 서버 주소
+            days: 수집할 과거 데이터 일수
+            timeout: 요청 타임아웃 (초)
+            max_retries: 최대 재시도 횟수 (첫 요청 제외)
+            backoff: 백오프 기준 시간 (초, 재시도마다 2배, 0~상한 사이 랜덤)
+            max_backoff: 백오프 상한 (초)
+            delay: 종목 간 대기 시간 (초)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.days = days
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.delay = delay
+
+        # 스레드 간 공유 통계 (요청, 재시도 사유별, 실패)
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0, 'server_errors': 0,
+                      'network_errors': 0, 'failures': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 대기 시간 (full jitter 지수 백오프)
+
+        Args:
+            attempt: 재시도 순번 (0부터)
+            retry_after: 서버가 알려준 Retry-After (초, 있으면 최소 대기 시간)
+
+        Returns:
+            대기 시간 (초)
+        """
+        wait = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        if retry_after is not None:
+            wait = max(wait, min(retry_after, self.max_backoff))
+        return wait
+
+    @staticmethod
+    def _retry_after(error: urllib.error.HTTPError) -> Optional[float]:
+        value = error.headers.get('Retry-After') if error.headers else None
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None  # HTTP 날짜 형식은 무시하고 백오프 사용
+
+    def fetch(self, code: str, market: str, start_date: str, end_date: str) -> Dict:
+        """
+        API 요청 (재시도 포함)
+
+        Args:
+            code: 종목 코드
+            market: 시장
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            urllib.error.URLError: 재시도 후에도 실패 (재시도하지 않는 4xx 포함)
+        """
+        query = urllib.parse.urlencode({'start': start_date, 'end': end_date})
+        url = (f"{self.base_url}/prices/{urllib.parse.quote(market)}/"
+               f"{urllib.parse.quote(code)}?{query}")
+
+        for attempt in range(self.max_retries + 1):
+            self._count('requests')
+            retry_after = None
+            try:
+                with METRICS.timer('collector_seconds', collector='http', step='fetch', symbol=code):
+                    with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                        return json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                if e.code not in RETRY_STATUS or attempt == self.max_retries:
+                    raise
+                reason = 'throttled' if e.code == 429 else 'server_errors'
+                retry_after = self._retry_after(e)
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                if attempt == self.max_retries:
+                    raise
+                reason = 'network_errors'
+
+            self._count(reason)
+            self._count('retries')
+            METRICS.incr('collector_retries', collector='http', reason=reason)
+
+            with METRICS.timer('collector_seconds', collector='http', step='backoff', symbol=code):
+                time.sleep(self.backoff_delay(attempt, retry_after))
+
+    def collect(self, code: str, market: str = "KRX",
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> List[Dict]:
+        """
+        주가 데이터 수집
+
+        Args:
+            code: 종목 코드
+            market: 시장 (KRX, NASDAQ, NYSE 등)
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+
+        Returns:
+            주가 데이터 리스트 (최신 순, 실패 시 빈 리스트)
+        """
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        if not start_date:
+            start_dt = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=self.days)
+            start_date = start_dt.strftime('%Y-%m-%d')
+
+        try:
+            data = self.fetch(code, market, start_date, end_date).get('data', [])
+        except Exception as e:
+            print(f"❌ [{code}] 수집 실패: {e}")
+            self._count('failures')
+            METRICS.incr('collector_errors', collector='http')
+            return []
+
+        METRICS.incr('collector_rows', len(data), collector='http')
+
+        if self.delay:
+            with METRICS.timer('collector_seconds', collector='http', step='sleep', symbol=code):
+                time.sleep(self.delay)
+
+        return data
+
+    def collect_multiple(self, stocks: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        여러 종목 데이터 일괄 수집
+
+        Args:
+            stocks: 종목 리스트 [{'code': '005930', 'market': 'KRX', ...}, ...]
+
+        Returns:
+            종목별 데이터 딕셔너리 {code: [data, ...], ...}
+        """
+        results = {}
+
+        for stock in stocks:
+            data = self.collect(stock['code'], stock.get('market', 'KRX'))
+            if data:
+                results[stock['code']] = data
+
+        return results
@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from metrics import METRICS
+
 
 class JSONCollector:
     """JSON 파일 기반 데이터 수집기"""
@@ -18,13 +20,17 @@ class JSONCollector:
         """
         self.data_dir = Path(data_dir)
     
-    def collect(self, code: str, market: str = "KRX") -> List[Dict]:
+    def collect(self, code: str, market: str = "KRX",
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> List[Dict]:
         """
         JSON 파일에서 주가 데이터 로드
         
         Args:
             code: 종목 코드 (예: "005930")
             market: 시장 (KRX 등)
+            start_date: 시작 날짜 (YYYY-MM-DD, 기본값: 처음부터)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값: 끝까지)
         
         Returns:
             주가 데이터 리스트 [{'date': 'YYYY-MM-DD', 'open': ..., 'high': ..., 'low': ..., 'close': ..., 'volume': ...}, ...]
@@ -41,21 +47,28 @@ class JSONCollector:
                 return []
             
             # JSON 로드
-            with open(filepath, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            with METRICS.timer('collector_seconds', collector='json', step='load', symbol=code):
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    json_data = json.load(f)
             
             data = json_data.get('data', [])
+            if start_date or end_date:
+                data = [row for row in data
+                        if (not start_date or row['date'] >= start_date)
+                        and (not end_date or row['date'] <= end_date)]
             
             if not data:
                 print(f"⚠️  [{code}] 데이터 없음")
                 return []
             
             print(f"✅ [{code}] {len(data)}건 로드 (최신: {data[0]['date']})")
+            METRICS.incr('collector_rows', len(data), collector='json')
             
             return data
         
         except Exception as e:
             print(f"❌ [{code}] 로드 실패: {e}")
+            METRICS.incr('collector_errors', collector='json')
             return []
     
     def collect_multiple(self, stocks: List[Dict]) -> Dict[str, List[Dict]]:
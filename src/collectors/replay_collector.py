@@ -0,0 +1,168 @@
+"""
+기록/재생(record/replay) 수집기
+실제 수집기 응답을 카세트 파일로 기록해 두고 네트워크 없이 재생
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from metrics import METRICS
+
+MODES = ('replay', 'record', 'auto')
+
+
+class ReplayCollector:
+    """
+    카세트 저장소 기반 수집기 (FDRCollector와 같은 인터페이스)
+
+    카세트는 종목별 JSON 파일({cassette_dir}/{market}/{code}.json)로, 기록된 일봉
+    전체(오래된 순)와 기록한 기간을 담습니다. 같은 종목을 다시 기록하면 날짜 기준으로
+    합쳐지므로 요청 기간이 달라도 기록한 범위 안에서는 그대로 재생됩니다.
+
+    모드:
+        replay: 카세트만 사용 (없거나 기간 밖이면 있는 만큼만 반환, 네트워크 없음)
+        record: 항상 source로 수집하고 카세트에 기록
+        auto: 카세트가 요청 기간을 덮으면 재생, 아니면 source로 수집 후 기록
+    """
+
+    def __init__(self, cassette_dir: str = "../data/cassettes", mode: str = "replay",
+                 source=None, days: int = 60):
+        """
+        Args:
+            cassette_dir: 카세트 저장 디렉토리
+            mode: replay | record | auto
+            source: 기록할 때 사용할 실제 수집기 (record/auto 모드 필수)
+            days: 수집할 과거 데이터 일수
+        """
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 카세트 모드: {mode} ({', '.join(MODES)})")
+        if mode != 'replay' and source is None:
+            raise ValueError(f"{mode} 모드에는 source 수집기가 필요합니다")
+
+        self.cassette_dir = Path(cassette_dir)
+        self.mode = mode
+        self.source = source
+        self.days = days
+
+    def cassette_path(self, code: str, market: str) -> Path:
+        return self.cassette_dir / market / f"{code}.json"
+
+    def load(self, code: str, market: str) -> Optional[Dict]:
+        """
+        카세트 로드
+
+        Returns:
+            {'code', 'market', 'start', 'end', 'recorded_at', 'data': [오래된 순]} 또는 None
+        """
+        path = self.cassette_path(code, market)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def record(self, code: str, market: str, start_date: str, end_date: str, data: List[Dict]):
+        """
+        수집 결과를 카세트에 기록 (기존 기록과 날짜 기준 병합)
+
+        Args:
+            code: 종목 코드
+            market: 시장
+            start_date: 요청 시작 날짜
+            end_date: 요청 종료 날짜
+            data: 수집 결과 (최신 순)
+        """
+        cassette = self.load(code, market)
+        rows = {row['date']: row for row in cassette['data']} if cassette else {}
+        rows.update((row['date'], row) for row in data)
+
+        if cassette:
+            start_date = min(start_date, cassette['start'])
+            end_date = max(end_date, cassette['end'])
+
+        path = self.cassette_path(code, market)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 동시에 읽는 재생 프로세스가 쓰다 만 파일을 보지 않도록 임시 파일 후 교체
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'code': code,
+                'market': market,
+                'start': start_date,
+                'end': end_date,
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'data': [rows[key] for key in sorted(rows)],
+            }, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def collect(self, code: str, market: str = "KRX",
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> List[Dict]:
+        """
+        주가 데이터 수집 (카세트 재생 또는 source 수집 후 기록)
+
+        Args:
+            code: 종목 코드
+            market: 시장
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+
+        Returns:
+            주가 데이터 리스트 (최신 순)
+        """
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        if not start_date:
+            start_dt = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=self.days)
+            start_date = start_dt.strftime('%Y-%m-%d')
+
+        cassette = None
+        if self.mode != 'record':
+            with METRICS.timer('collector_seconds', collector='replay', step='load', symbol=code):
+                cassette = self.load(code, market)
+
+        covered = cassette and cassette['start'] <= start_date and end_date <= cassette['end']
+
+        if self.mode == 'replay' or covered:
+            if not cassette:
+                print(f"⚠️  [{code}] 카세트 없음: {self.cassette_path(code, market)}")
+                METRICS.incr('collector_errors', collector='replay')
+                return []
+            if not covered:
+                print(f"⚠️  [{code}] 카세트 기간({cassette['start']} ~ {cassette['end']}) 밖 요청, "
+                      f"기록된 범위만 반환")
+
+            data = [row for row in reversed(cassette['data']) if start_date <= row['date'] <= end_date]
+            METRICS.incr('collector_rows', len(data), collector='replay')
+            METRICS.incr('cassette', result='hit')
+            return data
+
+        METRICS.incr('cassette', result='record')
+        data = self.source.collect(code, market, start_date, end_date)
+        if data:
+            self.record(code, market, start_date, end_date, data)
+            print(f"📼 [{code}] 카세트 기록 ({len(data)}건)")
+        return data
+
+    def collect_multiple(self, stocks: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        여러 종목 데이터 일괄 수집
+
+        Args:
+            stocks: 종목 리스트 [{'code': '005930', 'market': 'KRX', ...}, ...]
+
+        Returns:
+            종목별 데이터 딕셔너리 {code: [data, ...], ...}
+        """
+        results = {}
+
+        for stock in stocks:
+            data = self.collect(stock['code'], stock.get('market', 'KRX'))
+            if data:
+                results[stock['code']] = data
+
+        return results
@@ -0,0 +1,151 @@
+"""
+합성(synthetic) 주가 데이터 수집기
+네트워크 없이 프로파일링/벤치마크를 실행하기 위한 결정적 랜덤워크 OHLCV
+"""
+
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional
+
+from metrics import METRICS
+
+# 생성 시작 연도 (이전 날짜는 생성하지 않음)
+ORIGIN_YEAR = 2000
+
+
+class SyntheticCollector:
+    """종목 코드별로 항상 같은 데이터를 만드는 수집기 (FDRCollector와 같은 인터페이스)"""
+
+    def __init__(self, days: int = 60, seed: int = 42, delay: float = 0.0):
+        """
+        Args:
+            days: 수집할 과거 데이터 일수 (달력 기준, 주말 제외)
+            seed: 난수 시드 (같은 시드 + 종목 코드 -> 같은 데이터)
+            delay: 호출당 대기 시간 (초, API 지연 흉내)
+        """
+        self.days = days
+        self.seed = seed
+        self.delay = delay
+
+    def _year(self, code: str, year: int) -> List[tuple]:
+        """한 해의 평일 일봉 (오래된 순)"""
+        # 연초 기준가: 종목별 시작가에 연간 변동을 누적 (연도 수만큼만 계산)
+        rng = random.Random(f"{self.seed}:{code}")
+        price = rng.uniform(10, 1000)
+        for _ in range(ORIGIN_YEAR, year):
+            price *= 1 + (rng.random() - 0.5) * 0.6
+
+        rand = random.Random(f"{self.seed}:{code}:{year}").random
+        fromordinal = date.fromordinal
+        rows = []
+
+        for ordinal in range(date(year, 1, 1).toordinal(), date(year + 1, 1, 1).toordinal()):
+            # 0001-01-01(ordinal 1)이 월요일
+            if (ordinal - 1) % 7 < 5:
+                # 일간 변동 ±3%, 고가/저가 꼬리 최대 1.5%
+                open_ = price
+                close = max(0.01, open_ * (1 + (rand() - 0.5) * 0.06))
+                high = max(open_, close) * (1 + rand() * 0.015)
+                low = min(open_, close) * (1 - rand() * 0.015)
+                rows.append((fromordinal(ordinal).isoformat(), open_, high, low, close,
+                             int(1000 + rand() * 10_000_000)))
+                price = close
+
+        return rows
+
+    def generate(self, code: str, start_date: str, end_date: str) -> List[Dict]:
+        """
+        기간 내 평일 일봉 생성 (오래된 순)
+
+        연도별로 따로 생성하므로 기간이 달라도 같은 날짜의 값은 같습니다
+        (연초 기준가가 전년 종가와 달라 해가 바뀔 때 갭이 생길 수 있음).
+
+        Args:
+            code: 종목 코드
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+        """
+        first = max(int(start_date[:4]), ORIGIN_YEAR)
+        rows = [row for year in range(first, int(end_date[:4]) + 1)
+                for row in self._year(code, year)
+                if start_date <= row[0] <= end_date]
+
+        return [
+            {'date': d, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+            for d, o, h, l, c, v in rows
+        ]
+
+    def collect(self, code: str, market: str = "KRX",
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> List[Dict]:
+        """
+        합성 주가 데이터 수집
+
+        Args:
+            code: 종목 코드
+            market: 시장 (사용하지 않음, 인터페이스 호환)
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+
+        Returns:
+            주가 데이터 리스트 (최신 순)
+        """
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        if not start_date:
+            start_dt = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=self.days)
+            start_date = start_dt.strftime('%Y-%m-%d')
+
+        with METRICS.timer('collector_seconds', collector='synthetic', step='generate', symbol=code):
+            data = self.generate(code, start_date, end_date)
+        data.reverse()
+
+        METRICS.incr('collector_rows', len(data), collector='synthetic')
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        return data
+
+    def collect_multiple(self, stocks: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        여러 종목 데이터 일괄 수집
+
+        Args:
+            stocks: 종목 리스트 [{'code': '005930', 'market': 'KRX', ...}, ...]
+
+        Returns:
+            종목별 데이터 딕셔너리 {code: [data, ...], ...}
+        """
+        return {
+            stock['code']: self.collect(stock['code'], stock.get('market', 'KRX'))
+            for stock in stocks
+        }
+
+    @staticmethod
+    def make_universe(market: str, count: int) -> List[Dict]:
+        """
+        합성 종목 목록 (stocks.yml kr_stocks / us_stocks 형식)
+
+        Args:
+            market: kr 또는 us
+            count: 종목 수
+
+        Returns:
+            [{'code', 'name', 'market'}, ...]
+        """
+        if market == 'kr':
+            return [{'code': f"{i:06d}", 'name': f"합성종목{i}", 'market': 'KRX'} for i in range(count)]
+        return [{'code': f"SYN{i:04d}", 'name': f"Synthetic {i}", 'market': 'NASDAQ'} for i in range(count)]
+
+
+if __name__ == "__main__":
+    # 테스트
+    collector = SyntheticCollector(days=10)
+
+    data = collector.collect("005930", "KRX")
+    if data:
+        print(f"\n최신 데이터: {data[0]}")
+        print(f"총 {len(data)}건")
@@ -0,0 +1,423 @@
+"""
+데몬 모드 (상주 프로세스 + 장 마감 스케줄러 + 로컬 제어 소켓)
+
+한 번 띄운 프로세스에서 설정, DB 연결, 평가 도구, 조회 캐시를 유지한 채
+시장별 장 마감 이후 자동으로 분석을 실행하고, Unix 소켓으로 즉시 실행/상태 조회를 받습니다.
+
+제어 프로토콜 (한 줄 JSON 요청 -> 한 줄 JSON 응답):
+    {"command": "run", "market": "kr", "date": "2026-02-10", "force": false, "wait": true}
+    {"command": "status"}
+    {"command": "reload"}
+    {"command": "stop"}
+"""
+
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from datetime import datetime, date as date_cls, time as time_cls, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+
+# 시장별 기본 스케줄 (장 마감 시각, 현지 시간대)
+DEFAULT_MARKETS = {
+    'kr': {'timezone': 'Asia/Seoul', 'close': '15:30', 'delay_minutes': 30},
+    'us': {'timezone': 'America/New_York', 'close': '16:00', 'delay_minutes': 30},
+}
+
+
+class MarketSchedule:
+    """시장별 장 마감 스케줄 (평일, 휴장일 제외)"""
+
+    def __init__(self, market: str, timezone: str, close: str, delay_minutes: int = 30,
+                 holidays: Optional[List[str]] = None, enabled: bool = True):
+        """
+        Args:
+            market: 시장 (kr, us)
+            timezone: 현지 시간대 (IANA, 예: Asia/Seoul)
+            close: 장 마감 시각 (HH:MM, 현지 시간)
+            delay_minutes: 마감 후 실행까지 대기 시간 (분, 종가 데이터 반영 대기)
+            holidays: 휴장일 목록 (YYYY-MM-DD)
+            enabled: 자동 실행 여부
+        """
+        self.market = market
+        self.tz = ZoneInfo(timezone)
+        hour, minute = (int(part) for part in close.split(':'))
+        self.close = time_cls(hour, minute)
+        self.delay = timedelta(minutes=delay_minutes)
+        self.holidays = {date_cls.fromisoformat(day) for day in (holidays or [])}
+        self.enabled = enabled
+
+    def is_trading_day(self, day: date_cls) -> bool:
+        """거래일 여부 (주말/휴장일 제외)"""
+        return day.weekday() < 5 and day not in self.holidays
+
+    def run_time(self, day: date_cls) -> datetime:
+        """해당 거래일의 실행 시각 (현지 시간대 aware datetime)"""
+        return datetime.combine(day, self.close, tzinfo=self.tz) + self.delay
+
+    def next_run(self, now: datetime) -> datetime:
+        """
+        다음 실행 시각
+
+        Args:
+            now: 현재 시각 (aware datetime)
+
+        Returns:
+            now 이후 첫 거래일의 실행 시각 (현지 시간대)
+        """
+        day = now.astimezone(self.tz).date()
+        while True:
+            if self.is_trading_day(day):
+                run_at = self.run_time(day)
+                if run_at > now:
+                    return run_at
+            day += timedelta(days=1)
+
+    def last_session(self, now: datetime) -> Optional[date_cls]:
+        """
+        now 시점에 이미 실행 시각이 지난 가장 최근 거래일 (최대 7일 전까지)
+        """
+        day = now.astimezone(self.tz).date()
+        for _ in range(8):
+            if self.is_trading_day(day) and self.run_time(day) <= now:
+                return day
+            day -= timedelta(days=1)
+        return None
+
+
+class _Job:
+    """작업 큐 항목"""
+
+    def __init__(self, kind: str, market: Optional[str] = None, date: Optional[str] = None,
+                 force: bool = False, source: str = 'control'):
+        self.kind = kind
+        self.market = market
+        self.date = date
+        self.force = force
+        self.source = source
+        self.done = threading.Event()
+        self.result: Dict = {}
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """제어 소켓 요청 처리 (연결당 한 줄 요청)"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line.decode('utf-8') or '{}')
+            response = self.server.daemon.handle_command(request)
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+        self.wfile.write((json.dumps(response, ensure_ascii=False, default=str) + '\n').encode('utf-8'))
+
+
+class _ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class AnalysisDaemon:
+    """
+    StockAnalyzer 상주 실행기
+
+    StockAnalyzer(SQLite 연결 포함)는 작업 스레드 하나에서만 생성/사용하며,
+    스케줄러와 제어 소켓은 작업 큐에 작업을 넣기만 합니다.
+    """
+
+    def __init__(self, analyzer_factory: Callable, config: Dict = None):
+        """
+        Args:
+            analyzer_factory: StockAnalyzer 생성 함수 (작업 스레드에서 호출)
+            config: 데몬 설정 (config/daemon.yml)
+        """
+        self.analyzer_factory = analyzer_factory
+        self.config = config or {}
+        self.socket_path = Path(self.config.get('socket_path', '../data/stock-analyzer.sock'))
+        self.catch_up = self.config.get('catch_up', True)
+
+        self.schedules = {}
+        markets = self.config.get('markets') or {}
+        for market, defaults in DEFAULT_MARKETS.items():
+            options = {**defaults, **(markets.get(market) or {})}
+            self.schedules[market] = MarketSchedule(market, **options)
+
+        self._jobs: "queue.Queue[_Job]" = queue.Queue()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._worker = None
+        self._server = None
+
+        self.started_at = None
+        self.current: Optional[Dict] = None
+        self.last_runs: Dict[str, Dict] = {}
+        self.next_runs: Dict[str, datetime] = {}
+        self.analyzer = None
+
+    # ----- 작업 스레드 -----
+
+    def _work(self):
+        """작업 스레드: StockAnalyzer 생성 후 큐의 작업을 순서대로 실행"""
+        try:
+            self.analyzer = self.analyzer_factory()
+        except Exception as e:
+            print(f"❌ StockAnalyzer 초기화 실패: {e}")
+            traceback.print_exc()
+            self._stop.set()
+            self._ready.set()
+            return
+
+        self._ready.set()
+
+        try:
+            while True:
+                job = self._jobs.get()
+                if job.kind == 'stop':
+                    job.done.set()
+                    break
+
+                try:
+                    job.result = self._execute(job)
+                except Exception as e:
+                    traceback.print_exc()
+                    job.result = {'ok': False, 'error': str(e)}
+                finally:
+                    self.current = None
+                    job.done.set()
+        finally:
+            self.analyzer.close()
+
+    def _execute(self, job: _Job) -> Dict:
+        if job.kind == 'reload':
+            self.analyzer.reload_configs()
+            print("🔄 설정 다시 읽기 완료")
+            return {'ok': True}
+
+        if job.kind == 'catch_up':
+            # 오늘 실행 시각이 지났는데 설정된 형식 중 없는 리포트가 있으면 실행
+            if all(self.analyzer.db.get_report_hash(job.market, job.date, report_format) is not None
+                   for report_format in self.analyzer.report_formats()):
+                return {'ok': True, 'skipped': True}
+
+        self.current = {'market': job.market, 'date': job.date, 'source': job.source,
+                        'started_at': datetime.now().isoformat(timespec='seconds')}
+        print(f"\n⏰ [{job.source}] {job.market.upper()} 분석 실행 ({job.date})")
+
+        start = time.perf_counter()
+        try:
+            reports = self.analyzer.run(market=job.market, date=job.date, force_update=job.force)
+            result = {'ok': True, 'reports': reports}
+        except Exception as e:
+            traceback.print_exc()
+            result = {'ok': False, 'error': str(e)}
+
+        result['seconds'] = round(time.perf_counter() - start, 2)
+        for market in (['kr', 'us'] if job.market == 'all' else [job.market]):
+            self.last_runs[market] = {
+                'date': job.date,
+                'source': job.source,
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                **result
+            }
+
+        return result
+
+    def submit(self, kind: str, market: Optional[str] = None, date: Optional[str] = None,
+               force: bool = False, source: str = 'control') -> _Job:
+        """작업 큐에 추가"""
+        job = _Job(kind, market, date, force, source)
+        self._jobs.put(job)
+        return job
+
+    # ----- 제어 소켓 -----
+
+    def handle_command(self, request: Dict) -> Dict:
+        """
+        제어 명령 처리
+
+        Args:
+            request: {'command': 'run'|'status'|'reload'|'stop', ...}
+
+        Returns:
+            응답 딕셔너리
+        """
+        command = request.get('command')
+
+        if command == 'status':
+            return {'ok': True, **self.status()}
+
+        if command == 'run':
+            market = request.get('market', 'kr')
+            if market not in ('kr', 'us', 'all'):
+                return {'ok': False, 'error': f"알 수 없는 시장: {market}"}
+
+            run_date = request.get('date') or self._market_today(market)
+            job = self.submit('run', market, run_date, bool(request.get('force')), 'control')
+
+            if request.get('wait', True):
+                job.done.wait()
+                return job.result
+            return {'ok': True, 'queued': True, 'date': run_date}
+
+        if command == 'reload':
+            job = self.submit('reload')
+            job.done.wait()
+            return job.result
+
+        if command == 'stop':
+            self.stop()
+            return {'ok': True}
+
+        return {'ok': False, 'error': f"알 수 없는 명령: {command}"}
+
+    def status(self) -> Dict:
+        """
+        데몬 상태
+
+        Returns:
+            {'pid', 'started_at', 'current', 'queued', 'last_runs', 'next_runs', 'cache'}
+        """
+        cache = None
+        if self.analyzer is not None:
+            cache = self.analyzer.db.cache_stats()
+
+        return {
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'current': self.current,
+            'queued': self._jobs.qsize(),
+            'last_runs': self.last_runs,
+            'next_runs': {market: run_at.isoformat() for market, run_at in self.next_runs.items()},
+            'cache': cache
+        }
+
+    def _market_today(self, market: str) -> str:
+        """시장 현지 날짜 (all: 한국 기준)"""
+        schedule = self.schedules['kr' if market == 'all' else market]
+        return datetime.now(schedule.tz).strftime('%Y-%m-%d')
+
+    def _start_server(self):
+        if self.socket_path.exists():
+            # 이미 실행 중인 데몬이 있는지 확인 (응답이 없으면 이전 실행이 남긴 소켓)
+            try:
+                send_command(str(self.socket_path), {'command': 'status'}, timeout=1.0)
+            except (OSError, ValueError):
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"이미 실행 중인 데몬이 있습니다: {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _ControlServer(str(self.socket_path), _ControlHandler)
+        self._server.daemon = self
+        os.chmod(self.socket_path, 0o600)
+
+        threading.Thread(target=self._server.serve_forever, name='control-socket', daemon=True).start()
+
+    # ----- 스케줄러 -----
+
+    def _schedule_catch_up(self, now: datetime):
+        """시작 시 오늘 실행 시각이 이미 지난 시장은 리포트가 없으면 실행"""
+        for market, schedule in self.schedules.items():
+            if not schedule.enabled:
+                continue
+            day = schedule.last_session(now)
+            if day is not None and day == now.astimezone(schedule.tz).date():
+                self.submit('catch_up', market, day.isoformat(), source='catch-up')
+
+    def run(self):
+        """데몬 실행 (stop() 또는 SIGINT/SIGTERM까지 블록)"""
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+        self._worker = threading.Thread(target=self._work, name='analyzer', daemon=True)
+        self._worker.start()
+        self._ready.wait()
+        if self._stop.is_set():
+            return
+
+        try:
+            self._start_server()
+
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGTERM, lambda *_: self.stop())
+                signal.signal(signal.SIGINT, lambda *_: self.stop())
+
+            now = datetime.now().astimezone()
+            if self.catch_up:
+                self._schedule_catch_up(now)
+
+            for market, schedule in self.schedules.items():
+                if schedule.enabled:
+                    self.next_runs[market] = schedule.next_run(now)
+
+            print(f"🛰️  데몬 시작 (pid {os.getpid()}, 제어 소켓: {self.socket_path})")
+            for market, run_at in self.next_runs.items():
+                print(f"   {market.upper()} 다음 실행: {run_at.strftime('%Y-%m-%d %H:%M %Z')}")
+
+            while not self._stop.is_set():
+                now = datetime.now().astimezone()
+
+                for market, run_at in list(self.next_runs.items()):
+                    if run_at <= now:
+                        self.submit('run', market, run_at.date().isoformat(), source='schedule')
+                        self.next_runs[market] = self.schedules[market].next_run(now)
+
+                if self.next_runs:
+                    wait = min(run_at for run_at in self.next_runs.values()) - now
+                    timeout = min(max(wait.total_seconds(), 0.0), 60.0)
+                else:
+                    timeout = 60.0
+
+                # 시계 변경/절전 복귀에 대비해 최대 60초마다 다시 확인
+                self._stop.wait(timeout)
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """데몬 종료 요청 (진행 중인 분석은 끝까지 실행)"""
+        self._stop.set()
+
+    def _shutdown(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+        job = self.submit('stop')
+        job.done.wait()
+        self._worker.join()
+        print("👋 데몬 종료")
+
+
+def send_command(socket_path: str, request: Dict, timeout: Optional[float] = None) -> Dict:
+    """
+    실행 중인 데몬에 제어 명령 전송
+
+    Args:
+        socket_path: 제어 소켓 경로
+        request: 명령 ({'command': 'run', 'market': 'kr', ...})
+        timeout: 응답 대기 시간 (초, None: 무제한)
+
+    Returns:
+        응답 딕셔너리
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall((json.dumps(request) + '\n').encode('utf-8'))
+
+        chunks = []
+        while not chunks or not chunks[-1].endswith(b'\n'):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    return json.loads(b''.join(chunks).decode('utf-8'))
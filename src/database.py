@@ -5,31 +5,135 @@
 
 import sqlite3
 import json
-from datetime import datetime
+import hashlib
+import zlib
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Tuple, TYPE_CHECKING
+from cache import ReadCache
+from metrics import METRICS
+from storage import PriceStore, SQLitePriceStore
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+if TYPE_CHECKING:
+    from storage import PriceSeries
+
+
+# 리포트 본문 압축 코덱 (zstandard 설치 시 zstd, 없으면 zlib)
+REPORT_CODEC = 'zstd' if HAS_ZSTD else 'zlib'
+
+
+def _compress(content: bytes, codec: str = REPORT_CODEC) -> bytes:
+    """리포트 본문 압축"""
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=19).compress(content)
+    if codec == 'zlib':
+        return zlib.compress(content, 9)
+    return content
+
+
+def _decompress(blob: bytes, codec: str) -> bytes:
+    """리포트 본문 압축 해제"""
+    if codec == 'zstd':
+        if not HAS_ZSTD:
+            raise RuntimeError("zstd로 압축된 리포트입니다. pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    if codec == 'zlib':
+        return zlib.decompress(blob)
+    return blob
 
 
 class StockDatabase:
     """주식 데이터베이스 관리 클래스"""
     
-    def __init__(self, db_path: str = "data/stock_data.db"):
+    # 연도별 아카이브 DB 파일명
+    ARCHIVE_PATTERN = "stock_data_{year}.db"
+    
+    # 아카이브 대상 테이블 (아카이브 연결 시 temp 뷰로 통합 조회)
+    ARCHIVED_TABLES = ('stock_prices', 'evaluations', 'reports', 'report_blobs')
+    
+    def __init__(self, db_path: str = "data/stock_data.db", archive_dir: Optional[str] = None,
+                 cache_entries: int = 1024, cache_max_bytes: int = 32 * 1024 * 1024,
+                 cache_ttl: Optional[float] = None, price_store: Optional[PriceStore] = None,
+                 ohlcv_dir: Optional[str] = None):
         """
         Args:
             db_path: 데이터베이스 파일 경로
+            archive_dir: 연도별 아카이브 DB 디렉토리 (지정 시 ATTACH하여 함께 조회)
+            cache_entries: 조회 캐시 최대 항목 수 (0: 캐시 비활성화)
+            cache_max_bytes: 조회 캐시 메모리 상한 (bytes)
+            cache_ttl: 조회 캐시 유효 시간 (초, None: 만료 없음)
+            price_store: 주가 저장소 (기본: 같은 DB의 SQLitePriceStore)
+            ohlcv_dir: memmap OHLCV 캐시 디렉토리 (지정 시 get_price_series() 사용 가능, numpy 필요)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = None
+        
+        # get_price_data / get_latest_date / get_evaluations 결과 캐시
+        self.cache = ReadCache(max_entries=cache_entries, max_bytes=cache_max_bytes, ttl=cache_ttl)
+        
         self._init_database()
+        
+        # 주가 저장소 (평가/리포트는 항상 SQLite)
+        self.prices = price_store or SQLitePriceStore(self)
+        
+        # 읽기 최적화 OHLCV 캐시 (종목별 memmap 파일)
+        self.ohlcv = None
+        if ohlcv_dir:
+            try:
+                from storage import MmapPriceCache
+                self.ohlcv = MmapPriceCache(ohlcv_dir)
+            except ImportError:
+                print("⚠️  numpy가 설치되지 않아 OHLCV 캐시를 사용하지 않습니다.")
+        
+        if archive_dir:
+            self.attach_archives(archive_dir)
     
     def _init_database(self):
-        """데이터베이스 초기화 (테이블 생성)"""
+        """데이터베이스 초기화 (테이블 생성 및 스키마 마이그레이션)"""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        self._archives = {}
+        self._archive_files = {}
         
         cursor = self.conn.cursor()
         
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master")
+        fresh = cursor.fetchone()[0] == 0
+        
+        if fresh:
+            # 신규 DB는 증분 VACUUM 가능하도록 생성 (테이블 생성 전에만 설정 가능)
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        
+        # 스키마 버전 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        if self.get_schema_version() == 0:
+            # 신규 DB 또는 버전 관리 이전의 DB: v1 스키마 생성 (IF NOT EXISTS)
+            self._create_base_schema(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, description) VALUES (1, ?)",
+                ("base schema",)
+            )
+        
+        self.conn.commit()
+        
+        self._migrate(verbose=not fresh)
+    
+    @staticmethod
+    def _create_base_schema(cursor: sqlite3.Cursor):
+        """v1 기본 스키마 생성"""
         # 주가 데이터 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS stock_prices (
@@ -78,8 +182,202 @@ class StockDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_stock_code_date ON stock_prices(code, date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_code_date ON evaluations(code, date)")
         
-        self.conn.commit()
+        # 시계열 조회용 커버링 인덱스 (score까지 포함하여 테이블 접근 없이 조회)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_eval_evaluator_date
+            ON evaluations(evaluator, date, code, score)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_eval_code_evaluator_date
+            ON evaluations(code, evaluator, date, score)
+        """)
+    
+    # 스키마 마이그레이션 목록: (버전, 설명, 메서드 이름)
+    MIGRATIONS = [
+        (2, "compact stock_prices (symbols, integer date, WITHOUT ROWID)", "_migrate_v2_compact_prices"),
+        (3, "content-addressed report storage (report_blobs)", "_migrate_v3_report_blobs"),
+        (4, "input fingerprints for skip-unchanged runs", "_migrate_v4_input_fingerprints"),
+        (5, "collected price history ranges (price_coverage)", "_migrate_v5_price_coverage"),
+    ]
+    
+    def get_schema_version(self) -> int:
+        """
+        현재 스키마 버전 조회
+        
+        Returns:
+            적용된 최신 스키마 버전 (없으면 0)
+        """
+        row = self.conn.execute("SELECT MAX(version) AS version FROM schema_version").fetchone()
+        return row['version'] or 0
+    
+    def _migrate(self, verbose: bool = True):
+        """
+        미적용 스키마 마이그레이션을 순서대로 적용 (버전별 트랜잭션)
+        
+        Args:
+            verbose: 적용 내역 출력 여부 (신규 DB는 출력 생략)
+        """
+        current = self.get_schema_version()
+        
+        for version, description, method_name in self.MIGRATIONS:
+            if version <= current:
+                continue
+            
+            if verbose:
+                print(f"🔧 DB 스키마 마이그레이션 v{current} -> v{version}: {description}")
+            
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute("BEGIN")
+                getattr(self, method_name)(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (version, description)
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            
+            current = version
     
+    def _migrate_v2_compact_prices(self, cursor: sqlite3.Cursor):
+        """
+        v2: stock_prices 압축 스키마
+        
+        - 시장 정보를 symbols 차원 테이블로 분리 (종목당 1행)
+        - 날짜를 정수(YYYYMMDD)로 저장
+        - (symbol_id, date) 기본키의 WITHOUT ROWID 테이블 (중복 인덱스, id, created_at 제거)
+        """
+        cursor.execute("""
+            CREATE TABLE symbols (
+                symbol_id INTEGER PRIMARY KEY,
+                code TEXT NOT NULL UNIQUE,
+                market TEXT NOT NULL
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE stock_prices_v2 (
+                symbol_id INTEGER NOT NULL REFERENCES symbols(symbol_id),
+                date INTEGER NOT NULL,
+                open REAL,
+                high REAL,
+                low REAL,
+                close REAL,
+                volume INTEGER,
+                PRIMARY KEY (symbol_id, date)
+            ) WITHOUT ROWID
+        """)
+        
+        # 종목별 가장 최근 행의 시장 정보 사용
+        cursor.execute("""
+            INSERT INTO symbols (code, market)
+            SELECT p.code, p.market
+            FROM stock_prices p
+            JOIN (SELECT code, MAX(date) AS date FROM stock_prices GROUP BY code) latest
+              ON latest.code = p.code AND latest.date = p.date
+            ORDER BY p.code
+        """)
+        
+        cursor.execute("""
+            INSERT INTO stock_prices_v2 (symbol_id, date, open, high, low, close, volume)
+            SELECT s.symbol_id, CAST(REPLACE(p.date, '-', '') AS INTEGER),
+                   p.open, p.high, p.low, p.close, p.volume
+            FROM stock_prices p
+            JOIN symbols s ON s.code = p.code
+            ORDER BY s.symbol_id, p.date
+        """)
+        
+        cursor.execute("DROP TABLE stock_prices")
+        cursor.execute("ALTER TABLE stock_prices_v2 RENAME TO stock_prices")
+    
+    def _migrate_v3_report_blobs(self, cursor: sqlite3.Cursor):
+        """
+        v3: 리포트 본문을 content hash 기반 report_blobs 테이블로 분리 (중복 제거)
+        
+        기존 본문은 빠른 마이그레이션을 위해 비압축(raw)으로 옮기며,
+        compact_reports()(main.py maintenance --compact-reports)로 압축합니다.
+        """
+        cursor.execute("""
+            CREATE TABLE report_blobs (
+                content_hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                raw_size INTEGER NOT NULL,
+                content BLOB NOT NULL
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE reports_v3 (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                market TEXT NOT NULL,
+                date TEXT NOT NULL,
+                format TEXT NOT NULL,
+                content_hash TEXT NOT NULL REFERENCES report_blobs(content_hash),
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(market, date, format)
+            )
+        """)
+        
+        legacy = self.conn.cursor()
+        legacy.execute("SELECT id, market, date, format, content, created_at FROM reports ORDER BY id")
+        
+        migrated = 0
+        for row in legacy:
+            raw = row['content'].encode('utf-8')
+            content_hash = hashlib.sha256(raw).hexdigest()
+            
+            cursor.execute("""
+                INSERT OR IGNORE INTO report_blobs (content_hash, codec, raw_size, content)
+                VALUES (?, 'raw', ?, ?)
+            """, (content_hash, len(raw), raw))
+            cursor.execute("""
+                INSERT INTO reports_v3 (id, market, date, format, content_hash, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (row['id'], row['market'], row['date'], row['format'], content_hash, row['created_at']))
+            migrated += 1
+        
+        cursor.execute("DROP TABLE reports")
+        cursor.execute("ALTER TABLE reports_v3 RENAME TO reports")
+        cursor.execute("CREATE INDEX idx_reports_content_hash ON reports(content_hash)")
+        
+        if migrated:
+            print(f"ℹ️  리포트 {migrated}건 이전 완료. 압축하려면: python main.py maintenance --compact-reports")
+    
+    def _migrate_v4_input_fingerprints(self, cursor: sqlite3.Cursor):
+        """
+        v4: 실행 입력 fingerprint 테이블 (입력이 같은 평가/리포트 건너뛰기)
+        
+        scope별 키 하나에 마지막 fingerprint와 재사용할 결과(payload, JSON)만 유지합니다.
+        """
+        cursor.execute("""
+            CREATE TABLE input_fingerprints (
+                scope TEXT NOT NULL,
+                key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                payload TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (scope, key)
+            ) WITHOUT ROWID
+        """)
+    
+    def _migrate_v5_price_coverage(self, cursor: sqlite3.Cursor):
+        """
+        v5: 종목별 수집 완료 기간 (기간 백필이 같은 이력을 다시 수집하지 않도록)
+        
+        상장일이 시작일보다 늦거나 종료일이 휴장일이어도 수집기에 요청한 기간 전체를 기록합니다.
+        """
+        cursor.execute("""
+            CREATE TABLE price_coverage (
+                code TEXT PRIMARY KEY,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """)
+    
+    @METRICS.timed('db_seconds', op='save_price_data')
     def save_price_data(self, code: str, market: str, data: List[Dict]):
         """
         주가 데이터 저장
@@ -89,29 +387,16 @@ class StockDatabase:
             market: 시장 (KRX, NASDAQ, NYSE 등)
             data: 주가 데이터 리스트 [{'date': '2026-02-10', 'open': 100, ...}, ...]
         """
-        cursor = self.conn.cursor()
+        self.prices.save_price_data(code, market, data)
         
-        for row in data:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO stock_prices 
-                    (code, market, date, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    code,
-                    market,
-                    row['date'],
-                    row.get('open'),
-                    row.get('high'),
-                    row.get('low'),
-                    row.get('close'),
-                    row.get('volume')
-                ))
-            except Exception as e:
-                print(f"⚠️  데이터 저장 오류 ({code}, {row.get('date')}): {e}")
+        if self.ohlcv is not None:
+            # 이미 만들어진 캐시 파일만 갱신 (없으면 첫 조회 시 전체 이력으로 생성)
+            self.ohlcv.append(code, market, data)
         
-        self.conn.commit()
+        self.cache.invalidate('price', code)
+        self.cache.invalidate('latest', code)
     
+    @METRICS.timed('db_seconds', op='get_price_data')
     def get_price_data(self, code: str, start_date: Optional[str] = None, 
                        end_date: Optional[str] = None, limit: int = 60) -> List[Dict]:
         """
@@ -126,45 +411,120 @@ class StockDatabase:
         Returns:
             주가 데이터 리스트 (최신 순)
         """
-        cursor = self.conn.cursor()
+        key = ('price', code, start_date, end_date, limit)
+        hit, rows = self.cache.get(key)
+        if not hit:
+            rows = self.prices.get_price_data(code, start_date, end_date, limit)
+            self.cache.put(key, rows)
         
-        query = "SELECT * FROM stock_prices WHERE code = ?"
-        params = [code]
+        # 리스트는 복사해서 반환 (행 딕셔너리는 캐시와 공유, 수정 금지)
+        return list(rows)
+    
+    @METRICS.timed('db_seconds', op='get_latest_date')
+    def get_latest_date(self, code: str) -> Optional[str]:
+        """
+        종목의 최신 데이터 날짜 조회
         
-        if start_date:
-            query += " AND date >= ?"
-            params.append(start_date)
+        Args:
+            code: 종목 코드
         
-        if end_date:
-            query += " AND date <= ?"
-            params.append(end_date)
+        Returns:
+            최신 날짜 (YYYY-MM-DD) 또는 None
+        """
+        key = ('latest', code)
+        hit, latest = self.cache.get(key)
+        if not hit:
+            latest = self.prices.get_latest_date(code)
+            self.cache.put(key, latest)
         
-        query += " ORDER BY date DESC LIMIT ?"
-        params.append(limit)
+        return latest
+    
+    def get_price_coverage(self, code: str) -> Optional[Tuple[str, str]]:
+        """
+        수집 완료 기간 조회 (이 기간에 수집기가 가진 일봉은 모두 저장됨)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        Args:
+            code: 종목 코드
         
-        return [dict(row) for row in rows]
+        Returns:
+            (시작 날짜, 종료 날짜) 또는 None
+        """
+        row = self.conn.execute(
+            "SELECT start_date, end_date FROM main.price_coverage WHERE code = ?", (code,)
+        ).fetchone()
+        return (row['start_date'], row['end_date']) if row else None
     
-    def get_latest_date(self, code: str) -> Optional[str]:
+    def save_price_coverage(self, code: str, start_date: str, end_date: str):
         """
-        종목의 최신 데이터 날짜 조회
+        수집 완료 기간 기록 (기존 기간과 겹치면 합치고, 떨어져 있으면 새 기간으로 교체)
         
         Args:
             code: 종목 코드
+            start_date: 수집기에 요청한 시작 날짜 (YYYY-MM-DD)
+            end_date: 수집 완료로 볼 마지막 날짜 (YYYY-MM-DD)
+        """
+        coverage = self.get_price_coverage(code)
+        if coverage and coverage[0] <= end_date and start_date <= coverage[1]:
+            start_date, end_date = min(start_date, coverage[0]), max(end_date, coverage[1])
+        
+        self.conn.execute("""
+            INSERT OR REPLACE INTO main.price_coverage (code, start_date, end_date)
+            VALUES (?, ?, ?)
+        """, (code, start_date, end_date))
+        self.conn.commit()
+    
+    @METRICS.timed('db_seconds', op='get_price_series')
+    def get_price_series(self, code: str, market: str, start_date: Optional[str] = None,
+                         end_date: Optional[str] = None, limit: Optional[int] = 60) -> 'PriceSeries':
+        """
+        주가 시계열 조회 (memmap OHLCV 캐시, 복사 없음)
+        
+        캐시 파일이 없으면 주가 저장소의 전체 이력으로 생성합니다.
+        
+        Args:
+            code: 종목 코드
+            market: 시장 (KRX, NASDAQ, NYSE 등)
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            limit: 조회 건수 제한 (None: 전체)
         
         Returns:
-            최신 날짜 (YYYY-MM-DD) 또는 None
+            PriceSeries (최신 순, get_price_data() 결과처럼 사용 가능)
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT MAX(date) as latest FROM stock_prices WHERE code = ?",
-            (code,)
-        )
-        row = cursor.fetchone()
-        return row['latest'] if row else None
+        if self.ohlcv is None:
+            raise RuntimeError("OHLCV 캐시가 설정되지 않았습니다 (ohlcv_dir)")
+        
+        series = self.ohlcv.load(code, market)
+        if series is None:
+            columns = self.prices.scan(codes=[code], market=market)
+            self.ohlcv.write(code, market, self.ohlcv.columns_to_records(columns))
+            series = self.ohlcv.load(code, market)
+        
+        if start_date or end_date:
+            series = series.between(start_date, end_date)
+        if limit is not None:
+            series = series.latest(limit)
+        
+        return series
     
+    def scan_prices(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                    codes: Optional[Iterable[str]] = None,
+                    market: Optional[str] = None) -> Dict[str, list]:
+        """
+        전체 종목 주가 스캔 (백테스트, 유니버스 매트릭스용, 캐시 미적용)
+        
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            codes: 종목 코드 목록 (기본: 전체)
+            market: 시장 (KRX, NASDAQ 등, 기본: 전체)
+        
+        Returns:
+            컬럼 형식 {'code': [...], 'market': [...], 'date': [YYYYMMDD, ...], 'open': [...], ...}
+        """
+        return self.prices.scan(start_date, end_date, codes, market)
+    
+    @METRICS.timed('db_seconds', op='save_evaluation')
     def save_evaluation(self, code: str, date: str, evaluator: str, 
                        score: float, details: Dict):
         """
@@ -192,7 +552,43 @@ class StockDatabase:
         ))
         
         self.conn.commit()
+        
+        self.cache.discard(('evaluations', code, date))
+    
+    @METRICS.timed('db_seconds', op='save_evaluations')
+    def save_evaluations(self, rows: Iterable[Tuple[str, str, str, float, Dict]]) -> int:
+        """
+        평가 결과 일괄 저장 (한 트랜잭션, 기간 백필용)
+        
+        Args:
+            rows: (code, date, evaluator, score, details) 반복자
+        
+        Returns:
+            저장 건수
+        """
+        codes = set()
+        
+        def params():
+            for code, date, evaluator, score, details in rows:
+                codes.add(code)
+                yield code, date, evaluator, score, json.dumps(details, ensure_ascii=False)
+        
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO evaluations 
+            (code, date, evaluator, score, details)
+            VALUES (?, ?, ?, ?, ?)
+        """, params())
+        count = cursor.rowcount
+        
+        self.conn.commit()
+        
+        for code in codes:
+            self.cache.invalidate('evaluations', code)
+        
+        return count
     
+    @METRICS.timed('db_seconds', op='get_evaluations')
     def get_evaluations(self, code: str, date: str) -> List[Dict]:
         """
         평가 결과 조회
@@ -204,9 +600,14 @@ class StockDatabase:
         Returns:
             평가 결과 리스트
         """
+        key = ('evaluations', code, date)
+        hit, results = self.cache.get(key)
+        if hit:
+            return list(results)
+        
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM evaluations 
+        cursor.execute(f"""
+            SELECT * FROM {self._source('evaluations')} 
             WHERE code = ? AND date = ?
         """, (code, date))
         
@@ -218,30 +619,774 @@ class StockDatabase:
             data['details'] = json.loads(data['details'])
             results.append(data)
         
-        return results
+        self.cache.put(key, results)
+        return list(results)
+    
+    def get_evaluation_history(self, code: str, start_date: Optional[str] = None,
+                               end_date: Optional[str] = None,
+                               evaluators: Optional[Iterable[str]] = None,
+                               include_details: bool = False) -> Dict:
+        """
+        종목의 평가 점수 히스토리 조회 (컬럼 형식)
+        
+        Args:
+            code: 종목 코드
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            evaluators: 조회할 평가 도구 이름 목록 (기본: 전체)
+            include_details: 상세 정보(details) 포함 여부
+        
+        Returns:
+            {
+                'code': '005930',
+                'dates': ['2026-02-09', '2026-02-10'],       # 오래된 순
+                'scores': {'bollinger': [3.0, 1.0], ...},    # dates와 같은 길이, 없으면 None
+                'details': {'bollinger': [{...}, {...}], ...}  # include_details=True 일 때만
+            }
+        """
+        columns = "date, evaluator, score, details" if include_details else "date, evaluator, score"
+        query = f"SELECT {columns} FROM {self._source('evaluations')} WHERE code = ?"
+        params = [code]
+        
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        
+        if evaluators is not None:
+            query += " AND evaluator IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(evaluators)))
+        
+        # (code, evaluator, date) 커버링 인덱스 순서 그대로 읽어 정렬 비용 제거
+        query += " ORDER BY evaluator, date"
+        
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        
+        rows_by_evaluator = {}
+        for row in cursor:
+            rows_by_evaluator.setdefault(row['evaluator'], []).append(row)
+        
+        dates = sorted({row['date'] for rows in rows_by_evaluator.values() for row in rows})
+        date_index = {date: idx for idx, date in enumerate(dates)}
+        
+        scores = {}
+        details = {}
+        
+        for name, rows in rows_by_evaluator.items():
+            score_column = [None] * len(dates)
+            detail_column = [None] * len(dates)
+            
+            for row in rows:
+                idx = date_index[row['date']]
+                score_column[idx] = row['score']
+                if include_details and row['details']:
+                    detail_column[idx] = json.loads(row['details'])
+            
+            scores[name] = score_column
+            if include_details:
+                details[name] = detail_column
+        
+        history = {'code': code, 'dates': dates, 'scores': scores}
+        if include_details:
+            history['details'] = details
+        
+        return history
     
+    def get_score_matrix(self, evaluator: str, start_date: Optional[str] = None,
+                         end_date: Optional[str] = None,
+                         codes: Optional[Iterable[str]] = None) -> Dict:
+        """
+        전체 종목의 평가 점수 매트릭스 조회 (날짜 x 종목, 컬럼 형식)
+        
+        Args:
+            evaluator: 평가 도구 이름
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            codes: 조회할 종목 코드 목록 (기본: 전체)
+        
+        Returns:
+            {
+                'evaluator': 'bollinger',
+                'dates': ['2026-02-09', '2026-02-10'],              # 오래된 순
+                'codes': ['005930', '042660'],                      # 코드 순
+                'scores': {'005930': [3.0, 1.0], '042660': [None, 2.0]}  # 종목별 컬럼
+            }
+        """
+        query = f"SELECT date, code, score FROM {self._source('evaluations')} WHERE evaluator = ?"
+        params = [evaluator]
+        
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        
+        if codes is not None:
+            query += " AND code IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(codes)))
+        
+        query += " ORDER BY date"
+        
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        
+        dates = []
+        scores = {}
+        
+        for date, code, score in cursor:
+            if not dates or dates[-1] != date:
+                dates.append(date)
+            
+            column = scores.setdefault(code, [])
+            column.extend([None] * (len(dates) - 1 - len(column)))
+            column.append(score)
+        
+        for column in scores.values():
+            column.extend([None] * (len(dates) - len(column)))
+        
+        codes_sorted = sorted(scores)
+        
+        return {
+            'evaluator': evaluator,
+            'dates': dates,
+            'codes': codes_sorted,
+            'scores': {code: scores[code] for code in codes_sorted}
+        }
+    
+    @METRICS.timed('db_seconds', op='get_overall_changes')
+    def get_overall_changes(self, codes: Iterable[str], date: str,
+                            weights: Dict[str, float]) -> Dict:
+        """
+        종목별 종합 점수의 전 거래일 대비 변화 (저장된 평가 결과만 사용, 쿼리 1회)
+        
+        전 거래일은 대상 종목의 평가 결과가 있는 date 이전의 마지막 날짜입니다.
+        종합 점수는 main.py 종합 평가와 같은 식(SUM(score * weight) / 평가 도구 수)이며,
+        weights에 있는 평가 도구만 사용합니다.
+        
+        Args:
+            codes: 종목 코드 목록
+            date: 기준 날짜 (YYYY-MM-DD)
+            weights: 평가 도구별 가중치 {이름: 가중치}
+        
+        Returns:
+            {
+                'date': '2026-02-10',
+                'prev_date': '2026-02-09',   # 이전 평가가 없으면 None
+                'rows': [('005930', 3.0, 2.5), ('042660', 2.0, None), ...]  # (코드, 점수, 전일 점수) 코드 순
+            }
+        """
+        source = self._source('evaluations')
+        query = f"""
+            WITH stocks AS (
+                SELECT value AS code FROM json_each(?)
+            ),
+            prev AS (
+                SELECT MAX(e.date) AS date
+                FROM stocks s JOIN {source} e ON e.code = s.code
+                WHERE e.date < ?
+            ),
+            overall AS (
+                SELECT e.code, e.date, SUM(e.score * w.value) / COUNT(*) AS score
+                FROM stocks s
+                JOIN {source} e ON e.code = s.code
+                JOIN json_each(?) w ON w.key = e.evaluator
+                WHERE e.date IN (?, (SELECT date FROM prev))
+                GROUP BY e.code, e.date
+            )
+            SELECT (SELECT date FROM prev) AS prev_date, code,
+                   MAX(CASE WHEN date = ? THEN score END),
+                   MAX(CASE WHEN date <> ? THEN score END)
+            FROM overall
+            GROUP BY code
+            ORDER BY code
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(query, (json.dumps(list(codes)), date, json.dumps(weights), date, date, date))
+        
+        rows = cursor.fetchall()
+        
+        return {
+            'date': date,
+            'prev_date': rows[0][0] if rows else None,
+            'rows': [(row[1], row[2], row[3]) for row in rows]
+        }
+
+    def get_latest_evaluation_date(self, codes: Iterable[str]) -> Optional[str]:
+        """
+        대상 종목의 평가 결과가 저장된 마지막 날짜
+        
+        Args:
+            codes: 종목 코드 목록
+        
+        Returns:
+            날짜 (YYYY-MM-DD) 또는 None (평가 결과 없음)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT MAX(e.date)
+            FROM json_each(?) s JOIN {self._source('evaluations')} e ON e.code = s.value
+        """, (json.dumps(list(codes)),))
+        
+        return cursor.fetchone()[0]
+    
+    @METRICS.timed('db_seconds', op='save_report')
     def save_report(self, market: str, date: str, content: str, format: str):
         """
         리포트 저장
         
+        본문은 SHA-256 해시 기준으로 중복 제거되어 압축 저장되며,
+        같은 (market, date, format)을 덮어쓰면 더 이상 참조되지 않는 본문은 삭제됩니다.
+        
         Args:
             market: 시장 (kr, us 등)
             date: 날짜
             content: 리포트 내용
             format: 형식 (markdown, html)
+        
+        Returns:
+            본문 content hash (SHA-256)
         """
+        raw = content.encode('utf-8')
+        content_hash = hashlib.sha256(raw).hexdigest()
+        
         cursor = self.conn.cursor()
         
+        cursor.execute(
+            "SELECT content_hash FROM reports WHERE market = ? AND date = ? AND format = ?",
+            (market, date, format)
+        )
+        row = cursor.fetchone()
+        previous_hash = row['content_hash'] if row else None
+        
+        cursor.execute("SELECT 1 FROM report_blobs WHERE content_hash = ?", (content_hash,))
+        if not cursor.fetchone():
+            cursor.execute("""
+                INSERT INTO report_blobs (content_hash, codec, raw_size, content)
+                VALUES (?, ?, ?, ?)
+            """, (content_hash, REPORT_CODEC, len(raw), _compress(raw)))
+        
         cursor.execute("""
             INSERT OR REPLACE INTO reports 
-            (market, date, content, format)
+            (market, date, format, content_hash)
+            VALUES (?, ?, ?, ?)
+        """, (market, date, format, content_hash))
+        
+        if previous_hash and previous_hash != content_hash:
+            self._delete_orphan_blob(cursor, previous_hash)
+        
+        self.conn.commit()
+        return content_hash
+    
+    def get_report(self, market: str, date: str, format: str) -> Optional[str]:
+        """
+        저장된 리포트 조회 (압축 자동 해제)
+        
+        Args:
+            market: 시장 (kr, us 등)
+            date: 날짜
+            format: 형식 (markdown, html)
+        
+        Returns:
+            리포트 내용 또는 None
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT b.codec, b.content
+            FROM {self._source('reports')} r
+            JOIN {self._source('report_blobs')} b ON b.content_hash = r.content_hash
+            WHERE r.market = ? AND r.date = ? AND r.format = ?
+        """, (market, date, format))
+        
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        return _decompress(row['content'], row['codec']).decode('utf-8')
+    
+    def get_report_hash(self, market: str, date: str, format: str) -> Optional[str]:
+        """
+        저장된 리포트의 content hash 조회 (본문은 읽지 않음)
+        
+        Args:
+            market: 시장 (kr, us 등)
+            date: 날짜
+            format: 형식 (markdown, html)
+        
+        Returns:
+            content hash 또는 None (리포트 없음)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT content_hash FROM {self._source('reports')}
+            WHERE market = ? AND date = ? AND format = ?
+        """, (market, date, format))
+        
+        row = cursor.fetchone()
+        return row['content_hash'] if row else None
+    
+    @METRICS.timed('db_seconds', op='get_fingerprints')
+    def get_fingerprints(self, scope: str, keys: Iterable[str]) -> Dict[str, Tuple[str, Optional[Dict]]]:
+        """
+        저장된 입력 fingerprint 일괄 조회 (쿼리 1회)
+        
+        Args:
+            scope: 구분 (evaluation, report)
+            keys: 키 목록 (예: '005930|bollinger', 'kr|html')
+        
+        Returns:
+            {키: (fingerprint, payload)} (저장된 키만)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT f.key, f.fingerprint, f.payload
+            FROM json_each(?) k
+            JOIN main.input_fingerprints f ON f.scope = ? AND f.key = k.value
+        """, (json.dumps(list(keys)), scope))
+        
+        return {
+            row['key']: (row['fingerprint'], json.loads(row['payload']) if row['payload'] else None)
+            for row in cursor.fetchall()
+        }
+    
+    @METRICS.timed('db_seconds', op='save_fingerprints')
+    def save_fingerprints(self, scope: str, rows: Iterable[Tuple[str, str, Optional[Dict]]]) -> int:
+        """
+        입력 fingerprint 일괄 저장 (한 트랜잭션, 같은 키는 덮어씀)
+        
+        Args:
+            scope: 구분 (evaluation, report)
+            rows: (key, fingerprint, payload) 반복자
+        
+        Returns:
+            저장 건수
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO main.input_fingerprints (scope, key, fingerprint, payload)
             VALUES (?, ?, ?, ?)
-        """, (market, date, content, format))
+        """, (
+            (scope, key, fingerprint, json.dumps(payload, ensure_ascii=False) if payload is not None else None)
+            for key, fingerprint, payload in rows
+        ))
+        count = cursor.rowcount
+        
+        self.conn.commit()
+        return count
+    
+    @staticmethod
+    def _delete_orphan_blob(cursor: sqlite3.Cursor, content_hash: str):
+        """어떤 리포트도 참조하지 않는 본문 삭제"""
+        cursor.execute("""
+            DELETE FROM report_blobs
+            WHERE content_hash = ?
+              AND NOT EXISTS (SELECT 1 FROM reports WHERE content_hash = ?)
+        """, (content_hash, content_hash))
+    
+    def compact_reports(self) -> Dict:
+        """
+        리포트 저장소 정리
+        
+        - 참조되지 않는 본문 삭제
+        - 비압축(raw) 또는 기본 코덱이 아닌 본문을 기본 코덱(REPORT_CODEC)으로 재압축
+        
+        Returns:
+            {'blobs': 본문 수, 'orphans_removed': 삭제 수, 'recompressed': 재압축 수,
+             'bytes_before': 정리 전 크기, 'bytes_after': 정리 후 크기}
+        """
+        cursor = self.conn.cursor()
+        
+        cursor.execute("SELECT COALESCE(SUM(LENGTH(content)), 0) AS size FROM report_blobs")
+        bytes_before = cursor.fetchone()['size']
+        
+        cursor.execute("""
+            DELETE FROM report_blobs
+            WHERE content_hash NOT IN (SELECT content_hash FROM reports)
+        """)
+        orphans_removed = cursor.rowcount
+        
+        cursor.execute(
+            "SELECT content_hash, codec, content FROM report_blobs WHERE codec != ?",
+            (REPORT_CODEC,)
+        )
+        candidates = cursor.fetchall()
+        
+        recompressed = 0
+        for row in candidates:
+            blob = _compress(_decompress(row['content'], row['codec']))
+            if len(blob) < len(row['content']):
+                cursor.execute(
+                    "UPDATE report_blobs SET codec = ?, content = ? WHERE content_hash = ?",
+                    (REPORT_CODEC, blob, row['content_hash'])
+                )
+                recompressed += 1
+        
+        self.conn.commit()
+        
+        cursor.execute("SELECT COUNT(*) AS blobs, COALESCE(SUM(LENGTH(content)), 0) AS size FROM report_blobs")
+        row = cursor.fetchone()
+        
+        return {
+            'blobs': row['blobs'],
+            'orphans_removed': orphans_removed,
+            'recompressed': recompressed,
+            'bytes_before': bytes_before,
+            'bytes_after': row['size']
+        }
+    
+    def _source(self, table: str) -> str:
+        """조회 대상 테이블명 (아카이브 연결 시 통합 temp 뷰)"""
+        return f"temp.all_{table}" if self._archives else table
+    
+    def attach_archives(self, archive_dir: str) -> List[int]:
+        """
+        연도별 아카이브 DB를 ATTACH하고 라이브+아카이브 통합 뷰 생성
+        
+        이후 get_price_data(), get_evaluations(), get_evaluation_history(),
+        get_score_matrix(), get_report()는 아카이브 데이터까지 함께 조회합니다.
+        
+        Args:
+            archive_dir: 아카이브 DB 디렉토리
+        
+        Returns:
+            연결된 연도 목록
+        """
+        for path in sorted(Path(archive_dir).glob(self.ARCHIVE_PATTERN.format(year='*'))):
+            year = int(path.stem.rsplit('_', 1)[-1])
+            if year in self._archives:
+                continue
+            
+            alias = f"archive_{year}"
+            self.conn.execute("ATTACH DATABASE ? AS " + alias, (str(path),))
+            self._archives[year] = alias
+            self._archive_files[alias] = str(path)
+        
+        self._create_archive_views()
+        self.cache.clear()
+        return sorted(self._archives)
+    
+    def _create_archive_views(self, conn: Optional[sqlite3.Connection] = None):
+        """라이브 + 아카이브 테이블 UNION ALL temp 뷰 (재)생성"""
+        conn = conn or self.conn
+        cursor = conn.cursor()
+        
+        for table in self.ARCHIVED_TABLES:
+            cursor.execute(f"DROP VIEW IF EXISTS temp.all_{table}")
+            if not self._archives:
+                continue
+            
+            columns = ", ".join(
+                row[1] for row in cursor.execute(f"PRAGMA main.table_info({table})").fetchall()
+            )
+            selects = [f"SELECT {columns} FROM main.{table}"]
+            selects += [f"SELECT {columns} FROM {alias}.{table}" for alias in self._archives.values()]
+            cursor.execute(f"CREATE TEMP VIEW all_{table} AS " + " UNION ALL ".join(selects))
+        
+        conn.commit()
+    
+    def open_reader(self) -> sqlite3.Connection:
+        """
+        읽기 전용 연결 생성 (내보내기 등 스레드별 대량 조회용)
+        
+        현재 연결된 아카이브 DB와 통합 뷰도 함께 구성되므로 _source() 테이블명을 그대로 사용할 수 있습니다.
+        연결은 호출한 스레드에서 사용하고, 사용 후 close()해야 합니다.
+        
+        Returns:
+            sqlite3.Connection (row_factory 없음, 튜플 반환)
+        """
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        
+        for alias, path in self._archive_files.items():
+            conn.execute("ATTACH DATABASE ? AS " + alias, (path,))
+        
+        if self._archives:
+            self._create_archive_views(conn)
+        
+        return conn
+    
+    def detach_archives(self):
+        """아카이브 DB 연결 해제"""
+        for table in self.ARCHIVED_TABLES:
+            self.conn.execute(f"DROP VIEW IF EXISTS temp.all_{table}")
+        
+        for alias in self._archives.values():
+            self.conn.execute(f"DETACH DATABASE {alias}")
+        
+        self._archives = {}
+        self._archive_files = {}
+        self.cache.clear()
+    
+    def get_data_years(self) -> List[int]:
+        """
+        라이브 DB에 데이터가 있는 연도 목록
+        
+        Returns:
+            연도 리스트 (오름차순)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT MIN(y) AS first, MAX(y) AS last FROM (
+                SELECT MIN(date) / 10000 AS y FROM stock_prices
+                UNION ALL SELECT MAX(date) / 10000 FROM stock_prices
+                UNION ALL SELECT CAST(SUBSTR(MIN(date), 1, 4) AS INTEGER) FROM evaluations
+                UNION ALL SELECT CAST(SUBSTR(MAX(date), 1, 4) AS INTEGER) FROM evaluations
+                UNION ALL SELECT CAST(SUBSTR(MIN(date), 1, 4) AS INTEGER) FROM reports
+                UNION ALL SELECT CAST(SUBSTR(MAX(date), 1, 4) AS INTEGER) FROM reports
+            )
+        """)
+        row = cursor.fetchone()
+        if row['first'] is None:
+            return []
+        
+        return list(range(row['first'], row['last'] + 1))
+    
+    def archive_year(self, year: int, archive_dir: str) -> Dict:
+        """
+        특정 연도의 주가/평가/리포트를 연도별 아카이브 DB로 이동
+        
+        Args:
+            year: 이동할 연도
+            archive_dir: 아카이브 DB 디렉토리
+        
+        Returns:
+            테이블별 이동 건수 {'stock_prices': n, 'evaluations': n, 'reports': n}
+        """
+        first_day = f"{year}-01-01"
+        last_day = f"{year}-12-31"
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT EXISTS (SELECT 1 FROM main.stock_prices WHERE date BETWEEN ? AND ?)
+                OR EXISTS (SELECT 1 FROM main.evaluations WHERE date BETWEEN ? AND ?)
+                OR EXISTS (SELECT 1 FROM main.reports WHERE date BETWEEN ? AND ?)
+        """, (year * 10000 + 101, year * 10000 + 1231, first_day, last_day, first_day, last_day))
+        if not cursor.fetchone()[0]:
+            return {'stock_prices': 0, 'evaluations': 0, 'reports': 0}
+        
+        archive_path = Path(archive_dir) / self.ARCHIVE_PATTERN.format(year=year)
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 이미 연결된 아카이브면 해제 후 작업 (별칭 충돌 방지)
+        reattach = bool(self._archives)
+        if reattach:
+            self.detach_archives()
+        
+        cursor.execute("ATTACH DATABASE ? AS archive", (str(archive_path),))
+        
+        try:
+            self._create_archive_schema(cursor)
+            
+            cursor.execute("BEGIN")
+            
+            cursor.execute("""
+                INSERT OR REPLACE INTO archive.stock_prices
+                SELECT * FROM main.stock_prices WHERE date BETWEEN ? AND ?
+            """, (year * 10000 + 101, year * 10000 + 1231))
+            cursor.execute(
+                "DELETE FROM main.stock_prices WHERE date BETWEEN ? AND ?",
+                (year * 10000 + 101, year * 10000 + 1231)
+            )
+            prices = cursor.rowcount
+            
+            # 라이브 DB에서 빠진 기간은 수집 완료 기간에서도 제외 (백필이 필요하면 다시 수집)
+            cursor.execute("DELETE FROM main.price_coverage WHERE end_date <= ?", (last_day,))
+            cursor.execute(
+                "UPDATE main.price_coverage SET start_date = ? WHERE start_date <= ?",
+                (f"{year + 1}-01-01", last_day)
+            )
+            
+            cursor.execute("""
+                INSERT OR REPLACE INTO archive.evaluations
+                (code, date, evaluator, score, details, created_at)
+                SELECT code, date, evaluator, score, details, created_at
+                FROM main.evaluations WHERE date BETWEEN ? AND ?
+            """, (first_day, last_day))
+            cursor.execute(
+                "DELETE FROM main.evaluations WHERE date BETWEEN ? AND ?",
+                (first_day, last_day)
+            )
+            evaluations = cursor.rowcount
+            
+            cursor.execute("""
+                INSERT OR IGNORE INTO archive.report_blobs
+                SELECT * FROM main.report_blobs WHERE content_hash IN (
+                    SELECT content_hash FROM main.reports WHERE date BETWEEN ? AND ?
+                )
+            """, (first_day, last_day))
+            cursor.execute("""
+                INSERT OR REPLACE INTO archive.reports
+                (market, date, format, content_hash, created_at)
+                SELECT market, date, format, content_hash, created_at
+                FROM main.reports WHERE date BETWEEN ? AND ?
+            """, (first_day, last_day))
+            cursor.execute(
+                "DELETE FROM main.reports WHERE date BETWEEN ? AND ?",
+                (first_day, last_day)
+            )
+            reports = cursor.rowcount
+            cursor.execute("""
+                DELETE FROM main.report_blobs
+                WHERE content_hash NOT IN (SELECT content_hash FROM main.reports)
+            """)
+            
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            cursor.execute("DETACH DATABASE archive")
+            self.cache.clear()
+            if reattach:
+                self.attach_archives(str(archive_dir))
+        
+        return {'stock_prices': prices, 'evaluations': evaluations, 'reports': reports}
+    
+    @staticmethod
+    def _create_archive_schema(cursor: sqlite3.Cursor):
+        """아카이브 DB(archive 스키마)에 라이브와 같은 구조의 테이블 생성"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS archive.stock_prices (
+                symbol_id INTEGER NOT NULL,
+                date INTEGER NOT NULL,
+                open REAL,
+                high REAL,
+                low REAL,
+                close REAL,
+                volume INTEGER,
+                PRIMARY KEY (symbol_id, date)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS archive.evaluations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                code TEXT NOT NULL,
+                date TEXT NOT NULL,
+                evaluator TEXT NOT NULL,
+                score REAL NOT NULL,
+                details TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(code, date, evaluator)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS archive.idx_eval_evaluator_date
+            ON evaluations(evaluator, date, code, score)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS archive.idx_eval_code_evaluator_date
+            ON evaluations(code, evaluator, date, score)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS archive.report_blobs (
+                content_hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                raw_size INTEGER NOT NULL,
+                content BLOB NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS archive.reports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                market TEXT NOT NULL,
+                date TEXT NOT NULL,
+                format TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(market, date, format)
+            )
+        """)
+    
+    def apply_retention(self, evaluations_days: Optional[int] = None,
+                        reports_days: Optional[int] = None,
+                        today: Optional[str] = None) -> Dict:
+        """
+        보관 기간이 지난 평가 결과/리포트 삭제 (라이브 DB만 대상, 아카이브는 유지)
+        
+        Args:
+            evaluations_days: 평가 결과 보관 일수 (None 또는 0: 무기한)
+            reports_days: 리포트 보관 일수 (None 또는 0: 무기한)
+            today: 기준 날짜 (YYYY-MM-DD, 기본값: 오늘)
+        
+        Returns:
+            삭제 건수 {'evaluations': n, 'reports': n}
+        """
+        base = datetime.strptime(today, '%Y-%m-%d') if today else datetime.now()
+        cursor = self.conn.cursor()
+        deleted = {'evaluations': 0, 'reports': 0}
+        
+        if evaluations_days:
+            cutoff = (base - timedelta(days=evaluations_days)).strftime('%Y-%m-%d')
+            cursor.execute("DELETE FROM main.evaluations WHERE date < ?", (cutoff,))
+            deleted['evaluations'] = cursor.rowcount
+        
+        if reports_days:
+            cutoff = (base - timedelta(days=reports_days)).strftime('%Y-%m-%d')
+            cursor.execute("DELETE FROM main.reports WHERE date < ?", (cutoff,))
+            deleted['reports'] = cursor.rowcount
+            cursor.execute("""
+                DELETE FROM main.report_blobs
+                WHERE content_hash NOT IN (SELECT content_hash FROM main.reports)
+            """)
         
         self.conn.commit()
+        
+        if deleted['evaluations']:
+            self.cache.clear()
+        
+        return deleted
+    
+    def optimize(self, incremental_pages: int = 0) -> Dict:
+        """
+        DB 최적화: 증분 VACUUM, ANALYZE, PRAGMA optimize
+        
+        auto_vacuum이 꺼진 기존 DB는 최초 1회 INCREMENTAL로 전환하며 전체 VACUUM을 수행합니다.
+        
+        Args:
+            incremental_pages: 회수할 최대 free 페이지 수 (0: 전체)
+        
+        Returns:
+            {'size_before': bytes, 'size_after': bytes, 'full_vacuum': bool}
+        """
+        size_before = self.db_path.stat().st_size
+        cursor = self.conn.cursor()
+        
+        full_vacuum = cursor.execute("PRAGMA main.auto_vacuum").fetchone()[0] != 2
+        if full_vacuum:
+            print("🔧 auto_vacuum=INCREMENTAL 전환 (최초 1회 전체 VACUUM)")
+            cursor.execute("PRAGMA main.auto_vacuum = INCREMENTAL")
+            cursor.execute("VACUUM main")
+        else:
+            cursor.execute(f"PRAGMA main.incremental_vacuum({int(incremental_pages)})").fetchall()
+        
+        cursor.execute("ANALYZE main")
+        cursor.execute("PRAGMA optimize")
+        self.conn.commit()
+        
+        return {
+            'size_before': size_before,
+            'size_after': self.db_path.stat().st_size,
+            'full_vacuum': full_vacuum
+        }
+    
+    def cache_stats(self) -> Dict:
+        """
+        조회 캐시 통계
+        
+        Returns:
+            {'entries', 'bytes', 'hits', 'misses', 'evictions', 'expirations', 'invalidations', 'hit_rate'}
+        """
+        return self.cache.stats()
     
     def close(self):
         """데이터베이스 연결 종료"""
+        self.prices.close()
+        if self.ohlcv is not None:
+            self.ohlcv.close()
         if self.conn:
             self.conn.close()
     
@@ -4,12 +4,40 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Sequence
+
+# 종합 평가 구간별 emoji (evaluators.yml overall_scoring 키, 높은 구간부터)
+OVERALL_EMOJIS = {
+    'fire_fire': '🚀',
+    'fire': '☀️',
+    'thumbs_up': '🌤️',
+    'ok_hand': '☁️',
+    'thinking': '🌧️',
+    'thumbs_down': '⛈️',
+    'bomb': '🚨',
+}
+
+# 구간 하한 점수 기본값 (overall_scoring 미설정 시)
+DEFAULT_OVERALL_SCORING = {
+    'fire_fire': 3.5,
+    'fire': 3.25,
+    'thumbs_up': 2.75,
+    'ok_hand': 2.5,
+    'thinking': 2.0,
+    'thumbs_down': 1.5,
+    'bomb': 1.0,
+}
 
 
 class BaseEvaluator(ABC):
     """평가 도구 추상 베이스 클래스"""
     
+    # 평가 시점마다 사용하는 최근 일봉 수 (일일 분석의 DB 조회 limit과 같음)
+    HISTORY_WINDOW = 60
+    
+    # 계산 방식 버전 (점수/상세 정보가 달라지는 수정 시 올림, 저장된 평가를 재사용하지 않게 됨)
+    VERSION = 1
+    
     def __init__(self, config: Dict = None):
         """
         Args:
@@ -18,6 +46,18 @@ class BaseEvaluator(ABC):
         self.config = config or {}
         self.name = self.__class__.__name__.replace('Evaluator', '').lower()
     
+    def signature(self) -> Dict:
+        """
+        평가 입력 fingerprint용 도구 정보 (이름, 버전, 가중치를 제외한 설정)
+        
+        가중치는 종합 점수에만 쓰이므로 바뀌어도 평가를 다시 하지 않습니다.
+        
+        Returns:
+            {'name': ..., 'version': ..., 'config': {...}}
+        """
+        config = {key: value for key, value in self.config.items() if key != 'weight'}
+        return {'name': self.name, 'version': self.VERSION, 'config': config}
+    
     @abstractmethod
     def evaluate(self, data: List[Dict]) -> Tuple[float, str, str]:
         """
@@ -26,6 +66,7 @@ class BaseEvaluator(ABC):
         Args:
             data: 주가 데이터 리스트 (최신순)
                   [{'date': '2026-02-10', 'open': 100, 'high': 110, 'low': 95, 'close': 105, 'volume': 1000}, ...]
+                  또는 PriceSeries (memmap OHLCV 캐시 뷰)
         
         Returns:
             (score, emoji, comment)
@@ -48,6 +89,48 @@ class BaseEvaluator(ABC):
         """
         pass
     
+    def evaluate_history(self, history: Dict[str, Sequence], start: int = 0) -> List[Tuple[float, str, str, Dict]]:
+        """
+        시점별 평가 (기간 백필용)
+        
+        history의 i번째 일봉 시점 평가는 그 날까지의 최근 HISTORY_WINDOW개 일봉만 사용하므로
+        (point-in-time) 그 날 evaluate() / get_details()를 실행한 결과와 같습니다. 기본 구현은
+        시점마다 evaluate()를 호출하며, 평가 도구별로 전체 기간을 한 번에 계산하도록 재정의합니다.
+        
+        Args:
+            history: 한 종목의 컬럼 형식 일봉 {'date', 'open', 'high', 'low', 'close', 'volume'} (오래된 순)
+            start: 평가를 시작할 인덱스 (이전 일봉은 지표 계산에만 사용)
+        
+        Returns:
+            history[start:] 각 시점의 (score, emoji, comment, details) 리스트
+        """
+        fields = [field for field in ('date', 'open', 'high', 'low', 'close', 'volume') if field in history]
+        rows = [dict(zip(fields, values)) for values in zip(*(history[field] for field in fields))]
+        
+        results = []
+        for i in range(start, len(rows)):
+            window = rows[max(0, i + 1 - self.HISTORY_WINDOW):i + 1][::-1]
+            score, emoji, comment = self.evaluate(window)
+            results.append((score, emoji, comment, self.get_details(window)))
+        
+        return results
+    
+    @staticmethod
+    def get_column(data, field: str) -> Sequence[float]:
+        """
+        주가 데이터에서 컬럼 추출 (최신순)
+        
+        Args:
+            data: 주가 데이터 리스트 또는 PriceSeries
+            field: 컬럼명 (open, high, low, close, volume)
+        
+        Returns:
+            값 시퀀스 (PriceSeries는 복사 없는 NumPy 뷰)
+        """
+        if hasattr(data, 'column'):
+            return data.column(field)
+        return [d[field] for d in data]
+    
     def get_weight(self) -> float:
         """
         종합 평가 시 가중치 반환
@@ -62,27 +145,47 @@ class BaseEvaluator(ABC):
         return self.name
     
     @staticmethod
-    def get_overall_emoji(avg_score: float) -> str:
+    def overall_thresholds(scoring: Dict = None) -> List[Tuple[float, str]]:
+        """
+        종합 평가 구간 목록
+        
+        Args:
+            scoring: evaluators.yml overall_scoring (없는 키는 기본값)
+        
+        Returns:
+            [(하한 점수, 구간 키), ...] 높은 구간부터
+        """
+        merged = {**DEFAULT_OVERALL_SCORING, **(scoring or {})}
+        return sorted(((float(merged[key]), key) for key in OVERALL_EMOJIS), reverse=True)
+    
+    @staticmethod
+    def get_overall_bucket(avg_score: float, scoring: Dict = None) -> str:
+        """
+        평균 점수가 속한 종합 평가 구간 키 (가장 낮은 구간 하한보다 낮으면 가장 낮은 구간)
+        
+        Args:
+            avg_score: 평균 점수
+            scoring: evaluators.yml overall_scoring
+        
+        Returns:
+            구간 키 (fire_fire, fire, ..., bomb)
+        """
+        thresholds = BaseEvaluator.overall_thresholds(scoring)
+        for threshold, key in thresholds:
+            if avg_score >= threshold:
+                return key
+        return thresholds[-1][1]
+    
+    @staticmethod
+    def get_overall_emoji(avg_score: float, scoring: Dict = None) -> str:
         """
         평균 점수에 따른 종합 평가 emoji 반환
         
         Args:
             avg_score: 평균 점수
+            scoring: evaluators.yml overall_scoring (없으면 기본 구간)
         
         Returns:
             종합 평가 emoji
         """
-        if avg_score >= 3.5:
-            return '🚀'
-        elif avg_score >= 3.25:
-            return '☀️'
-        elif avg_score >= 2.75:
-            return '🌤️'
-        elif avg_score >= 2.5:
-            return '☁️'
-        elif avg_score >= 2.0:
-            return '🌧️'
-        elif avg_score >= 1.5:
-            return '⛈️'
-        else:
-            return '🚨'
+        return OVERALL_EMOJIS[BaseEvaluator.get_overall_bucket(avg_score, scoring)]
@@ -3,13 +3,15 @@
 """
 
 import statistics
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Sequence
 from .base import BaseEvaluator
 
 
 class BollingerEvaluator(BaseEvaluator):
     """볼린저 밴드 평가 도구"""
     
+    VERSION = 1
+    
     def __init__(self, config: Dict = None):
         super().__init__(config)
         self.period = self.config.get('period', 20)
@@ -63,14 +65,25 @@ class BollingerEvaluator(BaseEvaluator):
         if not data or len(data) < self.period:
             return 2.0, '🟡', '데이터 부족'
         
-        closes = [d['close'] for d in data]
+        closes = self.get_column(data, 'close')
         bb = self.calculate_bollinger(closes)
         
         if not bb:
             return 2.0, '🟡', '계산 실패'
         
-        pos = bb['position']
+        return self.score_position(bb['position'])
+    
+    @staticmethod
+    def score_position(pos: float) -> Tuple[float, str, str]:
+        """
+        밴드 내 위치(%)에 따른 점수
+        
+        Args:
+            pos: 밴드 내 위치 (0~100%, 밴드 밖이면 범위를 벗어남)
         
+        Returns:
+            (score, emoji, comment)
+        """
         if pos <= 25:
             score = 4.0
             emoji = '🟢'
@@ -95,7 +108,7 @@ class BollingerEvaluator(BaseEvaluator):
         if not data or len(data) < self.period:
             return {'error': '데이터 부족'}
         
-        closes = [d['close'] for d in data]
+        closes = self.get_column(data, 'close')
         bb = self.calculate_bollinger(closes)
         
         if not bb:
@@ -114,6 +127,60 @@ class BollingerEvaluator(BaseEvaluator):
             'comment': comment
         }
 
+    
+    def evaluate_history(self, history: Dict[str, Sequence], start: int = 0) -> List[Tuple[float, str, str, Dict]]:
+        """
+        시점별 볼린저 밴드 평가 (NumPy 이동 평균/표준편차로 전체 기간 한 번에 계산)
+        
+        Args:
+            history: 한 종목의 컬럼 형식 일봉 (오래된 순)
+            start: 평가를 시작할 인덱스
+        
+        Returns:
+            history[start:] 각 시점의 (score, emoji, comment, details) 리스트
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return super().evaluate_history(history, start)
+        
+        closes = np.asarray(history['close'], dtype=float)
+        period = self.period
+        
+        if len(closes) >= period and period >= 2:
+            # windows[j] = closes[j:j + period] -> j + period - 1 시점의 최근 period일
+            windows = np.lib.stride_tricks.sliding_window_view(closes, period)
+            sma = windows.mean(axis=1)
+            std = windows.std(axis=1, ddof=1)
+            upper = sma + std * self.std_multiplier
+            lower = sma - std * self.std_multiplier
+            width = upper - lower
+            with np.errstate(divide='ignore', invalid='ignore'):
+                position = np.where(width != 0, (closes[period - 1:] - lower) / width * 100, 50.0)
+        
+        results = []
+        for i in range(start, len(closes)):
+            # evaluate()와 같은 조건: 그 날까지의 최근 HISTORY_WINDOW개 일봉이 period 이상
+            if min(i + 1, self.HISTORY_WINDOW) < period or period < 2:
+                results.append((2.0, '🟡', '데이터 부족', {'error': '데이터 부족'}))
+                continue
+            
+            j = i - period + 1
+            pos = float(position[j])
+            score, emoji, comment = self.score_position(pos)
+            results.append((score, emoji, comment, {
+                'sma': float(sma[j]),
+                'upper': float(upper[j]),
+                'lower': float(lower[j]),
+                'current': float(closes[i]),
+                'position': pos,
+                'score': score,
+                'emoji': emoji,
+                'comment': comment
+            }))
+        
+        return results
+
 
 if __name__ == "__main__":
     # 테스트
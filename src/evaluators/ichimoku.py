@@ -2,13 +2,15 @@
 일목균형표 평가 도구
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Sequence
 from .base import BaseEvaluator
 
 
 class IchimokuEvaluator(BaseEvaluator):
     """일목균형표 평가 도구"""
     
+    VERSION = 1
+    
     def __init__(self, config: Dict = None):
         super().__init__(config)
         self.conversion_period = self.config.get('conversion_period', 9)
@@ -80,21 +82,27 @@ class IchimokuEvaluator(BaseEvaluator):
         if not data or len(data) < self.base_period:
             return 2.0, '🟡', '데이터 부족'
         
-        highs = [d['high'] for d in data]
-        lows = [d['low'] for d in data]
-        closes = [d['close'] for d in data]
+        highs = self.get_column(data, 'high')
+        lows = self.get_column(data, 'low')
+        closes = self.get_column(data, 'close')
         
         ich = self.calculate_ichimoku(highs, lows, closes)
         
         if not ich:
             return 2.0, '🟡', '계산 실패'
         
-        conv = ich['conversion']
-        base = ich['baseline']
-        curr = ich['current']
-        cloud_top = ich['cloud_top']
-        cloud_bottom = ich['cloud_bottom']
+        return self.score_signals(ich['conversion'], ich['baseline'], ich['current'],
+                                  ich['cloud_top'], ich['cloud_bottom'])
+    
+    @staticmethod
+    def score_signals(conv: float, base: float, curr: float,
+                      cloud_top: float, cloud_bottom: float) -> Tuple[float, str, str]:
+        """
+        전환선/기준선/구름대 위치에 따른 점수
         
+        Returns:
+            (score, emoji, comment)
+        """
         # 전환선 > 기준선 (골든크로스)
         conv_above = conv > base
         # 현재가 > 구름대 상단
@@ -126,9 +134,9 @@ class IchimokuEvaluator(BaseEvaluator):
         if not data or len(data) < self.base_period:
             return {'error': '데이터 부족'}
         
-        highs = [d['high'] for d in data]
-        lows = [d['low'] for d in data]
-        closes = [d['close'] for d in data]
+        highs = self.get_column(data, 'high')
+        lows = self.get_column(data, 'low')
+        closes = self.get_column(data, 'close')
         
         ich = self.calculate_ichimoku(highs, lows, closes)
         
@@ -150,6 +158,73 @@ class IchimokuEvaluator(BaseEvaluator):
             'comment': comment
         }
 
+    
+    def evaluate_history(self, history: Dict[str, Sequence], start: int = 0) -> List[Tuple[float, str, str, Dict]]:
+        """
+        시점별 일목균형표 평가 (NumPy 이동 최고/최저로 전체 기간 한 번에 계산)
+        
+        Args:
+            history: 한 종목의 컬럼 형식 일봉 (오래된 순)
+            start: 평가를 시작할 인덱스
+        
+        Returns:
+            history[start:] 각 시점의 (score, emoji, comment, details) 리스트
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return super().evaluate_history(history, start)
+        
+        highs = np.asarray(history['high'], dtype=float)
+        lows = np.asarray(history['low'], dtype=float)
+        closes = np.asarray(history['close'], dtype=float)
+        n = len(closes)
+        
+        def midpoint(period: int):
+            """i 시점의 최근 period일 (최고 + 최저) / 2, 일봉이 부족한 앞부분은 NaN"""
+            values = np.full(n, np.nan)
+            if 0 < period <= n:
+                view = np.lib.stride_tricks.sliding_window_view
+                values[period - 1:] = (view(highs, period).max(axis=1) + view(lows, period).min(axis=1)) / 2
+            return values
+        
+        conversion = midpoint(self.conversion_period)
+        baseline = midpoint(self.base_period)
+        span_b_full = midpoint(self.span_b_period)
+        span_a = (conversion + baseline) / 2
+        
+        results = []
+        for i in range(start, n):
+            # evaluate()와 같은 조건: 그 날까지의 최근 HISTORY_WINDOW개 일봉 기준
+            available = min(i + 1, self.HISTORY_WINDOW)
+            if available < self.base_period or available < self.conversion_period:
+                results.append((2.0, '🟡', '데이터 부족', {'error': '데이터 부족'}))
+                continue
+            
+            a = float(span_a[i])
+            b = float(span_b_full[i]) if available >= self.span_b_period else a  # 부족 시 span_a로 대체
+            cloud_top = max(a, b)
+            cloud_bottom = min(a, b)
+            conv = float(conversion[i])
+            base = float(baseline[i])
+            current = float(closes[i])
+            
+            score, emoji, comment = self.score_signals(conv, base, current, cloud_top, cloud_bottom)
+            results.append((score, emoji, comment, {
+                'conversion': conv,
+                'baseline': base,
+                'span_a': a,
+                'span_b': b,
+                'cloud_top': cloud_top,
+                'cloud_bottom': cloud_bottom,
+                'current': current,
+                'score': score,
+                'emoji': emoji,
+                'comment': comment
+            }))
+        
+        return results
+
 
 if __name__ == "__main__":
     # 테스트
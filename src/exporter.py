@@ -0,0 +1,314 @@
+"""
+데이터 내보내기 모듈
+주가, 평가 결과, 종합 점수를 Arrow IPC / Parquet / CSV 파일로 스트리밍 저장
+"""
+
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Iterator
+
+from database import StockDatabase
+from storage import SQLitePriceStore
+from storage.base import decode_date
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# 내보내기 대상 및 컬럼 (date는 Arrow/Parquet에서 date32, CSV에서 YYYY-MM-DD)
+EXPORT_COLUMNS = {
+    'prices': [('code', 'string'), ('market', 'string'), ('date', 'date'),
+               ('open', 'float'), ('high', 'float'), ('low', 'float'), ('close', 'float'),
+               ('volume', 'int')],
+    'evaluations': [('code', 'string'), ('market', 'string'), ('date', 'date'),
+                    ('evaluator', 'string'), ('score', 'float'), ('details', 'string')],
+    'overall': [('code', 'string'), ('market', 'string'), ('date', 'date'),
+                ('overall_score', 'float'), ('evaluators', 'int')],
+}
+
+EXPORT_FORMATS = {'arrow': 'arrow', 'parquet': 'parquet', 'csv': 'csv'}
+
+
+def _arrow_schema(table: str) -> "pa.Schema":
+    types = {'string': pa.string(), 'date': pa.date32(), 'float': pa.float64(), 'int': pa.int64()}
+    return pa.schema([(name, types[kind]) for name, kind in EXPORT_COLUMNS[table]])
+
+
+class _ChunkWriter:
+    """청크 단위 파일 기록기 (포맷별)"""
+
+    def __init__(self, path: Path, table: str, format: str):
+        self.path = path
+        self.table = table
+        self.format = format
+        self.rows = 0
+
+        if format == 'csv' and not HAS_PYARROW:
+            self._file = open(path, 'w', encoding='utf-8', newline='')
+            self._csv = csv.writer(self._file)
+            self._csv.writerow([name for name, _ in EXPORT_COLUMNS[table]])
+            return
+
+        self.schema = _arrow_schema(table)
+        if format == 'arrow':
+            self._writer = pa_ipc.new_file(str(path), self.schema)
+        elif format == 'parquet':
+            self._writer = pq.ParquetWriter(str(path), self.schema, compression='zstd')
+        else:
+            self._writer = pa_csv.CSVWriter(str(path), self.schema)
+
+    def write(self, columns: Dict[str, list]):
+        """
+        컬럼 묶음 기록
+
+        Args:
+            columns: {컬럼명: 값 리스트} (date는 YYYYMMDD 정수 또는 YYYY-MM-DD 문자열)
+        """
+        count = len(columns['date'])
+        if not count:
+            return
+
+        if self.format == 'csv' and not HAS_PYARROW:
+            dates = columns['date']
+            if isinstance(dates[0], int):
+                dates = [decode_date(value) for value in dates]
+            names = [name for name, _ in EXPORT_COLUMNS[self.table]]
+            self._csv.writerows(zip(*(dates if name == 'date' else columns[name] for name in names)))
+        else:
+            arrays = []
+            for field in self.schema:
+                if field.name == 'date':
+                    arrays.append(self._to_date32(columns['date']))
+                else:
+                    arrays.append(pa.array(columns[field.name], type=field.type))
+            self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+        self.rows += count
+
+    @staticmethod
+    def _to_date32(values: list) -> "pa.Array":
+        if isinstance(values[0], int):
+            strings = pc.cast(pa.array(values, type=pa.int64()), pa.string())
+            timestamps = pc.strptime(strings, format='%Y%m%d', unit='s')
+        else:
+            timestamps = pc.strptime(pa.array(values, type=pa.string()), format='%Y-%m-%d', unit='s')
+        return pc.cast(timestamps, pa.date32())
+
+    def close(self):
+        if self.format == 'csv' and not HAS_PYARROW:
+            self._file.close()
+        else:
+            self._writer.close()
+
+
+def _export_market_worker(db_path: str, archive_dirs: List[str], price_store, weights: Dict[str, float],
+                          chunk_size: int, *args) -> Dict[str, Dict]:
+    """프로세스별 내보내기 (DB 연결을 새로 열어 DataExporter.export_market 실행)"""
+    db = StockDatabase(db_path, cache_entries=0, price_store=price_store)
+    for archive_dir in archive_dirs:
+        db.attach_archives(archive_dir)
+
+    try:
+        return DataExporter(db, weights=weights, chunk_size=chunk_size).export_market(*args)
+    finally:
+        db.close()
+
+
+class DataExporter:
+    """StockDatabase 데이터 내보내기"""
+
+    def __init__(self, db: StockDatabase, weights: Dict[str, float], chunk_size: int = 50_000):
+        """
+        Args:
+            db: 대상 데이터베이스
+            weights: 평가 도구별 가중치 (필수, 종합 점수는 여기 있는 평가 도구만 포함,
+                     main.py는 활성화된 평가 도구의 evaluators.yml 가중치를 전달)
+            chunk_size: 한 번에 읽고 쓰는 행 수
+        """
+        self.db = db
+        self.weights = dict(weights)
+        self.chunk_size = chunk_size
+
+    def _fetch_chunks(self, conn, query: str, params: list, names: List[str]) -> Iterator[Dict[str, list]]:
+        cursor = conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(self.chunk_size)
+            if not rows:
+                break
+            yield {name: list(column) for name, column in zip(names, zip(*rows))}
+
+    @staticmethod
+    def _date_conditions(start_date: Optional[str], end_date: Optional[str]):
+        conditions, params = "", []
+        if start_date:
+            conditions += " AND e.date >= ?"
+            params.append(start_date)
+        if end_date:
+            conditions += " AND e.date <= ?"
+            params.append(end_date)
+        return conditions, params
+
+    def iter_prices(self, stocks: Dict[str, str], start_date: Optional[str] = None,
+                    end_date: Optional[str] = None) -> Iterator[Dict[str, list]]:
+        """
+        주가 청크 조회
+
+        Args:
+            stocks: {종목 코드: 시장}
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+        """
+        return self.db.prices.iter_batches(start_date, end_date, codes=list(stocks),
+                                           batch_size=self.chunk_size)
+
+    def iter_evaluations(self, conn, stocks: Dict[str, str], start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> Iterator[Dict[str, list]]:
+        """평가 결과 청크 조회 (code, date, evaluator 순)"""
+        conditions, params = self._date_conditions(start_date, end_date)
+        query = f"""
+            SELECT e.code, m.value, e.date, e.evaluator, e.score, e.details
+            FROM json_each(?) m
+            JOIN {self.db._source('evaluations')} e ON e.code = m.key
+            WHERE 1 = 1 {conditions}
+            ORDER BY e.code, e.date, e.evaluator
+        """
+        names = [name for name, _ in EXPORT_COLUMNS['evaluations']]
+        return self._fetch_chunks(conn, query, [json.dumps(stocks)] + params, names)
+
+    def iter_overall(self, conn, stocks: Dict[str, str], start_date: Optional[str] = None,
+                     end_date: Optional[str] = None) -> Iterator[Dict[str, list]]:
+        """
+        종합 점수 청크 조회 (SQL에서 가중 평균 계산, main.py 종합 평가와 같은 식)
+
+        overall_score = SUM(score * weight) / 평가 도구 수 (weights에 있는 평가 도구만,
+        StockDatabase.get_overall_changes()와 같이 비활성화된 평가 도구의 저장된 결과는 제외)
+        """
+        conditions, params = self._date_conditions(start_date, end_date)
+        query = f"""
+            SELECT e.code, m.value, e.date,
+                   SUM(e.score * w.value) / COUNT(*),
+                   COUNT(*)
+            FROM json_each(?) m
+            JOIN {self.db._source('evaluations')} e ON e.code = m.key
+            JOIN json_each(?) w ON w.key = e.evaluator
+            WHERE 1 = 1 {conditions}
+            GROUP BY e.code, e.date
+            ORDER BY e.code, e.date
+        """
+        names = [name for name, _ in EXPORT_COLUMNS['overall']]
+        return self._fetch_chunks(conn, query, [json.dumps(stocks), json.dumps(self.weights)] + params, names)
+
+    def export_market(self, market: str, stocks: Dict[str, str], tables: List[str],
+                      output_dir: Path, format: str, start_date: Optional[str] = None,
+                      end_date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        한 시장의 테이블들을 파일로 내보내기 ({table}_{market}.{ext})
+
+        Args:
+            market: 시장 구분 (kr, us, 파일명에 사용)
+            stocks: {종목 코드: 시장}
+            tables: 내보낼 대상 (prices, evaluations, overall)
+            output_dir: 출력 디렉토리
+            format: arrow / parquet / csv
+
+        Returns:
+            {table: {'path': 파일 경로, 'rows': 행 수}}
+        """
+        results = {}
+        conn = self.db.open_reader()
+
+        try:
+            for table in tables:
+                path = output_dir / f"{table}_{market}.{EXPORT_FORMATS[format]}"
+
+                if table == 'prices':
+                    chunks = self.iter_prices(stocks, start_date, end_date)
+                elif table == 'evaluations':
+                    chunks = self.iter_evaluations(conn, stocks, start_date, end_date)
+                else:
+                    chunks = self.iter_overall(conn, stocks, start_date, end_date)
+
+                writer = _ChunkWriter(path, table, format)
+                try:
+                    for columns in chunks:
+                        writer.write(columns)
+                finally:
+                    writer.close()
+
+                results[table] = {'path': str(path), 'rows': writer.rows}
+        finally:
+            conn.close()
+
+        return results
+
+    def export(self, markets: Dict[str, Dict[str, str]], tables: List[str], output_dir: str,
+               format: str = 'parquet', start_date: Optional[str] = None,
+               end_date: Optional[str] = None, workers: int = 1) -> Dict[str, Dict]:
+        """
+        시장별 내보내기 (workers > 1이면 시장별 프로세스에서 병렬 기록)
+
+        Args:
+            markets: {시장 구분: {종목 코드: 시장}} (예: {'kr': {'005930': 'KRX'}})
+            tables: 내보낼 대상 (prices, evaluations, overall)
+            output_dir: 출력 디렉토리
+            format: arrow / parquet / csv
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            workers: 동시에 기록할 시장 수 (2 이상이면 시장별 프로세스)
+
+        Returns:
+            {시장 구분: {table: {'path', 'rows'}}}
+        """
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {format}")
+        if 'overall' in tables and not self.weights:
+            raise ValueError("종합 점수(overall) 내보내기에는 평가 도구 가중치가 필요합니다 (활성화된 평가 도구 없음)")
+        if format != 'csv' and not HAS_PYARROW:
+            raise RuntimeError(f"{format} 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 버퍼링된 주가 쓰기를 반영한 뒤 읽기 시작
+        self.db.prices.flush()
+
+        start = time.perf_counter()
+        print(f"📤 내보내기 시작: {', '.join(tables)} ({format}, {start_date or '처음'} ~ {end_date or '끝'})")
+
+        if workers > 1 and len(markets) > 1:
+            # 행 변환/인코딩이 GIL에 묶이므로 시장별로 별도 프로세스에서 기록
+            price_store = None if isinstance(self.db.prices, SQLitePriceStore) else self.db.prices
+            archive_dirs = sorted({str(Path(path).parent) for path in self.db._archive_files.values()})
+
+            with ProcessPoolExecutor(max_workers=min(workers, len(markets))) as executor:
+                futures = {
+                    market: executor.submit(
+                        _export_market_worker, str(self.db.db_path), archive_dirs, price_store,
+                        self.weights, self.chunk_size,
+                        market, markets[market], tables, output_dir, format, start_date, end_date
+                    )
+                    for market in markets
+                }
+                results = {market: future.result() for market, future in futures.items()}
+        else:
+            results = {
+                market: self.export_market(market, markets[market], tables, output_dir,
+                                           format, start_date, end_date)
+                for market in markets
+            }
+
+        for market, tables_result in results.items():
+            for table, result in tables_result.items():
+                print(f"   {market.upper()} {table}: {result['rows']:,}행 -> {result['path']}")
+
+        print(f"✅ 내보내기 완료 ({time.perf_counter() - start:.1f}s)")
+        return results
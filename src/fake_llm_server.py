@@ -0,0 +1,194 @@
+"""
+로컬 가짜 LLM(Messages API) 서버
+API 키/네트워크 없이 LLM 해설 동시 생성, 재시도/백오프, 대체 코멘트를 시험하기 위한 스텁 서버
+
+엔드포인트:
+    POST /v1/messages -> Anthropic Messages API 형식 응답 (프롬프트의 "종목:" 줄을 그대로 포함,
+                         배치 프롬프트에는 {종목 코드: 해설} JSON으로 응답)
+    GET  /stats       -> 요청/응답 통계 (동시 처리 최대치 포함)
+    GET  /health      -> {"status": "ok"}
+
+사용법:
+    python fake_llm_server.py --port 8766 --latency 1.5 --jitter 0.5 --rate-limit 5 --error-rate 0.05
+    python fake_llm_server.py --drop-rate 0.1   # 배치 응답에서 종목 10% 누락
+    # config/report.yml: use_llm: true, llm_base_url: "http://127.0.0.1:8766", api_key: "stub"
+"""
+
+import argparse
+import json
+import re
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, Optional
+
+from fake_market_server import FakeMarketServer
+
+
+class FakeLLMServer(FakeMarketServer):
+    """
+    가짜 Messages API 서버
+
+    요청마다 latency ± jitter 만큼 지연한 뒤, rate limit을 넘으면 429(retry-after),
+    error_rate 확률로 529(overloaded)를 돌려줍니다. 응답 텍스트는 프롬프트의 종목 줄을
+    담고 있어 호출 순서/대응 관계를 확인할 수 있습니다. 배치 프롬프트(JSON 응답 요청)에는
+    종목마다 drop_rate 확률로 항목을 빼고 JSON 객체로 응답합니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8766, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, rate_limit: float = 0.0,
+                 burst: Optional[int] = None, seed: int = 42, quiet: bool = True,
+                 drop_rate: float = 0.0):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0: 빈 포트 자동 선택)
+            latency: 평균 응답 지연 (초)
+            jitter: 지연 편차 (초)
+            error_rate: 529 응답 확률 (0~1)
+            rate_limit: 초당 허용 요청 수 (0: 제한 없음)
+            burst: rate limit 버킷 크기
+            seed: 오류 발생 시드
+            quiet: 요청 로그 출력 안 함
+            drop_rate: 배치 응답에서 종목 항목을 빼는 확률 (0~1)
+        """
+        super().__init__(host, port, latency=latency, jitter=jitter, error_rate=error_rate,
+                         rate_limit=rate_limit, burst=burst, seed=seed, quiet=quiet)
+        self.RequestHandlerClass = FakeLLMHandler
+        self.drop_rate = drop_rate
+        self.stats = {'requests': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'not_found': 0,
+                      'in_flight': 0, 'max_in_flight': 0, 'batches': 0, 'dropped': 0}
+
+    def enter(self):
+        with self._lock:
+            self.stats['in_flight'] += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.stats['in_flight'])
+
+    def leave(self):
+        with self._lock:
+            self.stats['in_flight'] -= 1
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """FakeLLMServer 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_error_json(self, status: int, error_type: str, message: str, headers: Optional[Dict] = None):
+        self.send_json(status, {'type': 'error', 'error': {'type': error_type, 'message': message}}, headers)
+
+    def do_GET(self):
+        if self.path == '/health':
+            return self.send_json(200, {'status': 'ok'})
+        if self.path == '/stats':
+            return self.send_json(200, dict(self.server.stats))
+        self.server.count('not_found')
+        self.send_error_json(404, 'not_found_error', 'not found')
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if self.path.split('?')[0] != '/v1/messages':
+            server.count('not_found')
+            return self.send_error_json(404, 'not_found_error', 'not found')
+
+        server.count('requests')
+        server.enter()
+        try:
+            if server.latency or server.jitter:
+                time.sleep(max(0.0, server.latency + (server.roll() * 2 - 1) * server.jitter))
+
+            if server.bucket:
+                wait = server.bucket.acquire()
+                if wait:
+                    server.count('throttled')
+                    return self.send_error_json(429, 'rate_limit_error', 'rate limit exceeded',
+                                                {'retry-after': f"{wait:.3f}"})
+
+            if server.error_rate and server.roll() < server.error_rate:
+                server.count('errors')
+                return self.send_error_json(529, 'overloaded_error', 'injected overload')
+
+            request = json.loads(body or b'{}')
+            prompt = ''.join(
+                message['content'] if isinstance(message['content'], str)
+                else ''.join(block.get('text', '') for block in message['content'])
+                for message in request.get('messages', [])
+            )
+            subjects = [line.strip() for line in prompt.splitlines() if line.strip().startswith('종목:')]
+
+            if 'JSON' in prompt:
+                server.count('batches')
+                comments = {}
+                for subject in subjects:
+                    match = re.search(r'\((\w+)\)$', subject)
+                    if server.drop_rate and server.roll() < server.drop_rate:
+                        server.count('dropped')
+                        continue
+                    comments[match.group(1) if match else subject] = f"[stub] {subject}"
+                text = json.dumps(comments, ensure_ascii=False)
+            else:
+                text = f"[stub] {subjects[0] if subjects else prompt[:40]}"
+
+            server.count('ok')
+            self.send_json(200, {
+                'id': f"msg_{uuid.uuid4().hex[:24]}",
+                'type': 'message',
+                'role': 'assistant',
+                'model': request.get('model', 'stub'),
+                'content': [{'type': 'text', 'text': text}],
+                'stop_reason': 'end_turn',
+                'stop_sequence': None,
+                'usage': {'input_tokens': len(prompt) // 2, 'output_tokens': len(text) // 2},
+            })
+        finally:
+            server.leave()
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가짜 LLM(Messages API) 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8766, help='포트')
+    parser.add_argument('--latency', type=float, default=1.0, help='평균 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.5, help='지연 편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='529 응답 확률 (0~1)')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='초당 허용 요청 수 (0: 제한 없음)')
+    parser.add_argument('--burst', type=int, help='rate limit 버킷 크기 (기본값: rate-limit)')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='배치 응답 종목 누락 확률 (0~1)')
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+
+    server = FakeLLMServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, rate_limit=args.rate_limit,
+                           burst=args.burst, quiet=not args.verbose, drop_rate=args.drop_rate)
+
+    print(f"🧪 가짜 LLM 서버: {server.url} (report.yml llm_base_url)")
+    print(f"   지연 {args.latency * 1000:.0f}±{args.jitter * 1000:.0f}ms, 오류율 {args.error_rate:.0%}, "
+          f"rate limit {args.rate_limit or '없음'}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
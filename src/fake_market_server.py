@@ -0,0 +1,219 @@
+"""
+로컬 가짜 주가 API 서버
+네트워크 없이 수집기 부하/백오프 테스트를 하기 위한 HTTP 서버 (지연, 오류율, rate limit 설정)
+
+엔드포인트:
+    GET /prices/{market}/{code}?start=YYYY-MM-DD&end=YYYY-MM-DD
+        -> {"code", "market", "data": [최신 순 일봉]} (HTTPCollector 형식)
+    GET /stats   -> 요청/응답 통계
+    GET /health  -> {"status": "ok"}
+
+사용법:
+    python fake_market_server.py --port 8765 --latency 0.05 --jitter 0.02 \\
+        --error-rate 0.05 --rate-limit 20
+    python fake_market_server.py --cassette-dir ../data/cassettes   # 기록된 응답 재생
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from collectors.synthetic_collector import SyntheticCollector
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개 요청을 허용하는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 한 번에 허용할 최대 요청 수 (기본값: rate, 최소 1)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, float(burst if burst is not None else rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 사용
+
+        Returns:
+            0이면 허용, 아니면 다음 토큰까지 남은 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class FakeMarketServer(ThreadingHTTPServer):
+    """
+    가짜 주가 API 서버
+
+    데이터는 SyntheticCollector로 생성하거나, cassette_dir가 있으면 ReplayCollector
+    카세트에서 읽습니다. 요청마다 latency ± jitter 만큼 지연한 뒤, rate limit을 넘으면
+    429(Retry-After), error_rate 확률로 500을 돌려줍니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, rate_limit: float = 0.0,
+                 burst: Optional[int] = None, cassette_dir: Optional[str] = None,
+                 seed: int = 42, quiet: bool = True):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0: 빈 포트 자동 선택, server_address로 확인)
+            latency: 평균 응답 지연 (초)
+            jitter: 지연 편차 (초, latency ± jitter 균등 분포)
+            error_rate: 500 응답 확률 (0~1)
+            rate_limit: 초당 허용 요청 수 (0: 제한 없음)
+            burst: rate limit 버킷 크기
+            cassette_dir: 카세트 디렉토리 (없으면 합성 데이터)
+            seed: 합성 데이터/오류 발생 시드
+            quiet: 요청 로그 출력 안 함
+        """
+        super().__init__((host, port), FakeMarketHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.quiet = quiet
+        self.random = random.Random(seed)
+
+        if cassette_dir:
+            from collectors.replay_collector import ReplayCollector
+            self.source = ReplayCollector(cassette_dir, mode='replay')
+        else:
+            self.source = SyntheticCollector(seed=seed)
+
+        self.stats = {'requests': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'not_found': 0}
+        self._lock = threading.Lock()
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def roll(self) -> float:
+        with self._lock:
+            return self.random.random()
+
+    def start(self) -> threading.Thread:
+        """백그라운드 스레드에서 실행 (벤치마크/테스트용, shutdown()으로 종료)"""
+        thread = threading.Thread(target=self.serve_forever, name='fake-market-server', daemon=True)
+        thread.start()
+        return thread
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class FakeMarketHandler(BaseHTTPRequestHandler):
+    """FakeMarketServer 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        parts = [urllib.parse.unquote(part) for part in url.path.strip('/').split('/')]
+
+        if parts == ['health']:
+            return self.send_json(200, {'status': 'ok'})
+        if parts == ['stats']:
+            return self.send_json(200, dict(server.stats))
+        if len(parts) != 3 or parts[0] != 'prices':
+            server.count('not_found')
+            return self.send_json(404, {'error': 'not found'})
+
+        server.count('requests')
+
+        if server.latency or server.jitter:
+            time.sleep(max(0.0, server.latency + (server.roll() * 2 - 1) * server.jitter))
+
+        if server.bucket:
+            wait = server.bucket.acquire()
+            if wait:
+                server.count('throttled')
+                # Retry-After는 초 단위 (소수 허용, HTTPCollector가 float로 해석)
+                return self.send_json(429, {'error': 'rate limit exceeded'},
+                                      {'Retry-After': f"{wait:.3f}"})
+
+        if server.error_rate and server.roll() < server.error_rate:
+            server.count('errors')
+            return self.send_json(500, {'error': 'injected failure'})
+
+        _, market, code = parts
+        query = urllib.parse.parse_qs(url.query)
+        start = query.get('start', [None])[0]
+        end = query.get('end', [None])[0]
+
+        data = server.source.collect(code, market, start, end)
+        server.count('ok')
+        self.send_json(200, {'code': code, 'market': market, 'data': data})
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가짜 주가 API 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--latency', type=float, default=0.0, help='평균 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 확률 (0~1)')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='초당 허용 요청 수 (0: 제한 없음)')
+    parser.add_argument('--burst', type=int, help='rate limit 버킷 크기 (기본값: rate-limit)')
+    parser.add_argument('--cassette-dir', help='카세트 디렉토리 (지정 시 기록된 응답 재생)')
+    parser.add_argument('--seed', type=int, default=42, help='합성 데이터/오류 시드')
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+
+    server = FakeMarketServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                              error_rate=args.error_rate, rate_limit=args.rate_limit,
+                              burst=args.burst, cassette_dir=args.cassette_dir,
+                              seed=args.seed, quiet=not args.verbose)
+
+    source = f"카세트 {args.cassette_dir}" if args.cassette_dir else "합성 데이터"
+    print(f"🧪 가짜 주가 API 서버: {server.url} ({source})")
+    print(f"   지연 {args.latency * 1000:.0f}±{args.jitter * 1000:.0f}ms, 오류율 {args.error_rate:.0%}, "
+          f"rate limit {args.rate_limit or '없음'}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,17 @@
 
 import sys
 import json
+import hashlib
+import shutil
+import tempfile
 try:
     import yaml
     HAS_YAML = True
 except ImportError:
     HAS_YAML = False
 import argparse
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
@@ -19,51 +24,93 @@ from typing import Dict, List
 sys.path.insert(0, str(Path(__file__).parent))
 
 from database import StockDatabase
-try:
-    from collectors import FDRCollector
-    HAS_FDR = True
-except ImportError:
-    HAS_FDR = False
-from collectors.json_collector import JSONCollector
+from metrics import METRICS
+from storage.base import decode_date
 from evaluators import BollingerEvaluator, IchimokuEvaluator, BaseEvaluator
-from reporters import MarkdownReporter, HTMLReporter
+# 수집기(FinanceDataReader, pandas), 리포터, Parquet 저장소(pyarrow)는 사용 시점에 import
+
+# 데이터베이스 파일 경로 (src 기준)
+DB_PATH = "../data/stock_data.db"
+
+# 백필 시작일 이전에 추가로 읽는 기간 (달력 기준, 최근 60 거래일 + 휴장일 여유)
+BACKFILL_WARMUP_DAYS = 120
+
+# 백필 평가 결과를 한 번에 저장하는 건수
+BACKFILL_BATCH_SIZE = 50_000
+
+# 입력 fingerprint에 포함하는 일봉 필드
+FINGERPRINT_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def input_fingerprint(*parts) -> str:
+    """
+    입력 fingerprint (JSON 직렬화 후 SHA-256)
+    
+    Args:
+        parts: JSON 직렬화 가능한 값
+    
+    Returns:
+        16진 해시 문자열
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+# report.yml format -> 리포터 클래스 (reporters 패키지)
+REPORTERS = {
+    'markdown': 'MarkdownReporter',
+    'html': 'HTMLReporter',
+}
 
 
 class StockAnalyzer:
     """주식 분석 메인 클래스"""
     
-    def __init__(self, config_dir: str = "../config"):
+    def __init__(self, config_dir: str = "../config", metrics_dir: str = None,
+                 db_path: str = DB_PATH, use_archives: bool = True):
         """
         Args:
             config_dir: 설정 파일 디렉토리
+            metrics_dir: 실행 지표(JSON, Prometheus textfile) 출력 디렉토리 (None: 계측 안 함)
+            db_path: 데이터베이스 파일 경로
+            use_archives: 연도별 아카이브 DB 연결 여부 (maintenance.yml archive.dir, 합성 실행은 False)
         """
         self.config_dir = Path(config_dir)
-        self.load_configs()
+        self.metrics_dir = metrics_dir
+        if metrics_dir:
+            METRICS.enabled = True
         
-        # 데이터베이스
-        self.db = StockDatabase("../data/stock_data.db")
+        # 단계 종료 콜백 (stage, market), 프로파일러가 설정
+        self.stage_hook = None
+        self.load_configs()
         
-        # 데이터 수집기
+        # 데이터베이스 (maintenance --archive로 옮긴 연도도 라이브+아카이브 통합 뷰로 조회)
         data_config = self.stocks_config.get('data_config', {})
-        if HAS_FDR:
-            self.collector = FDRCollector(
-                days=data_config.get('days', 60),
-                delay=0.5
-            )
-            print("📥 FinanceDataReader 사용")
-        else:
-            self.collector = JSONCollector()
-            print("📦 JSON 파일에서 데이터 로드")
+        cache_config = data_config.get('read_cache', {})
+        archive_dir = None
+        if use_archives:
+            from maintenance import archive_dir_from_config
+            archive_dir = archive_dir_from_config(self.maintenance_config, db_path)
+        self.db = StockDatabase(
+            db_path,
+            archive_dir=str(archive_dir) if archive_dir and archive_dir.is_dir() else None,
+            cache_entries=cache_config.get('max_entries', 1024),
+            cache_max_bytes=int(cache_config.get('max_mb', 32) * 1024 * 1024),
+            cache_ttl=cache_config.get('ttl'),
+            price_store=self.init_price_store(data_config),
+            ohlcv_dir=data_config.get('ohlcv_dir', '../data/ohlcv') if data_config.get('ohlcv_cache') else None
+        )
+        
+        # 데이터 수집기 (캐시에 없는 데이터를 처음 수집할 때 생성)
+        self._collector = None
         
         # 평가 도구
         self.evaluators = self.init_evaluators()
         
-        # 리포터
-        report_format = self.report_config.get('format', 'markdown')
-        if report_format == 'html':
-            self.reporter = HTMLReporter(self.report_config)
-        else:
-            self.reporter = MarkdownReporter(self.report_config)
+        # 리포터 (형식별)
+        self.reporters = self.init_reporters()
+        
+        # 스파크라인 생성기 (report.yml include.chart_data, 첫 사용 시 생성)
+        self._sparklines = None
     
     def load_configs(self):
         """설정 파일 로드"""
@@ -79,6 +126,13 @@ class StockAnalyzer:
             # report.yml
             with open(self.config_dir / "report.yml", 'r', encoding='utf-8') as f:
                 self.report_config = yaml.safe_load(f)
+            
+            # maintenance.yml (선택, 아카이브 경로)
+            self.maintenance_config = {}
+            maintenance_path = self.config_dir / "maintenance.yml"
+            if maintenance_path.exists():
+                with open(maintenance_path, 'r', encoding='utf-8') as f:
+                    self.maintenance_config = yaml.safe_load(f) or {}
         else:
             # 기본 설정
             self.stocks_config = {
@@ -97,6 +151,181 @@ class StockAnalyzer:
                 'format': 'markdown',
                 'output_dir': '../reports'
             }
+            self.maintenance_config = {}
+    
+    @property
+    def collector(self):
+        """데이터 수집기 (첫 사용 시 생성)"""
+        if self._collector is None:
+            self._collector = self.init_collector()
+        return self._collector
+    
+    def init_collector(self):
+        """데이터 수집기 초기화 (data_config.collector, 카세트 설정 시 기록/재생으로 감쌈)"""
+        data_config = self.stocks_config.get('data_config', {})
+        cassette = data_config.get('cassette', {})
+        
+        if cassette.get('mode') == 'replay':
+            # 재생 전용: 실제 수집기를 만들지 않음 (네트워크/FinanceDataReader 불필요)
+            source = None
+        else:
+            source = self.init_source_collector(data_config)
+        
+        if cassette.get('mode'):
+            from collectors import ReplayCollector
+            cassette_dir = cassette.get('dir', '../data/cassettes')
+            print(f"📼 카세트 {cassette['mode']} 모드 ({cassette_dir})")
+            return ReplayCollector(cassette_dir, mode=cassette['mode'], source=source,
+                                   days=data_config.get('days', 60))
+        
+        return source
+    
+    def init_source_collector(self, data_config: Dict):
+        """실제 수집기 초기화 (fdr: FinanceDataReader 없으면 JSON 파일, http: HTTP API)"""
+        if data_config.get('collector', 'fdr') == 'http':
+            from collectors import HTTPCollector
+            http_config = data_config.get('http', {})
+            print(f"🌐 HTTP API 사용 ({http_config.get('base_url', 'http://127.0.0.1:8765')})")
+            return HTTPCollector(
+                base_url=http_config.get('base_url', 'http://127.0.0.1:8765'),
+                days=data_config.get('days', 60),
+                timeout=http_config.get('timeout', 10),
+                max_retries=http_config.get('max_retries', 5),
+                backoff=http_config.get('backoff', 0.5),
+                max_backoff=http_config.get('max_backoff', 30),
+                delay=http_config.get('delay', 0.0)
+            )
+        
+        try:
+            from collectors import FDRCollector
+        except ImportError:
+            from collectors import JSONCollector
+            print("📦 JSON 파일에서 데이터 로드")
+            return JSONCollector()
+        
+        print("📥 FinanceDataReader 사용")
+        return FDRCollector(
+            days=data_config.get('days', 60),
+            delay=0.5
+        )
+    
+    def use_synthetic_data(self, work_dir: str, symbols: int = 0):
+        """
+        합성 데이터로 실행 (네트워크 없음, 프로파일링/벤치마크용)
+        
+        리포트는 work_dir/reports, 차트 캐시는 work_dir/chart_cache.db에 저장되므로 실제 리포트/캐시를 덮어쓰지 않습니다.
+        DB는 생성 시 db_path로 별도 파일을 지정해야 합니다.
+        
+        Args:
+            work_dir: 합성 실행 결과 디렉토리
+            symbols: 시장별 합성 종목 수 (0: stocks.yml 종목 사용)
+        """
+        from collectors import SyntheticCollector
+        
+        data_config = self.stocks_config.get('data_config', {})
+        self._collector = SyntheticCollector(days=data_config.get('days', 60))
+        
+        if symbols:
+            for market in ('kr', 'us'):
+                self.stocks_config[f"{market}_stocks"] = SyntheticCollector.make_universe(market, symbols)
+        
+        self.report_config['output_dir'] = str(Path(work_dir) / "reports")
+        self.reporters = self.init_reporters()
+        
+        # 차트 캐시도 work_dir에 (실제 캐시와 섞이지 않게)
+        charts = dict(self.report_config.get('charts') or {})
+        charts['cache_path'] = str(Path(work_dir) / "chart_cache.db")
+        self.report_config['charts'] = charts
+        if self._sparklines:
+            self._sparklines.close()
+        self._sparklines = None
+        print(f"🧪 합성 데이터 사용 ({'시장별 ' + str(symbols) + '종목' if symbols else 'stocks.yml 종목'}, {work_dir})")
+    
+    def reload_configs(self):
+        """설정 파일 다시 읽기 (DB 연결, 수집기, 캐시는 유지)"""
+        self.load_configs()
+        self.evaluators = self.init_evaluators()
+        self.reporters = self.init_reporters()
+        if self._sparklines:
+            self._sparklines.close()
+        self._sparklines = None
+    
+    def report_formats(self) -> List[str]:
+        """
+        리포트 형식 목록 (report.yml format: 'html' 또는 ['markdown', 'html'])
+        
+        Returns:
+            형식 리스트 (설정 순서, 중복 제거)
+        """
+        formats = self.report_config.get('format', 'markdown')
+        if isinstance(formats, str):
+            formats = [formats]
+        formats = list(dict.fromkeys(formats))
+        
+        unknown = [fmt for fmt in formats if fmt not in REPORTERS]
+        if unknown or not formats:
+            raise ValueError(f"알 수 없는 리포트 형식: {unknown or formats} ({', '.join(REPORTERS)})")
+        return formats
+    
+    def init_reporters(self) -> Dict:
+        """
+        형식별 리포터 초기화 (요약 구간은 evaluators.yml overall_scoring)
+        
+        여러 형식을 만들 때도 LLM 생성기(API 클라이언트, 해설 캐시)는 하나를 공유합니다.
+        
+        Returns:
+            {형식: 리포터}
+        """
+        config = {**self.report_config, 'overall_scoring': self.evaluators_config.get('overall_scoring')}
+        
+        llm_generator = None
+        if config.get('use_llm', False):
+            from reporters.llm_generator import ClaudeCommentGenerator
+            llm_generator = ClaudeCommentGenerator.from_config(config)
+        
+        import reporters
+        return {fmt: getattr(reporters, REPORTERS[fmt])(config, llm_generator=llm_generator)
+                for fmt in self.report_formats()}
+    
+    @property
+    def sparklines(self):
+        """
+        스파크라인 생성기 (첫 사용 시 생성)
+        
+        Returns:
+            SparklineRenderer 또는 None (include.chart_data가 꺼져 있거나 numpy가 없는 경우)
+        """
+        if self._sparklines is None:
+            self._sparklines = False
+            if self.report_config.get('include', {}).get('chart_data', False):
+                try:
+                    from reporters.sparkline import SparklineRenderer
+                    self._sparklines = SparklineRenderer.from_config(self.report_config, self.evaluators_config)
+                except ImportError:
+                    print("⚠️  numpy가 설치되지 않아 차트를 생성하지 않습니다.")
+        return self._sparklines or None
+    
+    def init_price_store(self, data_config: Dict):
+        """
+        주가 저장소 선택 (data_config.price_backend)
+        
+        Returns:
+            ParquetPriceStore 또는 None (None: StockDatabase 기본 SQLite 저장소)
+        """
+        backend = data_config.get('price_backend', 'sqlite')
+        
+        if backend == 'parquet':
+            try:
+                from storage import ParquetPriceStore
+            except ImportError:
+                print("⚠️  pyarrow가 설치되지 않아 SQLite 주가 저장소를 사용합니다.")
+            else:
+                print("🗂️  Parquet 주가 저장소 사용")
+                return ParquetPriceStore(data_config.get('parquet_dir', '../data/prices'))
+        elif backend != 'sqlite':
+            print(f"⚠️  알 수 없는 price_backend: {backend} (SQLite 사용)")
+        
+        return None
     
     def init_evaluators(self) -> List[BaseEvaluator]:
         """평가 도구 초기화"""
@@ -114,32 +343,38 @@ class StockAnalyzer:
         
         return evaluators
     
-    def collect_and_cache_data(self, stock: Dict, force_update: bool = False) -> List[Dict]:
+    def collect_and_cache_data(self, stock: Dict, force_update: bool = False,
+                               date: str = None) -> List[Dict]:
         """
         데이터 수집 및 캐싱
         
         Args:
             stock: 종목 정보
             force_update: 강제 업데이트 여부
+            date: 분석 날짜 (이 날짜까지의 데이터만 사용, 기본값: 오늘)
         
         Returns:
-            주가 데이터 리스트
+            주가 데이터 리스트 (date 이전 최근 60일, 최신 순)
         """
         code = stock['code']
         market = stock.get('market', 'KRX')
+        target = date or datetime.now().strftime('%Y-%m-%d')
         
         # 캐시 확인
         if not force_update:
             latest_date = self.db.get_latest_date(code)
             if latest_date:
-                # 최신 데이터가 오늘이면 DB에서 로드
-                today = datetime.now().strftime('%Y-%m-%d')
-                if latest_date >= today:
+                # 분석 날짜까지 데이터가 있으면 DB에서 로드
+                if latest_date >= target:
                     print(f"📦 [{code}] 캐시에서 로드")
-                    return self.db.get_price_data(code, limit=60)
+                    METRICS.incr('price_loads', source='cache')
+                    if self.db.ohlcv is not None:
+                        return self.db.get_price_series(code, market, end_date=date, limit=60)
+                    return self.db.get_price_data(code, end_date=date, limit=60)
         
         # 데이터 수집
-        data = self.collector.collect(code, market)
+        data = self.collector.collect(code, market, end_date=target)
+        METRICS.incr('price_loads', source='collector')
         
         if data:
             # DB 저장
@@ -147,7 +382,8 @@ class StockAnalyzer:
         
         return data
     
-    def evaluate_stock(self, stock: Dict, data: List[Dict], date: str) -> Dict:
+    def evaluate_stock(self, stock: Dict, data: List[Dict], date: str,
+                       reuse: Dict[str, Dict] = None) -> Dict:
         """
         종목 평가
         
@@ -155,21 +391,26 @@ class StockAnalyzer:
             stock: 종목 정보
             data: 주가 데이터
             date: 평가 날짜
+            reuse: 입력이 같아 다시 계산하지 않을 평가 결과 {평가 도구: {'score', 'emoji', 'comment', 'details'}}
         
         Returns:
             평가 결과 딕셔너리
         """
         code = stock['code']
-        name = stock['name']
+        reuse = reuse or {}
         
         # 각 평가 도구로 평가
         evaluations = {}
-        scores = []
         
         for evaluator in self.evaluators:
             eval_name = evaluator.get_name()
-            score, emoji, comment = evaluator.evaluate(data)
-            details = evaluator.get_details(data)
+            if eval_name in reuse:
+                evaluations[eval_name] = reuse[eval_name]
+                continue
+            
+            with METRICS.timer('evaluator_seconds', evaluator=eval_name, symbol=code):
+                score, emoji, comment = evaluator.evaluate(data)
+                details = evaluator.get_details(data)
             
             evaluations[eval_name] = {
                 'score': score,
@@ -178,35 +419,52 @@ class StockAnalyzer:
                 'details': details
             }
             
-            scores.append(score * evaluator.get_weight())
-            
             # DB 저장
             self.db.save_evaluation(code, date, eval_name, score, details)
         
+        # 현재가 및 전일 종가
+        current_price = data[0]['close'] if data else 0
+        prev_price = data[1]['close'] if len(data) >= 2 else None
+        
+        return self.build_result(stock, evaluations, current_price, prev_price)
+    
+    def build_result(self, stock: Dict, evaluations: Dict, current_price: float,
+                     prev_price: float = None) -> Dict:
+        """
+        종목 평가 결과 구성 (종합 점수, 전일 대비 등락)
+        
+        Args:
+            stock: 종목 정보
+            evaluations: 평가 도구별 결과 {이름: {'score', 'emoji', 'comment', 'details'}}
+            current_price: 평가 시점 종가
+            prev_price: 전일 종가 (없으면 등락 0)
+        
+        Returns:
+            평가 결과 딕셔너리 (리포터 입력 형식)
+        """
         # 종합 평가
+        scores = [evaluations[evaluator.get_name()]['score'] * evaluator.get_weight()
+                  for evaluator in self.evaluators if evaluator.get_name() in evaluations]
+        
         if scores:
             overall_score = sum(scores) / len(scores)
         else:
             overall_score = 2.0
         
-        overall_emoji = BaseEvaluator.get_overall_emoji(overall_score)
-        
-        # 현재가 및 등락률
-        current_price = data[0]['close'] if data else 0
+        overall_emoji = BaseEvaluator.get_overall_emoji(overall_score, self.evaluators_config.get('overall_scoring'))
         
         # 전일 대비 등락 계산
         price_change = 0
         price_change_rate = 0.0
         
-        if len(data) >= 2:
-            prev_price = data[1]['close']
+        if prev_price is not None:
             price_change = current_price - prev_price
             if prev_price > 0:
                 price_change_rate = (price_change / prev_price) * 100
         
         return {
-            'code': code,
-            'name': name,
+            'code': stock['code'],
+            'name': stock['name'],
             'current_price': current_price,
             'price_change': price_change,
             'price_change_rate': price_change_rate,
@@ -215,7 +473,40 @@ class StockAnalyzer:
             'overall_emoji': overall_emoji
         }
     
-    def analyze_market(self, market: str, date: str = None, force_update: bool = False) -> List[Dict]:
+    def symbol_signature(self, data: List[Dict]) -> List:
+        """
+        종목 입력 fingerprint용 일봉 요약 (최신 일봉, 가장 오래된 일봉 날짜, 일봉 수)
+        
+        Args:
+            data: 주가 데이터 (최신 순)
+        
+        Returns:
+            [최신 날짜, 시가, 고가, 저가, 종가, 거래량, 첫 날짜, 일봉 수]
+        """
+        latest = data[0]
+        values = [None if latest.get(field) is None else float(latest[field]) for field in FINGERPRINT_FIELDS]
+        return [str(latest['date']), *values, str(data[len(data) - 1]['date']), len(data)]
+    
+    def evaluation_inputs(self, stock: Dict, data: List[Dict]) -> Dict[str, tuple]:
+        """
+        평가 도구별 입력 fingerprint (일봉 요약 + 평가 도구 이름/버전/설정)
+        
+        Args:
+            stock: 종목 정보
+            data: 주가 데이터
+        
+        Returns:
+            {평가 도구: ('종목코드|평가 도구', fingerprint)}
+        """
+        signature = self.symbol_signature(data)
+        return {
+            evaluator.get_name(): (f"{stock['code']}|{evaluator.get_name()}",
+                                   input_fingerprint(signature, evaluator.signature()))
+            for evaluator in self.evaluators
+        }
+    
+    def analyze_market(self, market: str, date: str = None, force_update: bool = False,
+                       skip_unchanged: bool = False) -> List[Dict]:
         """
         시장 전체 분석
         
@@ -223,9 +514,10 @@ class StockAnalyzer:
             market: 시장 (kr, us)
             date: 분석 날짜 (기본값: 오늘)
             force_update: 강제 업데이트 여부
+            skip_unchanged: 입력 fingerprint가 저장된 것과 같은 (종목, 평가 도구)는 평가를 건너뛰고 저장된 결과 사용
         
         Returns:
-            분석 결과 리스트
+            분석 결과 리스트 (종목별 입력 fingerprint 'fingerprint' 포함)
         """
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
@@ -242,79 +534,559 @@ class StockAnalyzer:
         print(f"📊 {market.upper()} 시장 분석 시작 ({date})")
         print(f"{'='*60}\n")
         
-        results = []
+        # 1단계: 전체 종목 데이터 수집 (네트워크/DB)
+        collected = []
         
         for stock in stocks:
-            print(f"\n🔍 [{stock['code']}] {stock['name']} 분석 중...")
+            print(f"\n🔍 [{stock['code']}] {stock['name']} 데이터 준비 중...")
             
-            # 데이터 수집
-            data = self.collect_and_cache_data(stock, force_update)
+            with METRICS.timer('stage_seconds', stage='collect', market=market, symbol=stock['code']):
+                data = self.collect_and_cache_data(stock, force_update, date)
             
             if not data:
                 print(f"⚠️  [{stock['code']}] 데이터 없음, 건너뜀")
+                METRICS.incr('symbols', market=market, status='no_data')
                 continue
             
-            # 평가
-            result = self.evaluate_stock(stock, data, date)
+            collected.append((stock, data))
+        
+        self.stage_done('collect', market)
+        
+        # 2단계: 전체 종목 평가 (CPU)
+        # 입력 fingerprint(일봉 요약, 평가 도구 버전/설정)는 항상 저장하고, skip_unchanged면 같은 입력의 평가를 재사용
+        inputs = {stock['code']: self.evaluation_inputs(stock, data) for stock, data in collected}
+        stored = {}
+        if skip_unchanged:
+            stored = self.db.get_fingerprints(
+                'evaluation', [key for keys in inputs.values() for key, _ in keys.values()])
+        
+        results = []
+        fingerprints = []  # (key, fingerprint, payload) 새로 평가했거나 날짜가 바뀐 결과
+        carried = []       # 다른 날짜에 계산된 같은 입력의 평가를 이 날짜로 저장
+        skipped_symbols = skipped_evaluations = 0
+        
+        for stock, data in collected:
+            code = stock['code']
+            reuse = {}
+            for eval_name, (key, fingerprint) in inputs[code].items():
+                saved = stored.get(key)
+                if saved and saved[0] == fingerprint and saved[1]:
+                    reuse[eval_name] = saved[1]
+            
+            with METRICS.timer('stage_seconds', stage='evaluate', market=market, symbol=code):
+                result = self.evaluate_stock(
+                    stock, data, date,
+                    {name: {field: payload[field] for field in ('score', 'emoji', 'comment', 'details')}
+                     for name, payload in reuse.items()})
+            result['fingerprint'] = input_fingerprint(
+                code, stock['name'], [fingerprint for _, fingerprint in inputs[code].values()])
             results.append(result)
+            METRICS.incr('symbols', market=market, status='ok')
             
-            print(f"✅ [{stock['code']}] 평가 완료: {result['overall_emoji']}")
+            for eval_name, (key, fingerprint) in inputs[code].items():
+                saved_date = reuse[eval_name]['date'] if eval_name in reuse else None
+                if saved_date == date:
+                    continue
+                evaluation = result['evaluations'][eval_name]
+                fingerprints.append((key, fingerprint, {'date': date, **evaluation}))
+                if saved_date:
+                    carried.append((code, date, eval_name, evaluation['score'], evaluation['details']))
+            
+            skipped_evaluations += len(reuse)
+            if reuse and len(reuse) == len(inputs[code]):
+                skipped_symbols += 1
+                METRICS.incr('unchanged', market=market, kind='symbol')
+                print(f"⏭️  [{code}] 입력 변경 없음, 저장된 평가 사용: {result['overall_emoji']}")
+            else:
+                print(f"✅ [{code}] 평가 완료: {result['overall_emoji']}")
+        
+        if carried:
+            self.db.save_evaluations(carried)
+        if fingerprints:
+            self.db.save_fingerprints('evaluation', fingerprints)
+        
+        if skip_unchanged:
+            METRICS.incr('unchanged', skipped_evaluations, market=market, kind='evaluation')
+            total = sum(len(keys) for keys in inputs.values())
+            print(f"\n⏭️  입력 변경 없음: 종목 {skipped_symbols}/{len(results)}, "
+                  f"평가 {skipped_evaluations}/{total} 건너뜀")
+        
+        self.stage_done('evaluate', market)
         
         return results
     
-    def generate_report(self, market: str, date: str, results: List[Dict]) -> str:
+    def stage_done(self, stage: str, market: str):
+        """
+        단계 종료 알림 (stage_hook이 설정된 경우 호출, 예: --profile mem 스냅샷)
+        
+        Args:
+            stage: collect, evaluate, render
+            market: 시장 (kr, us)
+        """
+        if self.stage_hook is not None:
+            self.stage_hook(stage, market)
+    
+    def report_fingerprint(self, market: str, date: str, results: List[Dict], changes=None) -> str:
+        """
+        리포트 입력 fingerprint (리포트/평가 설정, 종목별 입력 fingerprint, 전일 대비 변화)
+        
+        report.yml format은 제외하므로 형식을 추가해도 기존 형식의 fingerprint는 그대로입니다.
+        
+        Args:
+            market: 시장
+            date: 날짜
+            results: 분석 결과 (analyze_market()의 'fingerprint' 포함)
+            changes: 전 거래일 대비 변화
+        
+        Returns:
+            fingerprint
+        """
+        report_config = {key: value for key, value in self.report_config.items() if key != 'format'}
+        return input_fingerprint(
+            market, date, report_config, self.evaluators_config,
+            [[result['code'], result.get('fingerprint')] for result in results],
+            changes.signature() if changes is not None else None
+        )
+    
+    def generate_report(self, market: str, date: str, results: List[Dict],
+                        skip_unchanged: bool = False) -> Dict[str, str]:
         """
-        리포트 생성
+        리포트 생성 (설정된 모든 형식, 같은 분석 결과와 LLM 해설로 렌더링)
         
         Args:
             market: 시장
             date: 날짜
             results: 분석 결과
+            skip_unchanged: 입력 fingerprint가 같고 파일과 DB 리포트가 남아 있는 형식은 렌더링/저장 생략
         
         Returns:
-            리포트 파일 경로
+            형식별 리포트 파일 경로 {'markdown': '...', 'html': '...'} (건너뛴 형식 포함)
+        """
+        # 전일 대비 변화 (저장된 평가 결과로 조회, report.yml include.changes, 리포트 입력 fingerprint에 포함)
+        changes = None
+        if self.report_config.get('include', {}).get('changes', True):
+            with METRICS.timer('stage_seconds', stage='changes', market=market):
+                changes = self.daily_changes(market, date)
+        
+        fingerprint = self.report_fingerprint(market, date, results, changes)
+        keys = {report_format: f"{market}|{report_format}" for report_format in self.reporters}
+        
+        # 입력이 같은 형식은 기존 파일 사용 (파일이 없거나 DB 리포트가 바뀌었으면 다시 생성)
+        skipped = {}
+        if skip_unchanged:
+            stored = self.db.get_fingerprints('report', keys.values())
+            for report_format, reporter in self.reporters.items():
+                saved = stored.get(keys[report_format])
+                filepath = reporter.report_path(market, date)
+                if (saved and saved[0] == fingerprint and filepath.exists()
+                        and self.db.get_report_hash(market, date, report_format) == saved[1]['content_hash']):
+                    skipped[report_format] = str(filepath)
+                    METRICS.incr('unchanged', market=market, kind='report', format=report_format)
+            
+            if skipped:
+                print(f"⏭️  리포트 입력 변경 없음, 건너뜀: {', '.join(skipped)}")
+        
+        pending = [report_format for report_format in self.reporters if report_format not in skipped]
+        if not pending:
+            return skipped
+        
+        # LLM 해설은 렌더링 전에 한 번만 생성 (모든 형식이 results의 llm_analysis를 재사용)
+        self.reporters[pending[0]].fill_llm_analysis(results)
+        
+        # 종목별 스파크라인 (report.yml include.chart_data)
+        if self.sparklines is not None:
+            with METRICS.timer('stage_seconds', stage='charts', market=market):
+                self.attach_charts(date, results)
+        
+        def render(report_format: str) -> str:
+            # 리포트 생성 및 파일 저장 (HTML은 템플릿 출력을 파일로 바로 기록)
+            with METRICS.timer('stage_seconds', stage='render', market=market, format=report_format):
+                return self.reporters[report_format].write(market, date, results, changes)
+        
+        # 형식이 여러 개면 병렬 렌더링 (파일 기록이 겹침, 하나면 프로파일링이 보이도록 현재 스레드에서)
+        if len(pending) == 1:
+            filepaths = {report_format: render(report_format) for report_format in pending}
+        else:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                futures = {report_format: pool.submit(render, report_format) for report_format in pending}
+                filepaths = {report_format: future.result() for report_format, future in futures.items()}
+        
+        self.stage_done('render', market)
+        
+        # DB 저장 (형식별 행, DB 연결은 현재 스레드에서만 사용)
+        fingerprints = []
+        for report_format, filepath in filepaths.items():
+            with METRICS.timer('stage_seconds', stage='save', market=market, format=report_format):
+                content = Path(filepath).read_text(encoding='utf-8')
+                content_hash = self.db.save_report(market, date, content, report_format)
+            fingerprints.append((keys[report_format], fingerprint, {'date': date, 'content_hash': content_hash}))
+        
+        # 종목별 입력 fingerprint가 없는 결과(기간 백필)는 기록하지 않음 (일일 분석의 기록을 덮어쓰지 않도록)
+        if all('fingerprint' in result for result in results):
+            self.db.save_fingerprints('report', fingerprints)
+        
+        filepaths.update(skipped)
+        return {report_format: filepaths[report_format] for report_format in self.reporters}
+    
+    def attach_charts(self, date: str, results: List[Dict]):
         """
-        # 리포트 생성
-        content = self.reporter.generate(market, date, results)
+        종목별 스파크라인 SVG를 results의 'sparkline'에 추가
+        
+        전체 종목 주가를 한 번에 스캔하고, 마지막 일봉과 차트 설정이 같은 종목은 캐시된 SVG를 사용합니다.
         
-        # 파일 저장
-        filepath = self.reporter.save(market, date, content)
+        Args:
+            date: 기준 날짜 (이 날짜까지의 일봉)
+            results: 분석 결과
+        """
+        renderer = self.sparklines
+        rendered, cached = renderer.rendered, renderer.cached
         
-        # DB 저장
-        report_format = self.report_config.get('format', 'markdown')
-        self.db.save_report(market, date, content, report_format)
+        columns = self.db.scan_prices(renderer.scan_start(date), date, codes=[result['code'] for result in results])
+        charts = renderer.render_columns(columns)
+        for result in results:
+            if result['code'] in charts:
+                result['sparkline'] = charts[result['code']]
         
-        return filepath
+        print(f"📈 차트 {len(charts)}개 (새로 생성 {renderer.rendered - rendered}, 캐시 {renderer.cached - cached})")
     
-    def run(self, market: str = 'kr', date: str = None, force_update: bool = False):
+    def daily_changes(self, market: str, date: str):
+        """
+        전 거래일 대비 변화 (저장된 evaluations만 조회, 과거 평가를 다시 계산하지 않음)
+        
+        Args:
+            market: 시장
+            date: 기준 날짜
+        
+        Returns:
+            DailyChanges
+        """
+        from reporters.changes import DailyChanges
+        
+        weights = {evaluator.get_name(): evaluator.get_weight() for evaluator in self.evaluators}
+        return DailyChanges.from_db(
+            self.db,
+            self.stocks_config.get(f"{market}_stocks", []),
+            date,
+            weights,
+            scoring=self.evaluators_config.get('overall_scoring'),
+            top_n=self.report_config.get('changes_top_n', 10)
+        )
+    
+    def run(self, market: str = 'kr', date: str = None, force_update: bool = False,
+            skip_unchanged: bool = None) -> Dict[str, str]:
         """
         분석 실행
         
         Args:
             market: 시장 (kr, us, all)
             date: 날짜
-            force_update: 강제 업데이트
+            force_update: 강제 업데이트 (입력 변경 여부와 관계없이 전체 평가/렌더링)
+            skip_unchanged: 입력이 같은 평가/리포트 건너뛰기 (None: stocks.yml data_config.skip_unchanged)
+        
+        Returns:
+            시장별 리포트 파일 경로 {'kr': {'html': '...'}, ...} (결과가 없는 시장은 제외)
         """
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
         
         markets = ['kr', 'us'] if market == 'all' else [market]
         
+        if skip_unchanged is None:
+            skip_unchanged = self.stocks_config.get('data_config', {}).get('skip_unchanged', True)
+        skip_unchanged = skip_unchanged and not force_update
+        
+        reports = {}
+        METRICS.reset()
+        
         for mkt in markets:
             # 분석
-            results = self.analyze_market(mkt, date, force_update)
+            with METRICS.timer('stage_seconds', stage='analyze', market=mkt):
+                results = self.analyze_market(mkt, date, force_update, skip_unchanged)
             
             if results:
                 # 리포트 생성
-                filepath = self.generate_report(mkt, date, results)
+                with METRICS.timer('stage_seconds', stage='report', market=mkt):
+                    filepaths = self.generate_report(mkt, date, results, skip_unchanged)
+                reports[mkt] = filepaths
                 
                 print(f"\n{'='*60}")
                 print(f"✅ {mkt.upper()} 시장 분석 완료!")
-                print(f"📄 리포트: {filepath}")
+                for filepath in filepaths.values():
+                    print(f"📄 리포트: {filepath}")
                 print(f"{'='*60}\n")
+        
+        if self.metrics_dir:
+            self.write_metrics(market, date)
+        
+        return reports
+    
+    def ensure_history(self, stock: Dict, start_date: str, end_date: str, force_update: bool = False):
+        """
+        기간 주가 이력 확보 (DB에 없는 부분이 있으면 기간 전체를 수집해 저장)
+        
+        수집한 기간은 StockDatabase.save_price_coverage()로 기록하므로, 종료일이 주말/휴장일이거나
+        시작일 이후에 상장한 종목도 다음 백필에서 다시 수집하지 않습니다. 당일 일봉은 장 마감 전에
+        없을 수 있으므로 전날까지만 수집 완료로 기록합니다.
+        
+        Args:
+            stock: 종목 정보
+            start_date: 필요한 첫 날짜 (YYYY-MM-DD)
+            end_date: 필요한 마지막 날짜 (YYYY-MM-DD)
+            force_update: 강제 업데이트 여부
+        """
+        code = stock['code']
+        market = stock.get('market', 'KRX')
+        
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        complete_until = min(end_date, yesterday)
+        
+        if not force_update:
+            coverage = self.db.get_price_coverage(code)
+            covered = coverage and coverage[0] <= start_date and coverage[1] >= complete_until
+            if not covered:
+                # 수집 기록이 없는 이력 (일일 분석으로 저장된 일봉 등)
+                latest_date = self.db.get_latest_date(code)
+                covered = latest_date and latest_date >= end_date and self.db.get_price_data(
+                    code, end_date=start_date, limit=1)
+            if covered:
+                METRICS.incr('price_loads', source='cache')
+                return
+        
+        data = self.collector.collect(code, market, start_date, end_date)
+        METRICS.incr('price_loads', source='collector')
+        
+        # 수집 실패(빈 결과)는 기록하지 않음 (다음 백필에서 다시 시도)
+        if data:
+            self.db.save_price_data(code, market, data)
+            self.db.save_price_coverage(code, start_date, complete_until)
+    
+    def backfill(self, market: str, start_date: str, end_date: str = None,
+                 force_update: bool = False, render: bool = False) -> Dict:
+        """
+        기간 백필 (기간 내 모든 거래일 평가)
+        
+        종목별 이력을 한 번만 읽고 평가 도구의 evaluate_history()로 기간 전체를 한 번에
+        계산해 일괄 저장합니다. 각 거래일의 평가는 그 날까지의 일봉만 사용하므로
+        (point-in-time) 그 날 -d로 실행한 결과와 같습니다.
+        
+        Args:
+            market: 시장 (kr, us)
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD, 기본값: 오늘)
+            force_update: 주가 이력 강제 재수집
+            render: 거래일별 리포트 생성 여부
+        
+        Returns:
+            {'dates': 거래일 수, 'symbols': 평가 종목 수, 'evaluations': 저장 건수, 'reports': {날짜: {형식: 경로}}}
+        """
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        stocks = self.stocks_config.get(f"{market}_stocks", [])
+        
+        if not stocks:
+            print(f"❌ {market} 시장 종목이 없습니다.")
+            return {'dates': 0, 'symbols': 0, 'evaluations': 0, 'reports': {}}
+        
+        print(f"\n{'='*60}")
+        print(f"📊 {market.upper()} 시장 백필 ({start_date} ~ {end_date})")
+        print(f"{'='*60}\n")
+        
+        warmup_start = (datetime.strptime(start_date, '%Y-%m-%d')
+                        - timedelta(days=BACKFILL_WARMUP_DAYS)).strftime('%Y-%m-%d')
+        
+        # 1단계: 부족한 주가 이력 수집
+        for stock in stocks:
+            with METRICS.timer('stage_seconds', stage='collect', market=market, symbol=stock['code']):
+                self.ensure_history(stock, warmup_start, end_date, force_update)
+        
+        self.stage_done('collect', market)
+        
+        # 2단계: 전체 종목 이력을 한 번에 읽어 종목별 컬럼으로 분리 (code, date 오름차순)
+        with METRICS.timer('stage_seconds', stage='load', market=market):
+            columns = self.db.scan_prices(warmup_start, end_date, codes=[stock['code'] for stock in stocks])
+        
+        bounds = {}
+        for idx, code in enumerate(columns['code']):
+            first, _ = bounds.get(code, (idx, idx))
+            bounds[code] = (first, idx + 1)
+        
+        # 3단계: 종목별 기간 평가 + 일괄 저장
+        rows = []
+        saved = 0
+        trading_dates = set()
+        results_by_date = {}
+        evaluated = 0
+        
+        for stock in stocks:
+            code = stock['code']
+            if code not in bounds:
+                print(f"⚠️  [{code}] 데이터 없음, 건너뜀")
+                METRICS.incr('symbols', market=market, status='no_data')
+                continue
+            
+            first, last = bounds[code]
+            dates = [decode_date(value) for value in columns['date'][first:last]]
+            history = {name: columns[name][first:last] for name in ('open', 'high', 'low', 'close', 'volume')}
+            history['date'] = dates
+            start = bisect_left(dates, start_date)
+            
+            if start == len(dates):
+                print(f"⚠️  [{code}] 기간 내 데이터 없음, 건너뜀")
+                METRICS.incr('symbols', market=market, status='no_data')
+                continue
+            
+            with METRICS.timer('stage_seconds', stage='evaluate', market=market, symbol=code):
+                evaluated_by = []
+                for evaluator in self.evaluators:
+                    with METRICS.timer('evaluator_seconds', evaluator=evaluator.get_name(), symbol=code):
+                        evaluated_by.append((evaluator.get_name(), evaluator.evaluate_history(history, start)))
+                
+                closes = history['close']
+                for offset, idx in enumerate(range(start, len(dates))):
+                    date = dates[idx]
+                    evaluations = {}
+                    
+                    for eval_name, results in evaluated_by:
+                        score, emoji, comment, details = results[offset]
+                        evaluations[eval_name] = {
+                            'score': score,
+                            'emoji': emoji,
+                            'comment': comment,
+                            'details': details
+                        }
+                        rows.append((code, date, eval_name, score, details))
+                    
+                    trading_dates.add(date)
+                    if render:
+                        prev_price = closes[idx - 1] if idx > 0 else None
+                        results_by_date.setdefault(date, []).append(
+                            self.build_result(stock, evaluations, closes[idx], prev_price))
+            
+            if len(rows) >= BACKFILL_BATCH_SIZE:
+                saved += self.db.save_evaluations(rows)
+                rows = []
+            
+            evaluated += 1
+            METRICS.incr('symbols', market=market, status='ok')
+            print(f"✅ [{code}] {len(dates) - start}일 평가 완료")
+        
+        if rows:
+            saved += self.db.save_evaluations(rows)
+        
+        self.stage_done('evaluate', market)
+        print(f"\n💾 평가 결과 {saved:,}건 저장 ({evaluated}종목, {len(trading_dates)}거래일)")
+        
+        # 4단계: 거래일별 리포트 (선택)
+        reports = {}
+        for date in sorted(results_by_date):
+            with METRICS.timer('stage_seconds', stage='report', market=market):
+                reports[date] = self.generate_report(market, date, results_by_date[date])
+        
+        if reports:
+            print(f"📄 리포트 {len(reports)}개 생성 ({min(reports)} ~ {max(reports)})")
+        
+        return {'dates': len(trading_dates), 'symbols': evaluated, 'evaluations': saved, 'reports': reports}
+    
+    def run_backfill(self, market: str, start_date: str, end_date: str = None,
+                     force_update: bool = False, render: bool = False) -> Dict[str, Dict]:
+        """
+        시장별 백필 실행 (계측 포함)
+        
+        Args:
+            market: 시장 (kr, us, all)
+            start_date: 시작 날짜
+            end_date: 종료 날짜 (기본값: 오늘)
+            force_update: 주가 이력 강제 재수집
+            render: 거래일별 리포트 생성 여부
+        
+        Returns:
+            시장별 backfill() 결과
+        """
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        markets = ['kr', 'us'] if market == 'all' else [market]
+        
+        summary = {}
+        METRICS.reset()
+        
+        for mkt in markets:
+            with METRICS.timer('stage_seconds', stage='backfill', market=mkt):
+                summary[mkt] = self.backfill(mkt, start_date, end_date, force_update, render)
+        
+        if self.metrics_dir:
+            self.write_metrics(market, f"{start_date}_{end_date}")
+        
+        return summary
+    
+    def write_metrics(self, market: str, date: str) -> Dict[str, str]:
+        """
+        실행 지표 저장 (metrics_dir/run_{market}_{date}.json, metrics_dir/stock_analyzer.prom)
+        
+        Args:
+            market: 시장 (kr, us, all)
+            date: 분석 날짜
+        
+        Returns:
+            {'json': 경로, 'prometheus': 경로}
+        """
+        paths = METRICS.write(self.metrics_dir, f"run_{market}_{date}",
+                              run_labels={'market': market, 'date': date})
+        
+        summary = METRICS.snapshot()['summary'].get('stage_seconds', [])
+        print(f"⏱️  단계별 소요 시간 ({paths['json']})")
+        for item in summary:
+            labels = ', '.join(f"{key}={value}" for key, value in item['labels'].items())
+            print(f"   {labels:<36} {item['sum']:>8.2f}s ({item['count']}회, 최대 {item['max']:.2f}s)")
+        
+        return paths
+    
+    def export_data(self, market: str = 'all', tables: List[str] = None, output_dir: str = '../exports',
+                    format: str = 'parquet', start_date: str = None, end_date: str = None,
+                    workers: int = 1, chunk_size: int = 50_000) -> Dict:
+        """
+        주가/평가 결과/종합 점수 내보내기
+        
+        Args:
+            market: 시장 (kr, us, all)
+            tables: 내보낼 대상 (prices, evaluations, overall, 기본: 전체)
+            output_dir: 출력 디렉토리
+            format: arrow / parquet / csv
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            workers: 시장별 병렬 기록 수
+            chunk_size: 청크 크기 (행)
+        
+        Returns:
+            시장별 내보내기 결과
+        """
+        from exporter import DataExporter, EXPORT_COLUMNS
+        
+        markets = ['kr', 'us'] if market == 'all' else [market]
+        universe = {
+            mkt: {stock['code']: stock.get('market', 'KRX') for stock in self.stocks_config.get(f"{mkt}_stocks", [])}
+            for mkt in markets
+        }
+        
+        # 종합 점수 가중치 (활성화된 평가 도구 설정)
+        weights = {evaluator.get_name(): evaluator.get_weight() for evaluator in self.evaluators}
+        
+        exporter = DataExporter(self.db, weights=weights, chunk_size=chunk_size)
+        return exporter.export(
+            {mkt: stocks for mkt, stocks in universe.items() if stocks},
+            tables or list(EXPORT_COLUMNS),
+            output_dir,
+            format=format,
+            start_date=start_date,
+            end_date=end_date,
+            workers=workers
+        )
     
     def close(self):
         """종료"""
+        if self._sparklines:
+            self._sparklines.close()
         self.db.close()
 
 
@@ -326,21 +1098,229 @@ def main():
     parser.add_argument('-d', '--date', type=str,
                         help='분석 날짜 (YYYY-MM-DD, 기본값: 오늘)')
     parser.add_argument('-f', '--force', action='store_true',
-                        help='캐시 무시하고 데이터 강제 업데이트')
+                        help='캐시 무시하고 데이터 강제 업데이트 (입력 변경 여부와 관계없이 전체 평가/렌더링)')
+    parser.add_argument('--no-skip', action='store_true',
+                        help='입력이 같은 평가/리포트도 다시 계산 (stocks.yml data_config.skip_unchanged 무시)')
     parser.add_argument('-c', '--config', type=str, default='../config',
                         help='설정 파일 디렉토리')
+    parser.add_argument('--metrics-dir', type=str,
+                        help='실행 지표 출력 디렉토리 (JSON + Prometheus textfile, 기본: 계측 안 함)')
+    parser.add_argument('--profile', choices=['cpu', 'mem'],
+                        help='분석 실행 프로파일 (cpu: cProfile, mem: tracemalloc 단계별 스냅샷)')
+    parser.add_argument('--profile-dir', type=str, default='../data/profiles',
+                        help='프로파일 결과 디렉토리')
+    parser.add_argument('--profile-top', type=int, default=25,
+                        help='프로파일 요약에 표시할 항목 수')
+    parser.add_argument('--synthetic', type=int, nargs='?', const=0, metavar='N',
+                        help='합성 데이터로 실행 (임시 DB/리포트, N: 시장별 합성 종목 수, 생략 시 stocks.yml 종목)')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='python -X importtime으로 다시 실행해 import 시간 내역 출력')
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    # 유지보수 서브커맨드
+    maintenance_parser = subparsers.add_parser('maintenance', help='데이터베이스 유지보수')
+    maintenance_parser.add_argument('--all', action='store_true',
+                                    help='모든 유지보수 작업 실행')
+    maintenance_parser.add_argument('--retention', action='store_true',
+                                    help='보관 기간이 지난 평가 결과/리포트 삭제')
+    maintenance_parser.add_argument('--archive', action='store_true',
+                                    help='오래된 연도 데이터를 연도별 아카이브 DB로 이동')
+    maintenance_parser.add_argument('--compact-reports', action='store_true',
+                                    help='리포트 본문 정리 (고아 본문 삭제, 재압축)')
+    maintenance_parser.add_argument('--vacuum', action='store_true',
+                                    help='증분 VACUUM / ANALYZE / optimize')
+    maintenance_parser.add_argument('--evaluations-days', type=int,
+                                    help='평가 결과 보관 일수 (설정 파일 대신 사용)')
+    maintenance_parser.add_argument('--reports-days', type=int,
+                                    help='리포트 보관 일수 (설정 파일 대신 사용)')
+    maintenance_parser.add_argument('--keep-years', type=int,
+                                    help='라이브 DB에 남길 연도 수 (설정 파일 대신 사용)')
+    
+    # 내보내기 서브커맨드
+    export_parser = subparsers.add_parser('export', help='주가/평가 결과/종합 점수 내보내기')
+    export_parser.add_argument('--format', choices=['arrow', 'parquet', 'csv'], default='parquet',
+                               help='출력 형식 (arrow: Arrow IPC 파일)')
+    export_parser.add_argument('--tables', default='prices,evaluations,overall',
+                               help='내보낼 대상 (쉼표 구분: prices, evaluations, overall)')
+    export_parser.add_argument('--from', dest='start_date', type=str,
+                               help='시작 날짜 (YYYY-MM-DD)')
+    export_parser.add_argument('--to', dest='end_date', type=str,
+                               help='종료 날짜 (YYYY-MM-DD)')
+    export_parser.add_argument('-o', '--output', default='../exports',
+                               help='출력 디렉토리 ({table}_{market}.{format})')
+    export_parser.add_argument('--workers', type=int, default=1,
+                               help='시장별 병렬 기록 수')
+    export_parser.add_argument('--chunk-size', type=int, default=50_000,
+                               help='한 번에 읽고 쓰는 행 수')
+    
+    # 백필 서브커맨드
+    backfill_parser = subparsers.add_parser('backfill', help='기간 내 모든 거래일 평가 (이력 한 번 로드, 일괄 저장)')
+    backfill_parser.add_argument('--from', dest='start_date', type=str, required=True,
+                                 help='시작 날짜 (YYYY-MM-DD)')
+    backfill_parser.add_argument('--to', dest='end_date', type=str,
+                                 help='종료 날짜 (YYYY-MM-DD, 기본값: 오늘)')
+    backfill_parser.add_argument('--render', action='store_true',
+                                 help='거래일별 리포트도 생성')
+    
+    # 변화 서브커맨드
+    changes_parser = subparsers.add_parser('changes', help='전 거래일 대비 평가 변화 (저장된 평가 결과 비교, 분석 실행 안 함)')
+    changes_parser.add_argument('-d', '--date', type=str, default=argparse.SUPPRESS,
+                                help='기준 날짜 (YYYY-MM-DD, 기본값: 평가 결과가 저장된 마지막 날짜)')
+    
+    # 데몬 서브커맨드
+    subparsers.add_parser('daemon', help='상주 실행 (장 마감 스케줄러 + 제어 소켓)')
+    
+    ctl_parser = subparsers.add_parser('ctl', help='실행 중인 데몬 제어')
+    ctl_parser.add_argument('action', choices=['status', 'run', 'reload', 'stop'],
+                            help='status: 상태, run: 즉시 분석, reload: 설정 다시 읽기, stop: 종료')
+    ctl_parser.add_argument('--no-wait', action='store_true',
+                            help='run: 완료를 기다리지 않고 큐에 넣기만 함')
     
     args = parser.parse_args()
     
-    try:
+    if args.profile_startup:
+        from profiling import profile_startup
+        sys.exit(profile_startup([arg for arg in sys.argv[1:] if arg != '--profile-startup']))
+    
+    if args.command in ('daemon', 'ctl'):
+        from daemon import AnalysisDaemon, send_command
+        
+        config = {}
+        config_path = Path(args.config) / "daemon.yml"
+        if HAS_YAML and config_path.exists():
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        
+        if args.command == 'daemon':
+            AnalysisDaemon(lambda: StockAnalyzer(config_dir=args.config, metrics_dir=args.metrics_dir),
+                           config).run()
+            return
+        
+        request = {'command': args.action}
+        if args.action == 'run':
+            request.update({'market': args.market, 'date': args.date, 'force': args.force,
+                            'wait': not args.no_wait})
+        
+        try:
+            response = send_command(config.get('socket_path', '../data/stock-analyzer.sock'), request)
+        except OSError as e:
+            print(f"❌ 데몬에 연결할 수 없습니다: {e}")
+            sys.exit(1)
+        
+        print(json.dumps(response, ensure_ascii=False, indent=2))
+        sys.exit(0 if response.get('ok') else 1)
+    
+    if args.command == 'export':
+        tables = [table.strip() for table in args.tables.split(',') if table.strip()]
+        invalid = [table for table in tables if table not in ('prices', 'evaluations', 'overall')]
+        if invalid:
+            parser.error(f"알 수 없는 내보내기 대상: {', '.join(invalid)}")
+        
+        analyzer = StockAnalyzer(config_dir=args.config)
+        try:
+            analyzer.export_data(
+                market=args.market,
+                tables=tables,
+                output_dir=args.output,
+                format=args.format,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                workers=args.workers,
+                chunk_size=args.chunk_size
+            )
+        finally:
+            analyzer.close()
+        return
+
+    if args.command == 'changes':
+        analyzer = StockAnalyzer(config_dir=args.config)
+        try:
+            for market in (['kr', 'us'] if args.market == 'all' else [args.market]):
+                # 날짜 미지정: 오늘이 아니라 시장 종목의 평가 결과가 저장된 마지막 날짜
+                date = args.date or analyzer.db.get_latest_evaluation_date(
+                    stock['code'] for stock in analyzer.stocks_config.get(f"{market}_stocks", [])
+                )
+                if date is None:
+                    print(f"\n# {market.upper()}\n")
+                    print("저장된 평가 결과가 없습니다.")
+                    continue
+                print(f"\n# {market.upper()} ({date})\n")
+                print("\n".join(analyzer.daily_changes(market, date).markdown_lines()))
+        finally:
+            analyzer.close()
+        return
+
+    if args.command == 'maintenance':
+        from maintenance import DatabaseMaintenance
+        from storage import SQLitePriceStore
+        
+        # run과 같은 주가 저장소(price_backend)/OHLCV 캐시/아카이브 설정으로 DB 열기
         analyzer = StockAnalyzer(config_dir=args.config)
-        analyzer.run(market=args.market, date=args.date, force_update=args.force)
-        analyzer.close()
+        try:
+            archive = args.archive or args.all
+            if archive and not isinstance(analyzer.db.prices, SQLitePriceStore):
+                # 연도별 아카이브는 SQLite stock_prices 테이블만 이동 (Parquet 주가는 그대로 남음)
+                if args.archive:
+                    print("❌ 연도별 아카이브는 SQLite 주가 저장소(price_backend: sqlite)에서만 지원합니다.")
+                    sys.exit(1)
+                print("⚠️  SQLite 이외의 주가 저장소에서는 아카이브를 건너뜁니다.")
+                archive = False
+            
+            DatabaseMaintenance(analyzer.db, analyzer.maintenance_config).run(
+                retention=args.retention or args.all,
+                archive=archive,
+                compact_reports=args.compact_reports or args.all,
+                vacuum=args.vacuum or args.all,
+                evaluations_days=args.evaluations_days,
+                reports_days=args.reports_days,
+                keep_years=args.keep_years
+            )
+        finally:
+            analyzer.close()
+        return
+    
+    work_dir = None
+    analyzer = None
+    try:
+        if args.synthetic is not None:
+            # 실제 DB/리포트를 건드리지 않도록 임시 디렉토리에서 실행
+            work_dir = tempfile.mkdtemp(prefix='stock-analyzer-synthetic-')
+            analyzer = StockAnalyzer(config_dir=args.config, metrics_dir=args.metrics_dir,
+                                     db_path=str(Path(work_dir) / "stock_data.db"), use_archives=False)
+            analyzer.use_synthetic_data(work_dir, args.synthetic)
+        else:
+            analyzer = StockAnalyzer(config_dir=args.config, metrics_dir=args.metrics_dir)
+        
+        def run():
+            if args.command == 'backfill':
+                return analyzer.run_backfill(market=args.market, start_date=args.start_date,
+                                             end_date=args.end_date, force_update=args.force,
+                                             render=args.render)
+            return analyzer.run(market=args.market, date=args.date, force_update=args.force,
+                                skip_unchanged=False if args.no_skip else None)
+        
+        if args.profile == 'cpu':
+            from profiling import profile_cpu
+            profile_cpu(run, args.profile_dir, top=args.profile_top)
+        elif args.profile == 'mem':
+            from profiling import MemoryProfiler, profile_memory
+            profiler = MemoryProfiler()
+            analyzer.stage_hook = profiler.snapshot
+            profile_memory(run, args.profile_dir, profiler, top=args.profile_top)
+        else:
+            run()
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # 실패해도 닫기 (Parquet 저장소의 미기록 주가 flush, 차트 캐시/DB 연결 종료)
+        if analyzer is not None:
+            analyzer.close()
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""
+데이터베이스 유지보수 모듈
+보관 기간 정리, 연도별 아카이브, 리포트 저장소 정리, VACUUM/ANALYZE
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from database import StockDatabase
+
+
+def archive_dir_from_config(config: Dict, db_path) -> Path:
+    """
+    아카이브 DB 디렉토리 (maintenance.yml archive.dir, 기본: 라이브 DB 옆 archive/)
+
+    Args:
+        config: 유지보수 설정 (config/maintenance.yml)
+        db_path: 라이브 DB 파일 경로
+
+    Returns:
+        디렉토리 경로
+    """
+    archive_dir = (config or {}).get('archive', {}).get('dir')
+    return Path(archive_dir) if archive_dir else Path(db_path).parent / "archive"
+
+
+class DatabaseMaintenance:
+    """StockDatabase 유지보수 작업 실행기"""
+
+    def __init__(self, db: StockDatabase, config: Dict = None):
+        """
+        Args:
+            db: 대상 데이터베이스
+            config: 유지보수 설정 (config/maintenance.yml)
+        """
+        self.db = db
+        self.config = config or {}
+
+    def apply_retention(self, evaluations_days: Optional[int] = None,
+                        reports_days: Optional[int] = None) -> Dict:
+        """
+        보관 기간이 지난 평가 결과/리포트 삭제
+
+        Args:
+            evaluations_days: 평가 결과 보관 일수 (기본: 설정값)
+            reports_days: 리포트 보관 일수 (기본: 설정값)
+
+        Returns:
+            삭제 건수
+        """
+        retention = self.config.get('retention', {})
+        if evaluations_days is None:
+            evaluations_days = retention.get('evaluations_days')
+        if reports_days is None:
+            reports_days = retention.get('reports_days')
+
+        def describe(days):
+            return f"{days}일" if days else "무기한"
+
+        print(f"🧹 보관 기간 정리 (평가: {describe(evaluations_days)}, "
+              f"리포트: {describe(reports_days)})")
+        deleted = self.db.apply_retention(evaluations_days, reports_days)
+        print(f"✅ 평가 {deleted['evaluations']}건, 리포트 {deleted['reports']}건 삭제")
+
+        return deleted
+
+    def archive_old_years(self, keep_years: Optional[int] = None) -> Dict:
+        """
+        최근 keep_years년 이전 데이터를 연도별 아카이브 DB로 이동
+
+        Args:
+            keep_years: 라이브 DB에 남길 연도 수 (기본: 설정값, 올해 포함)
+
+        Returns:
+            연도별 이동 건수 {2023: {...}, ...}
+        """
+        archive = self.config.get('archive', {})
+        if keep_years is None:
+            keep_years = archive.get('keep_years', 2)
+        archive_dir = self.get_archive_dir()
+
+        cutoff_year = datetime.now().year - keep_years + 1
+        years = [year for year in self.db.get_data_years() if year < cutoff_year]
+
+        if not years:
+            print(f"ℹ️  아카이브할 데이터 없음 ({cutoff_year}년 이전)")
+            return {}
+
+        results = {}
+        for year in years:
+            moved = self.db.archive_year(year, str(archive_dir))
+            if not any(moved.values()):
+                continue
+            print(f"📦 {year}년 아카이브: 주가 {moved['stock_prices']}건, "
+                  f"평가 {moved['evaluations']}건, 리포트 {moved['reports']}건")
+            results[year] = moved
+
+        return results
+
+    def get_archive_dir(self) -> Path:
+        """아카이브 DB 디렉토리 (기본: 라이브 DB 옆 archive/)"""
+        return archive_dir_from_config(self.config, self.db.db_path)
+
+    def compact_reports(self) -> Dict:
+        """
+        리포트 본문 정리 (고아 본문 삭제, 재압축)
+
+        Returns:
+            정리 결과 통계
+        """
+        print("🗜️  리포트 저장소 정리 중...")
+        stats = self.db.compact_reports()
+
+        before = stats['bytes_before'] / 1024
+        after = stats['bytes_after'] / 1024
+        print(f"✅ 본문 {stats['blobs']}개, 재압축 {stats['recompressed']}개, "
+              f"고아 삭제 {stats['orphans_removed']}개 ({before:,.1f}KB -> {after:,.1f}KB)")
+
+        return stats
+
+    def optimize(self) -> Dict:
+        """
+        증분 VACUUM, ANALYZE, PRAGMA optimize
+
+        Returns:
+            파일 크기 변화
+        """
+        pages = self.config.get('vacuum', {}).get('incremental_pages', 0)
+
+        print("🔧 DB 최적화 (VACUUM / ANALYZE / optimize)...")
+        stats = self.db.optimize(incremental_pages=pages)
+        print(f"✅ {stats['size_before'] / 1e6:,.1f}MB -> {stats['size_after'] / 1e6:,.1f}MB")
+
+        return stats
+
+    def run(self, retention: bool = False, archive: bool = False,
+            compact_reports: bool = False, vacuum: bool = False,
+            evaluations_days: Optional[int] = None, reports_days: Optional[int] = None,
+            keep_years: Optional[int] = None) -> Dict:
+        """
+        유지보수 실행 (아카이브 -> 보관 기간 정리 -> 리포트 정리 -> 최적화 순)
+
+        Args:
+            retention: 보관 기간 정리 여부
+            archive: 연도별 아카이브 여부
+            compact_reports: 리포트 저장소 정리 여부
+            vacuum: VACUUM/ANALYZE/optimize 여부
+            evaluations_days: 평가 결과 보관 일수 (설정값 대신 사용)
+            reports_days: 리포트 보관 일수 (설정값 대신 사용)
+            keep_years: 라이브 DB에 남길 연도 수 (설정값 대신 사용)
+
+        Returns:
+            작업별 결과 {'archive': {...}, 'retention': {...}, ...}
+        """
+        results = {}
+
+        if archive:
+            results['archive'] = self.archive_old_years(keep_years)
+
+        if retention:
+            results['retention'] = self.apply_retention(evaluations_days, reports_days)
+
+        if compact_reports:
+            results['compact_reports'] = self.compact_reports()
+
+        if vacuum:
+            results['vacuum'] = self.optimize()
+
+        if not results:
+            print("ℹ️  실행할 유지보수 작업이 없습니다. (--help 참고)")
+
+        return results
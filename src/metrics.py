@@ -0,0 +1,270 @@
+"""
+실행 계측 모듈 (단계별 타이머 + 카운터)
+분석 실행 후 JSON 파일과 Prometheus textfile(node_exporter textfile collector)로 저장
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 비활성화 상태에서 timer()가 돌려주는 공유 컨텍스트 (할당/시간 측정 없음)
+_NULL_TIMER = nullcontext()
+
+# 집계(summary)에서 합치는 라벨 (종목별 -> 전체)
+PER_SYMBOL_LABEL = 'symbol'
+
+PROMETHEUS_PREFIX = 'stock_analyzer_'
+
+
+class _Timer:
+    """with 블록 실행 시간을 Metrics.observe()로 기록"""
+
+    __slots__ = ('metrics', 'name', 'labels', 'start')
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Tuple):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics._observe(self.name, self.labels, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """
+    프로세스 단위 계측 레지스트리
+
+    타이머는 (이름, 라벨)별로 count/sum/min/max를, 카운터는 합계를 누적합니다.
+    비활성화 상태에서는 timer()가 공유 nullcontext를 돌려주고 incr()/observe()는
+    바로 반환하므로 계측 코드를 그대로 두어도 비용이 거의 없습니다.
+    누적 값은 락으로 보호하므로 작업 스레드(LLM 해설, 형식별 렌더링)에서도 기록할 수 있습니다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Args:
+            enabled: 계측 활성화 여부
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """누적 값 초기화 (실행 단위로 호출)"""
+        with self._lock:
+            # (name, labels) -> [count, sum, min, max]
+            self._timers: Dict[Tuple[str, Tuple], list] = {}
+            # (name, labels) -> value
+            self._counters: Dict[Tuple[str, Tuple], float] = {}
+            self.started_at = datetime.now()
+            self._start = time.perf_counter()
+
+    def timer(self, name: str, **labels):
+        """
+        실행 시간 측정 컨텍스트
+
+        Args:
+            name: 지표 이름 (초 단위, 예: stage_seconds)
+            **labels: 라벨 (예: stage='collect', symbol='005930')
+
+        Returns:
+            컨텍스트 매니저
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, tuple(sorted(labels.items())))
+
+    def timed(self, name: str, **labels):
+        """
+        함수 실행 시간 측정 데코레이터 (호출 시점에 활성화 여부 확인)
+
+        Args:
+            name: 지표 이름
+            **labels: 라벨 (예: op='save_price_data')
+        """
+        key = tuple(sorted(labels.items()))
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._observe(name, key, time.perf_counter() - start)
+            return wrapper
+
+        return decorator
+
+    def observe(self, name: str, seconds: float, **labels):
+        """측정된 시간 기록 (timer()를 쓸 수 없는 경우)"""
+        if self.enabled:
+            self._observe(name, tuple(sorted(labels.items())), seconds)
+
+    def _observe(self, name: str, labels: Tuple, seconds: float):
+        with self._lock:
+            stat = self._timers.get((name, labels))
+            if stat is None:
+                self._timers[(name, labels)] = [1, seconds, seconds, seconds]
+            else:
+                stat[0] += 1
+                stat[1] += seconds
+                if seconds < stat[2]:
+                    stat[2] = seconds
+                if seconds > stat[3]:
+                    stat[3] = seconds
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """
+        카운터 증가
+
+        Args:
+            name: 지표 이름 (예: collector_rows)
+            value: 증가량
+            **labels: 라벨
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self) -> Dict:
+        """
+        현재 누적 값
+
+        Returns:
+            {'started_at', 'elapsed_seconds', 'timers': {이름: [시리즈]},
+             'counters': {이름: [시리즈]}, 'summary': {이름: [종목 라벨을 합친 시리즈]}}
+        """
+        timers, counters, summary = {}, {}, {}
+
+        # 작업 스레드가 기록 중일 수 있으므로 락 안에서 복사
+        with self._lock:
+            timer_items = [(key, tuple(stat)) for key, stat in self._timers.items()]
+            counter_items = list(self._counters.items())
+            started_at, start = self.started_at, self._start
+
+        for (name, labels), (count, total, low, high) in sorted(timer_items):
+            timers.setdefault(name, []).append({
+                'labels': dict(labels), 'count': count, 'sum': total, 'min': low, 'max': high,
+            })
+
+            # 종목 라벨을 뺀 집계
+            merged = tuple(item for item in labels if item[0] != PER_SYMBOL_LABEL)
+            stat = summary.setdefault(name, {}).get(merged)
+            if stat is None:
+                summary[name][merged] = [count, total, low, high]
+            else:
+                stat[0] += count
+                stat[1] += total
+                stat[2] = min(stat[2], low)
+                stat[3] = max(stat[3], high)
+
+        for (name, labels), value in sorted(counter_items):
+            counters.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+
+        return {
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'elapsed_seconds': time.perf_counter() - start,
+            'timers': timers,
+            'counters': counters,
+            'summary': {
+                name: [{'labels': dict(labels), 'count': count, 'sum': total,
+                        'mean': total / count, 'min': low, 'max': high}
+                       for labels, (count, total, low, high) in series.items()]
+                for name, series in summary.items()
+            },
+        }
+
+    @staticmethod
+    def _format_labels(labels: Dict) -> str:
+        if not labels:
+            return ''
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                   for value in labels.values())
+        return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+    def to_prometheus(self, snapshot: Optional[Dict] = None, run_labels: Optional[Dict] = None) -> str:
+        """
+        Prometheus 텍스트 형식 변환
+
+        타이머는 summary(_sum/_count), 카운터는 counter(_total)로 출력합니다.
+
+        Args:
+            snapshot: snapshot() 결과 (없으면 새로 생성)
+            run_labels: 실행 정보 지표에 붙일 라벨 (예: {'market': 'kr'})
+        """
+        snapshot = snapshot or self.snapshot()
+        run_labels = self._format_labels(run_labels or {})
+        lines = []
+
+        for name, series in snapshot['timers'].items():
+            metric = PROMETHEUS_PREFIX + name
+            lines.append(f"# TYPE {metric} summary")
+            for item in series:
+                labels = self._format_labels(item['labels'])
+                lines.append(f"{metric}_sum{labels} {item['sum']:.6f}")
+                lines.append(f"{metric}_count{labels} {item['count']}")
+
+        for name, series in snapshot['counters'].items():
+            metric = PROMETHEUS_PREFIX + name + '_total'
+            lines.append(f"# TYPE {metric} counter")
+            for item in series:
+                lines.append(f"{metric}{self._format_labels(item['labels'])} {item['value']:g}")
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}run_duration_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}run_duration_seconds{run_labels} {snapshot['elapsed_seconds']:.6f}")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}last_run_timestamp_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}last_run_timestamp_seconds{run_labels} {time.time():.0f}")
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str):
+        # textfile collector가 쓰다 만 파일을 읽지 않도록 임시 파일 후 교체
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(content, encoding='utf-8')
+        os.replace(tmp, path)
+
+    def write(self, output_dir: str, name: str, run_labels: Optional[Dict] = None) -> Dict[str, str]:
+        """
+        JSON 파일과 Prometheus textfile 저장
+
+        Args:
+            output_dir: 출력 디렉토리
+            name: JSON 파일명 (확장자 제외, 예: run_kr_2026-02-10)
+            run_labels: 실행 정보 (JSON에 기록, Prometheus 실행 지표 라벨)
+
+        Returns:
+            {'json': 경로, 'prometheus': 경로}
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        snapshot = self.snapshot()
+        snapshot['run'] = run_labels or {}
+
+        json_path = output_dir / f"{name}.json"
+        prom_path = output_dir / "stock_analyzer.prom"
+        self._write_atomic(json_path, json.dumps(snapshot, ensure_ascii=False, indent=2))
+        self._write_atomic(prom_path, self.to_prometheus(snapshot, run_labels))
+
+        return {'json': str(json_path), 'prometheus': str(prom_path)}
+
+
+# 프로세스 전역 레지스트리 (main.py --metrics-dir 지정 시 활성화)
+METRICS = Metrics()
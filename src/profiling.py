@@ -0,0 +1,256 @@
+"""
+실행 프로파일링 모듈
+시작 시간(import) 분석, cProfile CPU 프로파일, tracemalloc 단계별 메모리 분석
+"""
+
+import cProfile
+import io
+import pstats
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 시작 시 import되면 안 되는 무거운 의존성 (사용 시점에 import)
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'FinanceDataReader', 'anthropic', 'requests']
+
+
+def parse_importtime(lines: List[str]) -> List[Tuple[int, int, int, str]]:
+    """
+    python -X importtime 출력 파싱
+
+    Args:
+        lines: stderr 줄 목록 ("import time:" 으로 시작하지 않는 줄은 무시)
+
+    Returns:
+        [(깊이, self us, cumulative us, 모듈명), ...] (import 완료 순)
+    """
+    entries = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 줄
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, int(parts[0]), int(parts[1]), name.strip()))
+    return entries
+
+
+def summarize_importtime(entries: List[Tuple[int, int, int, str]], top: int = 15) -> Dict:
+    """
+    import 시간 요약
+
+    Args:
+        entries: parse_importtime() 결과
+        top: 표시할 모듈 수
+
+    Returns:
+        {'total_us', 'modules', 'top_level': [(모듈, cumulative us)], 'top_self': [(모듈, self us)]}
+    """
+    if not entries:
+        return {'total_us': 0, 'modules': 0, 'top_level': [], 'top_self': []}
+
+    root = min(depth for depth, _, _, _ in entries)
+    top_level = sorted(((name, cumulative) for depth, _, cumulative, name in entries if depth == root),
+                       key=lambda item: item[1], reverse=True)
+    top_self = sorted(((name, self_us) for _, self_us, _, name in entries),
+                      key=lambda item: item[1], reverse=True)
+
+    return {
+        'total_us': sum(cumulative for _, cumulative in top_level),
+        'modules': len(entries),
+        'top_level': top_level[:top],
+        'top_self': top_self[:top],
+    }
+
+
+def profile_startup(argv: List[str], top: int = 15) -> int:
+    """
+    main.py를 python -X importtime으로 다시 실행하고 import 시간 내역 출력
+
+    Args:
+        argv: main.py에 넘길 인자 (--profile-startup 제외)
+        top: 표시할 모듈 수
+
+    Returns:
+        자식 프로세스 종료 코드
+    """
+    script = Path(__file__).with_name('main.py')
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', str(script)] + argv,
+                          stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+
+    lines = proc.stderr.splitlines()
+    for line in lines:
+        if not line.startswith('import time:'):
+            print(line, file=sys.stderr)
+
+    entries = parse_importtime(lines)
+    summary = summarize_importtime(entries, top)
+    imported = {name for _, _, _, name in entries}
+
+    print(f"\n⏱️  시작 프로파일 (python -X importtime)")
+    print(f"   전체 실행: {elapsed * 1000:,.0f}ms, import: {summary['total_us'] / 1000:,.0f}ms "
+          f"({summary['modules']}개 모듈)")
+
+    print(f"\n   최상위 import (누적)")
+    for name, cumulative in summary['top_level']:
+        print(f"   {cumulative / 1000:>9.1f}ms  {name}")
+
+    print(f"\n   모듈 자체 시간")
+    for name, self_us in summary['top_self']:
+        print(f"   {self_us / 1000:>9.1f}ms  {name}")
+
+    loaded = [name for name in HEAVY_MODULES if name in imported]
+    if loaded:
+        print(f"\n   무거운 의존성 로드됨: {', '.join(loaded)}")
+
+    return proc.returncode
+
+
+def _output_path(output_dir: str, kind: str, suffix: str) -> Path:
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / f"{kind}_{datetime.now().strftime('%Y%m%d-%H%M%S')}{suffix}"
+
+
+def profile_cpu(func: Callable, output_dir: str, top: int = 25):
+    """
+    cProfile로 함수 실행 프로파일 (pstats 파일 + 상위 함수 요약)
+
+    Args:
+        func: 실행할 함수 (인자 없음)
+        output_dir: 출력 디렉토리 (cpu_{시각}.pstats, cpu_{시각}.txt)
+        top: 요약에 표시할 함수 수
+
+    Returns:
+        func 반환값
+    """
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        stats_path = _output_path(output_dir, 'cpu', '.pstats')
+        profiler.dump_stats(str(stats_path))
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream).strip_dirs()
+        stream.write(f"# 누적 시간 상위 {top}개 (cumulative)\n")
+        stats.sort_stats('cumulative').print_stats(top)
+        stream.write(f"\n# 자체 시간 상위 {top}개 (tottime)\n")
+        stats.sort_stats('tottime').print_stats(top)
+
+        summary_path = stats_path.with_suffix('.txt')
+        summary_path.write_text(stream.getvalue(), encoding='utf-8')
+
+        print(f"\n🔬 CPU 프로파일 (자체 시간 상위 {top}개)")
+        stats.stream = sys.stdout
+        stats.sort_stats('tottime').print_stats(top)
+        print(f"📄 pstats: {stats_path}")
+        print(f"📄 요약: {summary_path}")
+        print(f"   (python -m pstats {stats_path.name} / snakeviz 등으로 분석)")
+
+    return result
+
+
+class MemoryProfiler:
+    """
+    tracemalloc 단계별 메모리 프로파일러
+
+    StockAnalyzer.stage_hook에 snapshot을 연결하면 단계(수집, 평가, 렌더링)가 끝날
+    때마다 스냅샷을 찍어, 단계별 현재/최대 메모리와 직전 단계 대비 할당이 가장 많이
+    늘어난 위치를 보고합니다.
+    """
+
+    def __init__(self, frames: int = 1):
+        """
+        Args:
+            frames: 할당 위치별로 저장할 스택 깊이 (1: 할당한 줄만)
+        """
+        self.frames = frames
+        # [(라벨, 스냅샷, 현재 bytes, 단계 최대 bytes)]
+        self.snapshots = []
+
+    def start(self):
+        tracemalloc.start(self.frames)
+        self.snapshot('start')
+
+    def snapshot(self, stage: str, market: str = None):
+        """
+        단계 종료 스냅샷 (StockAnalyzer.stage_hook 시그니처)
+
+        Args:
+            stage: 단계 이름
+            market: 시장 (라벨에 표시)
+        """
+        label = f"{market}:{stage}" if market else stage
+        current, peak = tracemalloc.get_traced_memory()
+        self.snapshots.append((label, tracemalloc.take_snapshot(), current, peak))
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        self.snapshot('end')
+        tracemalloc.stop()
+
+    def report(self, top: int = 10) -> str:
+        """단계별 메모리 / 증가량 상위 할당 위치"""
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ]
+        lines = [f"{'단계':<20}{'현재':>12}{'단계 최대':>12}"]
+        for label, _, current, peak in self.snapshots:
+            lines.append(f"{label:<20}{current / 1e6:>10.1f}MB{peak / 1e6:>10.1f}MB")
+
+        for (_, previous, _, _), (label, snapshot, _, _) in zip(self.snapshots, self.snapshots[1:]):
+            stats = snapshot.filter_traces(filters).compare_to(previous.filter_traces(filters), 'lineno')
+            lines.append(f"\n# {label}: 직전 단계 대비 증가 상위 {top}개")
+            for stat in stats[:top]:
+                frame = stat.traceback[0]
+                lines.append(f"{stat.size_diff / 1e3:>+10.1f}KB {stat.count_diff:>+8}개  "
+                             f"{frame.filename}:{frame.lineno}")
+
+        final = self.snapshots[-1][1].filter_traces(filters).statistics('lineno')
+        lines.append(f"\n# 종료 시점 메모리 점유 상위 {top}개")
+        for stat in final[:top]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size / 1e3:>10.1f}KB {stat.count:>8}개  {frame.filename}:{frame.lineno}")
+
+        return '\n'.join(lines)
+
+
+def profile_memory(func: Callable, output_dir: str, profiler: MemoryProfiler, top: int = 10):
+    """
+    tracemalloc으로 함수 실행 중 단계별 메모리 분석
+
+    Args:
+        func: 실행할 함수 (인자 없음, 실행 중 profiler.snapshot()이 단계마다 호출되어야 함)
+        output_dir: 출력 디렉토리 (mem_{시각}.txt)
+        profiler: 단계 콜백에 연결된 MemoryProfiler
+        top: 단계별 표시할 할당 위치 수
+
+    Returns:
+        func 반환값
+    """
+    profiler.start()
+    try:
+        result = func()
+    finally:
+        profiler.stop()
+
+        report = profiler.report(top)
+        report_path = _output_path(output_dir, 'mem', '.txt')
+        report_path.write_text(report, encoding='utf-8')
+
+        print(f"\n🔬 메모리 프로파일 (tracemalloc)")
+        print(report)
+        print(f"📄 보고서: {report_path}")
+
+    return result
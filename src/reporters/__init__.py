@@ -1,6 +1,18 @@
 """리포트 생성 모듈"""
 
-from .markdown import MarkdownReporter
-from .html import HTMLReporter
-
 __all__ = ['MarkdownReporter', 'HTMLReporter']
+
+# 설정된 형식의 리포터만 import
+_LAZY = {
+    'MarkdownReporter': '.markdown',
+    'HTMLReporter': '.html',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,212 @@
+"""
+전 거래일 대비 변화 집계
+저장된 평가 결과(StockDatabase.get_overall_changes)로 등급 상향/하향, 신규 강한 매수/주의 신호, 점수 변화 상위 종목 계산
+"""
+
+import heapq
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from evaluators.base import BaseEvaluator, OVERALL_EMOJIS
+from .summary import bucket_of, signal_of, signal_ranges
+
+
+class ScoreChange(NamedTuple):
+    """종목 1개의 종합 점수 변화"""
+    code: str
+    name: str
+    score: float
+    prev_score: float
+    emoji: str
+    prev_emoji: str
+
+    @property
+    def delta(self) -> float:
+        return self.score - self.prev_score
+
+
+class _TopN:
+    """키가 큰 순서로 n개만 유지 (같으면 먼저 넣은 항목 우선)"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self.count = 0
+        self._heap: List[Tuple[float, int, ScoreChange]] = []
+
+    def push(self, key: float, item: ScoreChange):
+        entry = (key, -self.count, item)
+        self.count += 1
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, entry)
+        elif self.n and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[ScoreChange]:
+        return [item for _, _, item in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+
+class DailyChanges:
+    """
+    전 거래일 대비 변화
+
+    종목마다 add()로 (점수, 전일 점수)를 넣으면 구간(종합 평가 emoji) 상향/하향, 신호가 새로
+    strong_buy/sell이 된 종목, 점수 변화 폭 상위 종목을 분류합니다. 분류별로 개수는 모두 세고
+    종목은 top_n개만 힙으로 유지하므로 전체 종목에서도 O(n log top_n)입니다.
+    """
+
+    def __init__(self, date: str, prev_date: Optional[str], scoring: Dict = None, top_n: int = 10):
+        """
+        Args:
+            date: 기준 날짜
+            prev_date: 비교 날짜 (이전 평가가 없으면 None)
+            scoring: evaluators.yml overall_scoring
+            top_n: 분류별로 표시할 종목 수
+        """
+        self.date = date
+        self.prev_date = prev_date
+        self.top_n = top_n
+        self.thresholds = BaseEvaluator.overall_thresholds(scoring)
+        self._signals = signal_ranges(self.thresholds)
+
+        self.compared = 0
+        self.unchanged = 0
+        self.new_symbols = 0
+        self.missing = 0
+        self.upgrades = _TopN(top_n)
+        self.downgrades = _TopN(top_n)
+        self.new_strong_buy = _TopN(top_n)
+        self.new_sell = _TopN(top_n)
+        self.moves = _TopN(top_n)
+
+    @classmethod
+    def from_db(cls, db, stocks: List[Dict], date: str, weights: Dict[str, float],
+                scoring: Dict = None, top_n: int = 10) -> "DailyChanges":
+        """
+        저장된 평가 결과로 변화 집계
+
+        Args:
+            db: StockDatabase
+            stocks: 종목 목록 [{'code', 'name'}, ...]
+            date: 기준 날짜
+            weights: 평가 도구별 가중치 (종합 점수 계산용)
+            scoring: evaluators.yml overall_scoring
+            top_n: 분류별로 표시할 종목 수
+
+        Returns:
+            DailyChanges
+        """
+        names = {stock['code']: stock.get('name', stock['code']) for stock in stocks}
+        data = db.get_overall_changes(names, date, weights)
+        return cls.from_rows(data['rows'], names, date, data['prev_date'], scoring, top_n)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Optional[float], Optional[float]]], names: Dict[str, str],
+                  date: str, prev_date: Optional[str], scoring: Dict = None,
+                  top_n: int = 10) -> "DailyChanges":
+        """
+        (코드, 점수, 전일 점수) 행으로 변화 집계
+
+        Args:
+            rows: StockDatabase.get_overall_changes()의 rows
+            names: {종목 코드: 종목명}
+            date: 기준 날짜
+            prev_date: 비교 날짜
+            scoring: evaluators.yml overall_scoring
+            top_n: 분류별로 표시할 종목 수
+        """
+        changes = cls(date, prev_date, scoring, top_n)
+        for code, score, prev_score in rows:
+            changes.add(code, names.get(code, code), score, prev_score)
+        return changes
+
+    def add(self, code: str, name: str, score: Optional[float], prev_score: Optional[float]):
+        """
+        종목 1개 분류
+
+        Args:
+            code: 종목 코드
+            name: 종목명
+            score: 기준일 종합 점수 (없으면 None)
+            prev_score: 전일 종합 점수 (없으면 None)
+        """
+        if score is None:
+            self.missing += 1
+            return
+        if prev_score is None:
+            self.new_symbols += 1
+            return
+
+        self.compared += 1
+        rank = bucket_of(score, self.thresholds)
+        prev_rank = bucket_of(prev_score, self.thresholds)
+        change = ScoreChange(code, name, score, prev_score,
+                             OVERALL_EMOJIS[self.thresholds[rank][1]],
+                             OVERALL_EMOJIS[self.thresholds[prev_rank][1]])
+
+        # 구간 순위는 0이 가장 높은 구간
+        if rank < prev_rank:
+            self.upgrades.push(change.delta, change)
+        elif rank > prev_rank:
+            self.downgrades.push(-change.delta, change)
+        else:
+            self.unchanged += 1
+
+        signal = signal_of(score, self._signals)
+        prev_signal = signal_of(prev_score, self._signals)
+        if signal != prev_signal:
+            if signal == 'strong_buy':
+                self.new_strong_buy.push(score, change)
+            elif signal == 'sell':
+                self.new_sell.push(-score, change)
+
+        if change.delta:
+            self.moves.push(abs(change.delta), change)
+
+    def sections(self) -> List[Tuple[str, int, List[ScoreChange]]]:
+        """
+        표시할 분류 (종목이 있는 분류만)
+
+        Returns:
+            [(제목, 전체 종목 수, 상위 top_n 종목), ...]
+        """
+        sections = [
+            ("⬆️ 등급 상향", self.upgrades),
+            ("⬇️ 등급 하향", self.downgrades),
+            ("🔥 신규 강한 매수 신호", self.new_strong_buy),
+            ("👎 신규 주의/매도 신호", self.new_sell),
+            ("📊 점수 변화 상위", self.moves),
+        ]
+        return [(title, top.count, top.items()) for title, top in sections if top.count]
+
+    def signature(self) -> List:
+        """
+        리포트 입력 fingerprint용 요약 (비교 날짜, 분류별 개수와 표시 종목 점수)
+
+        Returns:
+            JSON 직렬화 가능한 리스트
+        """
+        return [self.prev_date, self.compared, self.unchanged, self.new_symbols, self.missing,
+                [[title, count, [[c.code, c.score, c.prev_score] for c in shown]]
+                 for title, count, shown in self.sections()]]
+
+    def markdown_lines(self) -> List[str]:
+        """
+        Markdown 리포트 섹션 ('## 🔄 전일 대비 변화')
+
+        Returns:
+            줄 리스트
+        """
+        lines = ["## 🔄 전일 대비 변화", ""]
+        if self.prev_date is None:
+            lines.append(f"- {self.date} 이전 평가 결과가 없습니다.")
+            return lines
+
+        lines.append(f"- 비교: {self.prev_date} → {self.date} ({self.compared}종목, 등급 유지 {self.unchanged}종목)")
+        if self.new_symbols:
+            lines.append(f"- 신규 평가: {self.new_symbols}종목")
+
+        for title, count, shown in self.sections():
+            more = f" 외 {count - len(shown)}종목" if count > len(shown) else ""
+            names = ", ".join(f"{c.name} {c.prev_emoji}→{c.emoji} ({c.delta:+.2f})" for c in shown)
+            lines.append(f"- **{title}** {count}종목: {names}{more}")
+
+        return lines
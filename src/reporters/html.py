@@ -2,29 +2,111 @@
 HTML 리포트 생성기
 """
 
-from typing import List, Dict
+import json
+import os
+from functools import lru_cache
+from typing import List, Dict, Iterator, NamedTuple
 from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, Template
+
+from .changes import DailyChanges
 from .llm_generator import ClaudeCommentGenerator
+from .summary import ReportSummary
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# 파일로 바로 쓸 때 모아서 쓰는 템플릿 조각 수
+STREAM_BUFFER_SIZE = 64
+
+# html_mode: standard(종목별 카드/행), virtual(JSON + 보이는 행만 렌더링), auto(종목 수로 선택)
+HTML_MODES = ('standard', 'virtual', 'auto')
+
+# virtual 모드 행 높이 (px, 스크롤 위치로 보이는 행을 계산하므로 고정)
+VIRTUAL_ROW_HEIGHT = 56
+
+# virtual 모드 JSON 행 순서 (템플릿 스크립트는 이름으로 조회)
+VIRTUAL_COLUMNS = ('main', 'sub', 'price', 'change', 'change_text', 'bb', 'ich', 'overall', 'score',
+                   'comment', 'ich_comment', 'ai', 'chart')
+
+
+@lru_cache(maxsize=None)
+def _template(name: str = "report.html.j2") -> Template:
+    """
+    컴파일된 템플릿 (프로세스당 한 번 컴파일 후 재사용)
+    
+    Args:
+        name: templates/ 아래 템플릿 파일명
+    """
+    # 텍스트 값만 템플릿에서 |e로 이스케이프 (값마다 자동 이스케이프하면 렌더링이 2배 이상 느림)
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=False,
+        auto_reload=False,
+        keep_trailing_newline=True
+    )
+    return env.get_template(name)
+
+
+class _Row(NamedTuple):
+    """템플릿 행 데이터 (속성 조회가 dict보다 빠름)"""
+    main_text: str
+    sub_text: str
+    bb_emoji: str
+    ich_emoji: str
+    overall_emoji: str
+    score: str
+    score_short: str
+    price: str
+    change: str
+    price_color: str
+    comment: str
+    mobile_comment: str
+    ai: str
+    chart: str
+
+
+class _Rows:
+    """순회할 때마다 행 데이터를 만드는 시퀀스 (종목 수와 무관하게 행 데이터를 메모리에 두지 않음)"""
+    
+    def __init__(self, reporter: "HTMLReporter", market: str, results: List[Dict]):
+        self.reporter = reporter
+        self.market = market
+        self.results = results
+    
+    def __iter__(self) -> Iterator[_Row]:
+        return (self.reporter._row(self.market, result) for result in self.results)
 
 
 class HTMLReporter:
     """HTML 형식 리포트 생성기"""
     
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, llm_generator: ClaudeCommentGenerator = None):
         """
         Args:
             config: 리포트 설정
+            llm_generator: 공유할 LLM 생성기 (여러 형식을 함께 만들 때, 없으면 설정으로 생성)
         """
         self.config = config or {}
         self.output_dir = Path(self.config.get('output_dir', '../reports'))
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # 리포트 방식 (auto: html_virtual_threshold 종목 이상이면 virtual)
+        self.mode = self.config.get('html_mode', 'standard')
+        if self.mode not in HTML_MODES:
+            raise ValueError(f"알 수 없는 html_mode: {self.mode} ({', '.join(HTML_MODES)})")
+        self.virtual_threshold = self.config.get('html_virtual_threshold', 500)
+        
+        # 요약 구간 (evaluators.yml overall_scoring) 및 상위 종목 수
+        self.scoring = self.config.get('overall_scoring')
+        self.top_k = self.config.get('summary_top_k', 5)
+        
         # LLM 생성기 초기화
         use_llm = self.config.get('use_llm', False)
-        if use_llm:
-            llm_model = self.config.get('llm_model', 'claude-haiku-4-5')
-            api_key = self.config.get('api_key', '').strip() or None
-            self.llm_generator = ClaudeCommentGenerator(model=llm_model, api_key=api_key)
+        if use_llm and llm_generator is not None:
+            self.llm_generator = llm_generator
+        elif use_llm:
+            self.llm_generator = ClaudeCommentGenerator.from_config(self.config)
         else:
             self.llm_generator = None
             print("ℹ️  LLM 기능이 비활성화되었습니다.")
@@ -37,7 +119,8 @@ class HTMLReporter:
         }
         return scores.get(emoji, 0.0)
 
-    def generate(self, market: str, date: str, results: List[Dict]) -> str:
+    def generate(self, market: str, date: str, results: List[Dict],
+                 changes: DailyChanges = None) -> str:
         """
         HTML 리포트 생성
         
@@ -45,477 +128,198 @@ class HTMLReporter:
             market: 시장 (kr, us)
             date: 날짜
             results: 분석 결과 리스트
+            changes: 전 거래일 대비 변화 (있으면 변화 섹션 포함)
         
         Returns:
             HTML 문자열
         """
-        market_name = "한국" if market == "kr" else "미국"
-        formatted_date = date.replace('-', '.') + '.'
+        return "".join(self.stream(market, date, results, changes))
+    
+    def stream(self, market: str, date: str, results: List[Dict],
+               changes: DailyChanges = None) -> Iterator[str]:
+        """
+        HTML 리포트를 조각 단위로 생성 (전체 문자열을 만들지 않음)
         
-        # LLM 개별 종목 분석
-        if self.llm_generator and self.llm_generator.enabled:
-            print("🤖 Claude AI가 종목 분석을 시작합니다...")
-            for result in results:
-                if 'llm_analysis' not in result:
-                    try:
-                        result['llm_analysis'] = self.llm_generator.generate_stock_analysis(result)
-                    except Exception as e:
-                        print(f"⚠️ 종목 분석 실패 ({result['name']}): {e}")
-                        result['llm_analysis'] = ""
+        Args:
+            market: 시장 (kr, us)
+            date: 날짜
+            results: 분석 결과 리스트
+            changes: 전 거래일 대비 변화
         
-        # HTML 헤더 및 스타일
-        html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{market_name} 주식 분석 리포트 - {date}</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        body {{ 
-            font-family: 'Inter', 'Pretendard', sans-serif; 
-            background-color: #f8fafc; 
-        }}
-
-        /* 데스크탑 AI 박스 스타일 */
-        .ai-box-desktop {{
-            height: 6.5rem;
-            overflow: hidden;
-            position: relative;
-            transition: height 0.3s ease;
-        }}
-
-        .ai-box-desktop.expanded {{
-            height: auto;
-            overflow: visible;
-        }}
-
-        .ai-box-desktop .ai-content {{
-            display: -webkit-box;
-            -webkit-line-clamp: 3;
-            line-clamp: 3;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }}
-
-        .ai-box-desktop.expanded .ai-content {{
-            -webkit-line-clamp: unset;
-            line-clamp: unset;
-            overflow: visible;
-        }}
-
-        /* 짧은 텍스트 수직 중앙 */
-        .ai-box-desktop:not(.has-overflow) {{
-            display: flex;
-            align-items: center;
-        }}
-
-        .ai-box-desktop:not(.has-overflow) .ai-content {{
-            display: block;
-            -webkit-line-clamp: unset;
-            line-clamp: unset;
-        }}
-
-        .ai-toggle-desktop {{
-            display: none;
-        }}
-
-        /* 오버플로우 발생 시 하단에 그라데이션과 함께 버튼 표시 */
-        .ai-box-desktop.has-overflow .ai-toggle-desktop {{
-            display: flex;
-            justify-content: center;
-            align-items: flex-end;
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            width: 100%;
-            height: 2.5rem;
-            background: linear-gradient(to bottom, transparent, #eef2ff 60%);
-            padding-bottom: 0.25rem;
-            color: #6366f1;
-            font-size: 0.75rem;
-            font-weight: 600;
-            cursor: pointer;
-        }}
-
-        .ai-box-desktop.has-overflow .ai-toggle-desktop:hover {{
-            color: #4f46e5;
-        }}
-
-        /* 펼쳐진 상태에서는 하단에 일반 텍스트 버튼으로 표시 */
-        .ai-box-desktop.expanded .ai-toggle-desktop {{
-            position: static;
-            height: auto;
-            background: none;
-            justify-content: flex-end;
-            padding-bottom: 0;
-            margin-top: 0.5rem;
-            width: 100%;
-        }}
-
-        /* 모바일 AI 텍스트 스타일 */
-        .ai-text-mobile {{
-            font-size: 0.875rem;
-            color: #312e81; /* text-indigo-900 */
-            line-height: 1.6;
-        }}
-        .inline-btn {{
-            color: #4f46e5;
-            font-weight: 600;
-            font-size: 0.875rem;
-            margin-left: 0.25rem;
-            cursor: pointer;
-        }}
-    </style>
-</head>
-<body class="p-4 md:p-10">
-
-    <div class="max-w-6xl mx-auto">
-        <div class="mb-8">
-            <h1 class="text-3xl font-bold text-gray-900">주식 분석 리포트 <span class="text-2xl font-semibold text-gray-500">({formatted_date})</span></h1>
-            <p class="text-gray-500 mt-2">볼린저 밴드 및 일목균형표 기술적 지표 요약 ({market_name} 시장)</p>
-        </div>
-
-        <!-- 모바일 뷰 (카드 형태) -->
-        <div class="md:hidden">
-            <!-- 정렬 버튼 -->
-            <div class="flex justify-end mb-3">
-                <button id="mobileSortToggle" onclick="toggleSort('mobile')" class="flex items-center gap-1.5 px-3 py-1.5 text-xs font-medium text-gray-600 bg-white border border-gray-200 rounded-lg hover:bg-gray-50 transition-all shadow-sm">
-                    <svg class="w-3.5 h-3.5" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M7 16V4m0 0L3 8m4-4l4 4m6 0v12m0 0l4-4m-4 4l-4-4"/></svg>
-                    <span id="mobileSortLabel">종합점수</span>
-                </button>
-            </div>
-
-            <div class="space-y-4 mb-8" id="mobileBody">
-"""
-        # 모바일 카드 생성
-        for idx, result in enumerate(results):
-            name = result['name']
-            code = result['code']
-            
-            # 시장별 표시 순서
-            if market == 'us':
-                main_text = code
-                sub_text = name
-            else:
-                main_text = name
-                sub_text = code
-
-            # 평가 결과 추출
-            evals = result.get('evaluations', {})
-            bb = evals.get('bollinger', {})
-            bb_emoji = bb.get('emoji', '❓')
-            ich = evals.get('ichimoku', {})
-            ich_emoji = ich.get('emoji', '❓')
-            overall_emoji = result.get('overall_emoji', '❓')
-            
-            # 점수 계산
-            overall_score = result.get('overall_score', self._get_score(overall_emoji))
-            
-            # 가격 정보
-            current_price = result.get('current_price', 0)
-            price_change_rate = result.get('price_change_rate', 0.0)
-            
-            currency = "원" if market == "kr" else "$"
-            price_str = f"{current_price:,.0f}{currency}" if market == "kr" else f"${current_price:,.2f}"
-            
-            change_sign = "+" if price_change_rate > 0 else ""
-            change_str = f"{change_sign}{price_change_rate:.2f}%"
-            
-            if price_change_rate > 0:
-                price_color = "text-red-600"
-            elif price_change_rate < 0:
-                price_color = "text-blue-600"
-            else:
-                price_color = "text-gray-900"
-                
-            main_comment = bb.get('comment', '분석 중...')
-            bb_pos = bb.get('details', {}).get('position')
-            if bb_pos is not None:
-                main_comment += f" ({bb_pos:.0f}%)"
-            
-            ai_analysis_text = result.get('llm_analysis', '')
-            
-            # AI 분석이 있으면 data 속성으로 전달
-            ai_attr = f'data-full="{ai_analysis_text}"' if ai_analysis_text else ''
-            
-            html += f"""
-                <div class="bg-white p-5 rounded-xl shadow-sm border border-gray-100" data-score="{overall_score:.2f}" data-order="{idx}">
-                    <div class="flex justify-between items-start mb-3">
-                        <div>
-                            <div class="font-bold text-gray-900 text-lg">{main_text}</div>
-                            <div class="text-xs text-gray-400 font-mono">{sub_text}</div>
-                        </div>
-                        <div class="text-right">
-                            <div class="{price_color} font-bold">{price_str}</div>
-                            <div class="{price_color} text-xs">{change_str}</div>
-                        </div>
-                    </div>
-                    
-                    <div class="bg-gray-50 p-4 rounded-lg mb-3 flex items-center lg:gap-4 gap-3">
-                        <div class="flex flex-col items-center min-w-[3rem]">
-                            <span class="text-xs text-gray-500 mb-1 font-medium">BOLL</span>
-                            <span class="text-2xl">{bb_emoji}</span>
-                        </div>
-                        <div class="h-8 w-px bg-gray-200"></div>
-                        <div class="flex flex-col items-center min-w-[3rem]">
-                            <span class="text-xs text-gray-500 mb-1 font-medium">IC</span>
-                            <span class="text-2xl">{ich_emoji}</span>
-                        </div>
-                        <div class="h-8 w-px bg-gray-200"></div>
-                        <div class="flex-1 min-w-0">
-                            <span class="block text-xs text-gray-500 mb-1 font-medium">평가</span>
-                            <div class="flex items-center gap-2">
-                                <span class="text-2xl flex-shrink-0">{overall_emoji}</span>
-                                <div class="text-sm text-gray-700 font-medium truncate leading-snug">
-                                    {main_comment} <span class="text-gray-400 font-normal">({overall_score:.1f}점)</span>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    """
-            
-            if ai_analysis_text:
-                html += f"""
-                    <div class="mt-3 pt-3">
-                        <div class="bg-indigo-50 p-3 rounded-lg ai-text-mobile" {ai_attr}>
-                            <!-- JS가 내용을 채움 -->
-                        </div>
-                    </div>
-                """
-                
-            html += """
-                </div>
-"""
-
-        html += """
-            </div>
-        </div>
-
-        <!-- 데스크탑 뷰 (테이블 형태) -->
-        <div class="hidden md:block">
-            <!-- 정렬 버튼 -->
-            <div class="flex justify-end mb-3">
-                <button id="desktopSortToggle" onclick="toggleSort('desktop')" class="flex items-center gap-1.5 px-4 py-2 text-sm font-medium text-gray-600 bg-white border border-gray-200 rounded-lg hover:bg-gray-50 hover:border-gray-300 transition-all shadow-sm">
-                    <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M7 16V4m0 0L3 8m4-4l4 4m6 0v12m0 0l4-4m-4 4l-4-4"/></svg>
-                    <span id="desktopSortLabel">종합점수</span>
-                </button>
-            </div>
-
-            <div class="bg-white rounded-2xl shadow-xl overflow-hidden border border-gray-100">
-                <div class="overflow-x-auto">
-                    <table class="w-full border-collapse text-left" id="stockTable">
-                        <thead>
-                            <tr class="bg-slate-50 border-b border-gray-100">
-                                <th class="px-6 py-4 font-semibold text-gray-700 text-center min-w-[140px]">종목명</th>
-                                <th class="px-5 py-4 font-semibold text-gray-700 text-center min-w-[130px]">현재가</th>
-                                <th class="px-4 py-4 font-semibold text-gray-700 text-center w-20">BOLL</th>
-                                <th class="px-4 py-4 font-semibold text-gray-700 text-center w-20">IC</th>
-                                <th class="px-6 py-4 font-semibold text-gray-700 text-center">평가 및 의견</th>
-                            </tr>
-                        </thead>
-                        <tbody class="divide-y divide-gray-50" id="stockBody">
-"""
+        Returns:
+            HTML 조각 이터레이터
+        """
+        self.fill_llm_analysis(results)
+        template, context = self._render_args(market, date, results, changes)
+        return template.generate(**context)
+    
+    def write(self, market: str, date: str, results: List[Dict],
+              changes: DailyChanges = None) -> str:
+        """
+        HTML 리포트를 생성하면서 바로 파일에 저장 (임시 파일에 쓴 뒤 교체)
         
-        # 데스크탑 행 생성
-        for idx, result in enumerate(results):
-            name = result['name']
-            code = result['code']
-            
-            if market == 'us':
-                main_text = code
-                sub_text = name
-            else:
-                main_text = name
-                sub_text = code
-            
-            evals = result.get('evaluations', {})
-            bb = evals.get('bollinger', {})
-            bb_emoji = bb.get('emoji', '❓')
-            ich = evals.get('ichimoku', {})
-            ich_emoji = ich.get('emoji', '❓')
-            overall_emoji = result.get('overall_emoji', '❓')
-            
-            overall_score = result.get('overall_score', self._get_score(overall_emoji))
-            
-            current_price = result.get('current_price', 0)
-            price_change_rate = result.get('price_change_rate', 0.0)
-            
-            currency = "원" if market == "kr" else "$"
-            price_str = f"{current_price:,.0f}{currency}" if market == "kr" else f"${current_price:,.2f}"
-            
-            change_sign = "+" if price_change_rate > 0 else ""
-            change_str = f"{change_sign}{price_change_rate:.2f}%"
-            
-            if price_change_rate > 0:
-                price_color = "text-red-600"
-            elif price_change_rate < 0:
-                price_color = "text-blue-600"
-            else:
-                price_color = "text-gray-900"
-                
-            main_comment = bb.get('comment', '분석 중...')
-            
-            # AI 분석 텍스트
-            ai_analysis = result.get('llm_analysis', '')
-            ai_html = ""
-            if ai_analysis:
-                ai_html = f"""
-                                    <div class="text-sm text-indigo-800 bg-indigo-50 p-2.5 rounded-lg leading-relaxed ai-box-desktop">
-                                        <div class="ai-content">🤖 {ai_analysis}</div>
-                                        <div onclick="toggleDesktop(this)" class="ai-toggle-desktop">더보기</div>
-                                    </div>
-                """
-            
-            html += f"""
-                            <tr class="hover:bg-blue-50/30 transition-colors" data-score="{overall_score:.2f}" data-order="{idx}">
-                                <td class="px-6 py-5 min-w-[140px]">
-                                    <div class="font-bold text-gray-900 text-lg whitespace-nowrap">{main_text}</div>
-                                    <div class="text-xs text-gray-400 font-mono">{sub_text}</div>
-                                </td>
-                                <td class="px-5 py-5 min-w-[130px]">
-                                    <div class="{price_color} font-bold text-base">{price_str}</div>
-                                    <div class="{price_color} text-xs">{change_str}</div>
-                                </td>
-                                <td class="px-4 py-5 text-center text-xl w-20">{bb_emoji}</td>
-                                <td class="px-4 py-5 text-center text-xl w-20">{ich_emoji}</td>
-                                <td class="px-6 py-5">
-                                    <div class="flex items-center gap-2 mb-2">
-                                        <span class="text-lg">{overall_emoji}</span>
-                                        <span class="text-sm font-semibold text-gray-700">{overall_score:.2f} / 4.0</span>
-                                        <span class="text-gray-300">·</span>
-                                        <span class="text-sm text-gray-500">{main_comment}</span>
-                                    </div>
-                                    {ai_html}
-                                </td>
-                            </tr>
-"""
-
-        html += """
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
+        Args:
+            market: 시장
+            date: 날짜
+            results: 분석 결과 리스트
+            changes: 전 거래일 대비 변화
         
-        <div class="mt-6 text-center text-xs text-gray-400 leading-relaxed">
-            본 데이터는 기술적 분석 결과일 뿐, 투자의 책임은 본인에게 있습니다.<br>
-            볼린저 밴드는 20일 이동평균선과 ±2표준편차&#40;&sigma;&#41;를 기준으로 계산되었습니다.
-        </div>
-    </div>
-
-    <script>
-    let desktopSorted = false;
-    let mobileSorted = false;
-
-    function resetExpandedState(container) {
-        // 정렬 시 모든 확장된 항목을 접음
-        // 데스크탑
-        container.querySelectorAll('.ai-box-desktop.expanded').forEach(box => {
-            box.classList.remove('expanded');
-            const btn = box.querySelector('.ai-toggle-desktop');
-            if (btn) btn.textContent = '더보기';
-        });
-        // 모바일은 별도 처리 없음
-    }
-
-    function toggleSort(view) {
-        if (view === 'desktop') {
-            const body = document.getElementById('stockBody');
-            const rows = Array.from(body.querySelectorAll('tr'));
-            const label = document.getElementById('desktopSortLabel');
-            
-            resetExpandedState(body);
-
-            if (!desktopSorted) {
-                rows.sort((a, b) => parseFloat(b.dataset.score) - parseFloat(a.dataset.score));
-                label.textContent = '기본';
-            } else {
-                rows.sort((a, b) => parseInt(a.dataset.order) - parseInt(b.dataset.order));
-                label.textContent = '종합점수';
-            }
-            rows.forEach(row => body.appendChild(row));
-            desktopSorted = !desktopSorted;
-        } else {
-            const body = document.getElementById('mobileBody');
-            const cards = Array.from(body.children);
-            const label = document.getElementById('mobileSortLabel');
-
-            if (!mobileSorted) {
-                cards.sort((a, b) => parseFloat(b.dataset.score) - parseFloat(a.dataset.score));
-                label.textContent = '기본';
-            } else {
-                cards.sort((a, b) => parseInt(a.dataset.order) - parseInt(b.dataset.order));
-                label.textContent = '종합점수';
-            }
-            cards.forEach(card => body.appendChild(card));
-            mobileSorted = !mobileSorted;
+        Returns:
+            저장된 파일 경로
+        """
+        self.fill_llm_analysis(results)
+        filepath = self.report_path(market, date)
+        tmp = filepath.with_name(filepath.name + '.tmp')
+        
+        template, context = self._render_args(market, date, results, changes)
+        stream = template.stream(**context)
+        stream.enable_buffering(STREAM_BUFFER_SIZE)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            stream.dump(f)
+        os.replace(tmp, filepath)
+        
+        print(f"✅ 리포트 저장: {filepath}")
+        return str(filepath)
+    
+    def fill_llm_analysis(self, results: List[Dict]):
+        """LLM 개별 종목 분석 (이미 있는 llm_analysis는 재사용)"""
+        if self.llm_generator and self.llm_generator.enabled:
+            pending = [result for result in results if 'llm_analysis' not in result]
+            if pending:
+                print(f"🤖 Claude AI가 종목 분석을 시작합니다... "
+                      f"({len(pending)}종목, 동시 {self.llm_generator.max_concurrency}개)")
+                comments = self.llm_generator.generate_batch(pending)
+                for result, comment in zip(pending, comments):
+                    result['llm_analysis'] = comment
+    
+    def is_virtual(self, results: List[Dict]) -> bool:
+        """virtual 모드로 렌더링할지 여부"""
+        if self.mode == 'auto':
+            return len(results) >= self.virtual_threshold
+        return self.mode == 'virtual'
+    
+    def _render_args(self, market: str, date: str, results: List[Dict], changes: DailyChanges = None):
+        """(컴파일된 템플릿, 템플릿 변수)"""
+        if self.is_virtual(results):
+            template, context = _template("report_virtual.html.j2"), self._virtual_context(market, date, results)
+        else:
+            template, context = _template(), self._context(market, date, results)
+        context['changes'] = changes
+        context['charts'] = any('sparkline' in result for result in results)
+        return template, context
+    
+    def _virtual_context(self, market: str, date: str, results: List[Dict]) -> Dict:
+        """virtual 모드 템플릿 변수 (종목 데이터는 JSON 행 조각으로 순차 생성)"""
+        return {
+            'market_name': "한국" if market == "kr" else "미국",
+            'date': date,
+            'formatted_date': date.replace('-', '.') + '.',
+            'summary': ReportSummary.from_results(results, self.scoring, self.top_k),
+            'row_height': VIRTUAL_ROW_HEIGHT,
+            'columns': json.dumps(VIRTUAL_COLUMNS),
+            'payload': self._virtual_payload(market, results),
         }
-    }
-
-    function toggleDesktop(btn) {
-        const box = btn.closest('.ai-box-desktop');
-        const isExpanded = box.classList.toggle('expanded');
-        btn.textContent = isExpanded ? '접기' : '더보기';
-    }
-
-    // 모바일 텍스트 처리
-    function expandMobile(btn) {
-        const container = btn.parentElement;
-        const fullText = container.dataset.full;
-        container.innerHTML = `🤖 ${fullText} <span class="inline-btn" onclick="collapseMobile(this)">접기</span>`;
-    }
-
-    function collapseMobile(btn) {
-        const container = btn.parentElement;
-        const originalText = container.dataset.full;
-        const maxLength = 150;
-        const shortText = originalText.substring(0, maxLength);
-        container.innerHTML = `🤖 ${shortText}... <span class="inline-btn" onclick="expandMobile(this)">더보기</span>`;
-    }
-
-    // 초기화 로직
-    window.addEventListener('DOMContentLoaded', () => {
-        // 데스크탑 오버플로 감지
-        document.querySelectorAll('.ai-box-desktop').forEach(box => {
-            const content = box.querySelector('.ai-content');
-            content.style.webkitLineClamp = 'unset';
-            content.style.lineClamp = 'unset';
-            content.style.overflow = 'visible';
-            content.style.display = 'block';
-            const fullHeight = content.scrollHeight;
-            content.style.webkitLineClamp = '';
-            content.style.lineClamp = '';
-            content.style.overflow = '';
-            content.style.display = '';
-
-            if (fullHeight > box.clientHeight) {
-                box.classList.add('has-overflow');
-                box.querySelector('.ai-toggle-desktop').classList.add('visible');
-            }
-        });
-
-        // 모바일 텍스트 Truncate
-        document.querySelectorAll('.ai-text-mobile').forEach(el => {
-            const originalText = el.dataset.full;
-            if (!originalText) return;
-            
-            const maxLength = 150;
-            if (originalText.length > maxLength) {
-                const shortText = originalText.substring(0, maxLength);
-                el.innerHTML = `🤖 ${shortText}... <span class="inline-btn" onclick="expandMobile(this)">더보기</span>`;
-            } else {
-                el.innerHTML = `🤖 ${originalText}`;
-            }
-        });
-    });
-    </script>
-
-</body>
-</html>
-"""
-        return html
+    
+    def _virtual_payload(self, market: str, results: List[Dict]) -> Iterator[str]:
+        """
+        virtual 모드 JSON 행 (VIRTUAL_COLUMNS 순서의 배열, 쉼표로 이어 붙임)
+        
+        Returns:
+            행별 JSON 조각 이터레이터 ('<'는 \u003c로 바꿔 </script>로 끝나지 않게 함)
+        """
+        for i, result in enumerate(results):
+            row = self._row(market, result)
+            ich = result.get('evaluations', {}).get('ichimoku', {})
+            values = [
+                row.main_text, row.sub_text, row.price,
+                result.get('price_change_rate', 0.0), row.change,
+                row.bb_emoji, row.ich_emoji, row.overall_emoji, float(row.score),
+                row.mobile_comment, ich.get('comment', ''), row.ai, row.chart,
+            ]
+            chunk = json.dumps(values, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+            yield chunk if i == 0 else ',' + chunk
+    
+    def _context(self, market: str, date: str, results: List[Dict]) -> Dict:
+        """템플릿 변수 (행 데이터는 모바일 카드/데스크탑 행에서 각각 순회하며 생성)"""
+        return {
+            'market_name': "한국" if market == "kr" else "미국",
+            'date': date,
+            'formatted_date': date.replace('-', '.') + '.',
+            'summary': ReportSummary.from_results(results, self.scoring, self.top_k),
+            'rows': _Rows(self, market, results),
+        }
+    
+    def _row(self, market: str, result: Dict) -> _Row:
+        """
+        종목 1개의 표시 값
+        
+        Args:
+            market: 시장 (kr, us)
+            result: 분석 결과
+        
+        Returns:
+            템플릿 행 데이터 (텍스트 값의 HTML 이스케이프는 템플릿에서 처리)
+        """
+        name = result['name']
+        code = result['code']
+        
+        # 시장별 표시 순서
+        main_text, sub_text = (code, name) if market == 'us' else (name, code)
+        
+        # 평가 결과 추출
+        evals = result.get('evaluations', {})
+        bb = evals.get('bollinger', {})
+        ich = evals.get('ichimoku', {})
+        overall_emoji = result.get('overall_emoji', '❓')
+        
+        # 가격 정보
+        current_price = result.get('current_price', 0)
+        price_change_rate = result.get('price_change_rate', 0.0)
+        
+        if price_change_rate > 0:
+            price_color = "text-red-600"
+        elif price_change_rate < 0:
+            price_color = "text-blue-600"
+        else:
+            price_color = "text-gray-900"
+        
+        comment = bb.get('comment', '분석 중...')
+        bb_pos = bb.get('details', {}).get('position')
+        
+        # 점수 계산
+        overall_score = result.get('overall_score')
+        if overall_score is None:
+            overall_score = self._get_score(overall_emoji)
+        
+        return _Row(
+            main_text=main_text,
+            sub_text=sub_text,
+            bb_emoji=bb.get('emoji', '❓'),
+            ich_emoji=ich.get('emoji', '❓'),
+            overall_emoji=overall_emoji,
+            score=f"{overall_score:.2f}",
+            score_short=f"{overall_score:.1f}",
+            price=f"{current_price:,.0f}원" if market == "kr" else f"${current_price:,.2f}",
+            change=f"{'+' if price_change_rate > 0 else ''}{price_change_rate:.2f}%",
+            price_color=price_color,
+            comment=comment,
+            mobile_comment=f"{comment} ({bb_pos:.0f}%)" if bb_pos is not None else comment,
+            ai=result.get('llm_analysis', ''),
+            chart=result.get('sparkline', '')
+        )
+    
+    def report_path(self, market: str, date: str) -> Path:
+        """
+        리포트 파일 경로 ({output_dir}/{market}_{date}.html)
+        
+        Args:
+            market: 시장
+            date: 날짜
+        
+        Returns:
+            파일 경로
+        """
+        return self.output_dir / f"{market}_{date}.html"
     
     def save(self, market: str, date: str, content: str) -> str:
         """
@@ -529,8 +333,7 @@ class HTMLReporter:
         Returns:
             저장된 파일 경로
         """
-        filename = f"{market}_{date}.html"
-        filepath = self.output_dir / filename
+        filepath = self.report_path(market, date)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
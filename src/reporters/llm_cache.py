@@ -0,0 +1,182 @@
+"""
+LLM 해설 영구 캐시 (SQLite)
+같은 모델/프롬프트/입력에 대한 해설을 재실행, 다른 리포트 형식에서 재사용
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from metrics import METRICS
+
+
+class LLMCommentCache:
+    """
+    LLM 해설 캐시
+
+    키는 (모델, 프롬프트 버전, 프롬프트 입력값)의 해시이므로 점수/코멘트/가격이 같으면
+    날짜나 리포트 형식과 관계없이 적중합니다. 항목은 ttl이 지나면 만료되고,
+    max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    generate_batch()의 여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str = "../data/llm_cache.db", ttl: Optional[float] = 24 * 3600,
+                 max_entries: int = 5000):
+        """
+        Args:
+            path: 캐시 DB 파일 경로
+            ttl: 항목 유효 시간 (초, None 또는 0: 만료 없음)
+            max_entries: 최대 항목 수 (0: 제한 없음)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl or None
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.writes = 0
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_comments (
+                key TEXT PRIMARY KEY,
+                code TEXT NOT NULL,
+                model TEXT NOT NULL,
+                comment TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_comments_accessed ON llm_comments(accessed_at)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, version: int, inputs: Dict) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            model: 모델 이름
+            version: 프롬프트 템플릿 버전
+            inputs: 프롬프트에 들어가는 값 (JSON 직렬화 가능)
+
+        Returns:
+            SHA-256 hex
+        """
+        payload = json.dumps([model, version, inputs], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (적중 시 사용 시각 갱신)
+
+        Returns:
+            해설 또는 None (없음/만료)
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT comment, created_at FROM llm_comments WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row and self.ttl and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM llm_comments WHERE key = ?", (key,))
+                self.conn.commit()
+                self.expirations += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                METRICS.incr('llm_cache', result='miss')
+                return None
+
+            self.conn.execute("UPDATE llm_comments SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+
+        METRICS.incr('llm_cache', result='hit')
+        return row[0]
+
+    def put(self, key: str, code: str, model: str, comment: str):
+        """
+        해설 저장 (항목 수 상한을 넘으면 오래 사용하지 않은 항목 삭제)
+
+        Args:
+            key: make_key() 결과
+            code: 종목 코드
+            model: 모델 이름
+            comment: 해설
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_comments (key, code, model, comment, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, code, model, comment, now, now)
+            )
+            self.writes += 1
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """만료 항목과 상한 초과 항목 삭제 (_lock 안에서 호출)"""
+        if self.ttl:
+            cursor = self.conn.execute("DELETE FROM llm_comments WHERE created_at < ?",
+                                       (time.time() - self.ttl,))
+            self.expirations += cursor.rowcount
+
+        if self.max_entries:
+            count = self.conn.execute("SELECT COUNT(*) FROM llm_comments").fetchone()[0]
+            if count > self.max_entries:
+                cursor = self.conn.execute("""
+                    DELETE FROM llm_comments WHERE key IN (
+                        SELECT key FROM llm_comments ORDER BY accessed_at LIMIT ?
+                    )
+                """, (count - self.max_entries,))
+                self.evictions += cursor.rowcount
+
+    def clear(self) -> int:
+        """
+        전체 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM llm_comments")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계
+
+        Returns:
+            {'entries', 'hits', 'misses', 'writes', 'evictions', 'expirations', 'hit_rate'}
+        """
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM llm_comments").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """캐시 DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
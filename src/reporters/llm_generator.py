@@ -2,20 +2,63 @@
 LLM 기반 리포트 해설 생성기 (Claude API)
 """
 
+import importlib.util
+import json
 import os
-from typing import Dict
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from metrics import METRICS
+from .llm_cache import LLMCommentCache
+
+# 재시도할 HTTP 상태 (429: rate limit, 529: overloaded, 5xx: 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504, 529}
+
+# 배치 요청 크기 추정 (한글 기준 보수적으로 2자당 1토큰, 종목당 해설 2-3문장)
+CHARS_PER_TOKEN = 2
+OUTPUT_TOKENS_PER_STOCK = 250
+BATCH_OVERHEAD_TOKENS = 100
 
 
 class ClaudeCommentGenerator:
     """Claude API를 사용한 자연어 해설 생성기"""
     
-    def __init__(self, model: str = "claude-haiku-4-5", api_key: str = None):
+    # 프롬프트 템플릿 버전 (단일/배치 프롬프트 문구를 바꾸면 올려서 기존 캐시 무효화)
+    PROMPT_VERSION = 1
+    
+    def __init__(self, model: str = "claude-haiku-4-5", api_key: str = None,
+                 max_concurrency: int = 4, timeout: float = 30.0, max_retries: int = 3,
+                 backoff: float = 1.0, max_backoff: float = 20.0, base_url: str = None,
+                 cache: Optional[LLMCommentCache] = None, batch_size: int = 1,
+                 max_output_tokens: int = 4096, max_input_tokens: int = 20000):
         """
         Args:
             model: Claude 모델 (haiku 또는 sonnet)
             api_key: Anthropic API 키 (우선순위: 파라미터 > 환경변수)
+            max_concurrency: generate_batch() 동시 요청 수
+            timeout: 요청 타임아웃 (초)
+            max_retries: rate limit / 서버 오류 / 연결 오류 재시도 횟수
+            backoff: 재시도 백오프 기준 (초, 재시도마다 2배, 지터 포함)
+            max_backoff: 백오프 상한 (초)
+            base_url: API 주소 (기본값: Anthropic API, 로컬 스텁 서버 테스트용)
+            cache: 해설 영구 캐시 (None: 캐시 안 함)
+            batch_size: 한 요청에 묶을 최대 종목 수 (1: 종목별 요청, 2 이상: JSON 응답 배치 요청)
+            max_output_tokens: 배치 요청 최대 출력 토큰 (배치 크기 상한 계산)
+            max_input_tokens: 배치 요청 최대 입력 토큰 (추정치 기준)
         """
         self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.base_url = base_url
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.max_output_tokens = max_output_tokens
+        self.max_input_tokens = max_input_tokens
         
         # API 키 우선순위: 파라미터 > 환경변수
         self.api_key = api_key if api_key else os.environ.get('ANTHROPIC_API_KEY')
@@ -27,22 +70,175 @@ class ClaudeCommentGenerator:
             print("    2. ANTHROPIC_API_KEY 환경변수 설정")
             self.enabled = False
         else:
-            self.enabled = True
-            
-            # Anthropic 클라이언트 로드
-            try:
-                from anthropic import Anthropic
-                self.client = Anthropic(api_key=self.api_key)
+            # anthropic 패키지 확인만 하고, 클라이언트는 첫 호출 시 생성 (import 비용 지연)
+            if importlib.util.find_spec('anthropic') is None:
+                print("⚠️  anthropic 패키지가 설치되지 않았습니다. pip install anthropic")
+                self.enabled = False
+            else:
+                self.enabled = True
                 
                 # API 키 출처 표시
                 source = "설정파일" if api_key else "환경변수"
-                print(f"✅ Claude API 연결 성공 (출처: {source}, 모델: {self.model})")
-            except ImportError:
-                print("⚠️  anthropic 패키지가 설치되지 않았습니다. pip install anthropic")
-                self.enabled = False
+                print(f"✅ Claude API 사용 (출처: {source}, 모델: {self.model})")
+        
+        self._client = None
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> "ClaudeCommentGenerator":
+        """
+        report.yml 설정으로 생성
+        
+        Args:
+            config: 리포트 설정 (llm_model, api_key, llm_concurrency, llm_timeout,
+                    llm_max_retries, llm_base_url, llm_cache, llm_batch_size,
+                    llm_max_output_tokens)
+        """
+        cache_config = config.get('llm_cache') or {}
+        cache = None
+        if cache_config.get('enabled', True):
+            ttl_hours = cache_config.get('ttl_hours', 24)
+            cache = LLMCommentCache(
+                path=cache_config.get('path', '../data/llm_cache.db'),
+                ttl=ttl_hours * 3600 if ttl_hours else None,
+                max_entries=cache_config.get('max_entries', 5000)
+            )
+        
+        return cls(
+            model=config.get('llm_model', 'claude-haiku-4-5'),
+            api_key=(config.get('api_key') or '').strip() or None,
+            max_concurrency=config.get('llm_concurrency', 4),
+            timeout=config.get('llm_timeout', 30.0),
+            max_retries=config.get('llm_max_retries', 3),
+            base_url=(config.get('llm_base_url') or '').strip() or None,
+            cache=cache,
+            batch_size=config.get('llm_batch_size', 1),
+            max_output_tokens=config.get('llm_max_output_tokens', 4096)
+        )
+    
+    @property
+    def client(self):
+        """Anthropic 클라이언트 (첫 사용 시 생성, 재시도는 _create()에서 처리)"""
+        if self._client is None:
+            from anthropic import Anthropic
+            self._client = Anthropic(api_key=self.api_key, base_url=self.base_url,
+                                     timeout=self.timeout, max_retries=0)
+        return self._client
+    
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 대기 시간 (full jitter 지수 백오프, retry-after가 있으면 그 이상)
+        
+        Args:
+            attempt: 재시도 순번 (0부터)
+            retry_after: 서버가 알려준 대기 시간 (초)
+        
+        Returns:
+            대기 시간 (초)
+        """
+        wait = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        if retry_after is not None:
+            wait = max(wait, min(retry_after, self.max_backoff))
+        return wait
+    
+    @staticmethod
+    def _retry_reason(error: Exception) -> Optional[str]:
+        """재시도할 오류이면 사유 (rate_limit, server_error, connection), 아니면 None"""
+        from anthropic import APIConnectionError, APIStatusError
+        
+        if isinstance(error, APIStatusError):
+            if error.status_code == 429:
+                return 'rate_limit'
+            if error.status_code in RETRY_STATUS:
+                return 'server_error'
+            return None
+        if isinstance(error, APIConnectionError):  # APITimeoutError 포함
+            return 'connection'
+        return None
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        response = getattr(error, 'response', None)
+        value = response.headers.get('retry-after') if response is not None else None
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    def _create(self, prompt: str, code: str, max_tokens: int = 300) -> str:
+        """
+        Messages API 호출 (재시도 포함)
+        
+        Args:
+            prompt: 사용자 프롬프트
+            code: 종목 코드 (계측 라벨)
+            max_tokens: 최대 출력 토큰
+        
+        Returns:
+            응답 텍스트
+        
+        Raises:
+            Exception: 재시도하지 않는 오류 또는 재시도 소진
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                with METRICS.timer('llm_seconds', model=self.model, symbol=code):
+                    response = self.client.messages.create(
+                        model=self.model,
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                return response.content[0].text.strip()
             except Exception as e:
-                print(f"❌ Claude API 초기화 실패: {e}")
-                self.enabled = False
+                reason = self._retry_reason(e)
+                if reason is None or attempt == self.max_retries:
+                    raise
+                
+                METRICS.incr('llm_retries', model=self.model, reason=reason)
+                time.sleep(self.backoff_delay(attempt, self._retry_after(e)))
+    
+    def generate_batch(self, stocks: List[Dict]) -> List[str]:
+        """
+        여러 종목 해설 동시 생성 (최대 max_concurrency개 요청 동시 실행)
+        
+        캐시에 있는 종목은 API를 호출하지 않고, 종목별로 실패하면 그 종목만
+        기본 템플릿 코멘트로 대체합니다.
+        
+        Args:
+            stocks: 종목 분석 데이터 리스트
+        
+        Returns:
+            stocks와 같은 순서의 해설 리스트
+        """
+        if not self.enabled:
+            return [self._fallback_stock_comment(stock) for stock in stocks]
+        
+        comments = [self._cached(stock) for stock in stocks]
+        pending = [i for i, comment in enumerate(comments) if comment is None]
+        
+        if self.cache is not None:
+            print(f"💾 LLM 캐시 적중 {len(stocks) - len(pending)}/{len(stocks)}종목")
+        
+        if self.batch_size > 1 and len(pending) > 1:
+            # 여러 종목을 한 요청으로 (배치별 결과는 입력 순서대로 이어 붙임)
+            groups = self._batch_groups([stocks[i] for i in pending])
+            task, items = self._generate_group, groups
+            print(f"📦 {len(pending)}종목을 {len(groups)}개 요청으로 묶어 생성")
+        else:
+            task, items = self._generate, [stocks[i] for i in pending]
+        
+        if len(items) <= 1 or self.max_concurrency == 1:
+            generated = [task(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items)),
+                                    thread_name_prefix='llm') as executor:
+                generated = list(executor.map(task, items))
+        
+        if task == self._generate_group:
+            generated = [comment for group in generated for comment in group]
+        
+        for i, comment in zip(pending, generated):
+            comments[i] = comment
+        return comments
     
     def generate_stock_analysis(self, stock_data: Dict) -> str:
         """
@@ -52,47 +248,196 @@ class ClaudeCommentGenerator:
             stock_data: 종목 분석 데이터
         
         Returns:
-            2-3문장의 해설
+            2-3문장의 해설 (실패 시 기본 템플릿 코멘트)
         """
         if not self.enabled:
             return self._fallback_stock_comment(stock_data)
         
-        try:
-            # 평가 데이터 추출
-            evals = stock_data.get('evaluations', {})
-            bb = evals.get('bollinger', {})
-            ich = evals.get('ichimoku', {})
-            
-            prompt = f"""당신은 주식 애널리스트입니다. 다음 기술적 분석 결과를 바탕으로 투자자가 이해하기 쉽게 해설해주세요.
+        cached = self._cached(stock_data)
+        return cached if cached is not None else self._generate(stock_data)
+    
+    @staticmethod
+    def _prompt_inputs(stock_data: Dict) -> Dict:
+        """프롬프트에 들어가는 값 (표시 형식 그대로, 캐시 키로도 사용)"""
+        evals = stock_data.get('evaluations', {})
+        bb = evals.get('bollinger', {})
+        ich = evals.get('ichimoku', {})
+        
+        return {
+            'name': stock_data['name'],
+            'code': stock_data['code'],
+            'price': f"{stock_data['current_price']:,.0f}",
+            'change_rate': f"{stock_data.get('price_change_rate', 0):.2f}",
+            'bb_score': bb.get('score', 0),
+            'bb_comment': bb.get('comment', 'N/A'),
+            'ich_score': ich.get('score', 0),
+            'ich_comment': ich.get('comment', 'N/A'),
+            'overall_emoji': stock_data['overall_emoji'],
+            'overall_score': f"{stock_data['overall_score']:.2f}",
+        }
+    
+    @staticmethod
+    def _build_prompt(inputs: Dict) -> str:
+        """종목 해설 프롬프트 (문구를 바꾸면 PROMPT_VERSION 증가)"""
+        return f"""당신은 주식 애널리스트입니다. 다음 기술적 분석 결과를 바탕으로 투자자가 이해하기 쉽게 해설해주세요.
 
-종목: {stock_data['name']} ({stock_data['code']})
-현재가: {stock_data['current_price']:,.0f}원
-등락률: {stock_data.get('price_change_rate', 0):.2f}%
+종목: {inputs['name']} ({inputs['code']})
+현재가: {inputs['price']}원
+등락률: {inputs['change_rate']}%
 
 볼린저 밴드 분석:
-- 점수: {bb.get('score', 0)}/4.0
-- 코멘트: {bb.get('comment', 'N/A')}
+- 점수: {inputs['bb_score']}/4.0
+- 코멘트: {inputs['bb_comment']}
 
 일목균형표 분석:
-- 점수: {ich.get('score', 0)}/4.0
-- 코멘트: {ich.get('comment', 'N/A')}
+- 점수: {inputs['ich_score']}/4.0
+- 코멘트: {inputs['ich_comment']}
 
-종합 평가: {stock_data['overall_emoji']} ({stock_data['overall_score']:.2f}/4.0)
+종합 평가: {inputs['overall_emoji']} ({inputs['overall_score']}/4.0)
 
 2-3문장으로 간결하게 설명하되, 투자 시사점을 포함해주세요. 이모지는 사용하지 마세요. 마크다운 문법을 쓰지 말고 문장만 만들어."""
+    
+    @staticmethod
+    def _stock_block(inputs: Dict) -> str:
+        """배치 프롬프트의 종목 1개 부분"""
+        return f"""종목: {inputs['name']} ({inputs['code']})
+현재가: {inputs['price']}원, 등락률: {inputs['change_rate']}%
+볼린저 밴드: {inputs['bb_score']}/4.0, {inputs['bb_comment']}
+일목균형표: {inputs['ich_score']}/4.0, {inputs['ich_comment']}
+종합 평가: {inputs['overall_emoji']} ({inputs['overall_score']}/4.0)"""
+    
+    @classmethod
+    def _build_batch_prompt(cls, inputs_list: List[Dict]) -> str:
+        """여러 종목 해설 프롬프트 (종목 코드를 키로 하는 JSON 객체 응답)"""
+        blocks = "\n\n".join(cls._stock_block(inputs) for inputs in inputs_list)
+        example = ", ".join(f'"{inputs["code"]}": "해설"' for inputs in inputs_list[:2])
+        
+        return f"""당신은 주식 애널리스트입니다. 다음 종목들의 기술적 분석 결과를 바탕으로 종목마다 투자자가 이해하기 쉽게 해설해주세요.
 
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=300,
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
-            )
+각 해설은 2-3문장으로 간결하게 설명하되, 투자 시사점을 포함해주세요. 이모지는 사용하지 마세요. 마크다운 문법을 쓰지 말고 문장만 만들어.
+
+응답은 다른 설명 없이 종목 코드를 키, 해설을 값으로 하는 JSON 객체 하나만 출력하세요.
+예: {{{example}}}
+
+{blocks}"""
+    
+    def _batch_groups(self, stocks: List[Dict]) -> List[List[Dict]]:
+        """
+        배치 요청 단위로 나누기 (batch_size, 출력/입력 토큰 추정치 상한 이내)
+        
+        Args:
+            stocks: 종목 분석 데이터 리스트
+        
+        Returns:
+            입력 순서를 유지한 종목 묶음 리스트
+        """
+        limit = min(self.batch_size,
+                    max(1, (self.max_output_tokens - BATCH_OVERHEAD_TOKENS) // OUTPUT_TOKENS_PER_STOCK))
+        input_budget = (self.max_input_tokens - BATCH_OVERHEAD_TOKENS) * CHARS_PER_TOKEN
+        
+        groups, group, size = [], [], 0
+        for stock in stocks:
+            block = len(self._stock_block(self._prompt_inputs(stock))) + 2
+            if group and (len(group) >= limit or size + block > input_budget):
+                groups.append(group)
+                group, size = [], 0
+            group.append(stock)
+            size += block
+        if group:
+            groups.append(group)
+        return groups
+    
+    @staticmethod
+    def _parse_batch_response(text: str, codes: List[str]) -> Dict[str, str]:
+        """
+        배치 응답 검증
+        
+        Args:
+            text: 응답 텍스트 (코드 블록으로 감싼 JSON 허용)
+            codes: 요청한 종목 코드
+        
+        Returns:
+            {code: 해설} (요청한 코드 중 문자열 해설이 있는 항목만)
+        
+        Raises:
+            ValueError: JSON 객체가 아닌 응답
+        """
+        start, end = text.find('{'), text.rfind('}')
+        if start < 0 or end < start:
+            raise ValueError("JSON 객체가 없는 응답")
+        data = json.loads(text[start:end + 1])
+        if not isinstance(data, dict):
+            raise ValueError("JSON 객체가 아닌 응답")
+        
+        return {
+            code: data[code].strip()
+            for code in codes
+            if isinstance(data.get(code), str) and data[code].strip()
+        }
+    
+    def _generate_group(self, stocks: List[Dict]) -> List[str]:
+        """
+        여러 종목 해설을 한 요청으로 생성 후 캐시에 저장
+        
+        응답에 없거나 잘못된 종목은 종목별 요청(_generate)으로 대체합니다.
+        
+        Returns:
+            stocks와 같은 순서의 해설 리스트
+        """
+        if len(stocks) == 1:
+            return [self._generate(stocks[0])]
+        
+        codes = [stock['code'] for stock in stocks]
+        inputs_list = [self._prompt_inputs(stock) for stock in stocks]
+        max_tokens = min(self.max_output_tokens,
+                         BATCH_OVERHEAD_TOKENS + OUTPUT_TOKENS_PER_STOCK * len(stocks))
+        
+        try:
+            text = self._create(self._build_batch_prompt(inputs_list), f"batch:{codes[0]}", max_tokens)
+            parsed = self._parse_batch_response(text, codes)
+            METRICS.incr('llm_calls', model=self.model, status='ok')
+        except Exception as e:
+            print(f"⚠️  Claude API 배치 호출 실패 ({codes[0]} 외 {len(codes) - 1}종목): {e}")
+            METRICS.incr('llm_calls', model=self.model, status='error')
+            parsed = {}
+        
+        METRICS.incr('llm_batch_entries', len(parsed), status='ok')
+        METRICS.incr('llm_batch_entries', len(stocks) - len(parsed), status='missing')
+        
+        comments = []
+        for stock in stocks:
+            comment = parsed.get(stock['code'])
+            if comment is None:
+                comment = self._generate(stock)
+            elif self.cache is not None:
+                self.cache.put(self._cache_key(stock), stock['code'], self.model, comment)
+            comments.append(comment)
+        return comments
+    
+    def _cache_key(self, stock_data: Dict) -> str:
+        return LLMCommentCache.make_key(self.model, self.PROMPT_VERSION, self._prompt_inputs(stock_data))
+    
+    def _cached(self, stock_data: Dict) -> Optional[str]:
+        """캐시된 해설 (캐시 미사용/없음: None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(stock_data))
+    
+    def _generate(self, stock_data: Dict) -> str:
+        """API로 해설 생성 후 캐시에 저장 (실패 시 기본 템플릿 코멘트, 캐시 안 함)"""
+        try:
+            text = self._create(self._build_prompt(self._prompt_inputs(stock_data)), stock_data['code'])
             
-            return response.content[0].text.strip()
+            METRICS.incr('llm_calls', model=self.model, status='ok')
         
         except Exception as e:
             print(f"⚠️  Claude API 호출 실패 ({stock_data['name']}): {e}")
+            METRICS.incr('llm_calls', model=self.model, status='error')
             return self._fallback_stock_comment(stock_data)
+        
+        if self.cache is not None:
+            self.cache.put(self._cache_key(stock_data), stock_data['code'], self.model, text)
+        return text
     
     def _fallback_stock_comment(self, stock_data: Dict) -> str:
         """LLM 실패 시 기본 템플릿 코멘트"""
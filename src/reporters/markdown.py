@@ -5,32 +5,41 @@
 from datetime import datetime
 from typing import List, Dict
 from pathlib import Path
+from .changes import DailyChanges
 from .llm_generator import ClaudeCommentGenerator
+from .sparkline import data_uri
+from .summary import ReportSummary
 
 
 class MarkdownReporter:
     """마크다운 형식 리포트 생성기"""
     
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, llm_generator: ClaudeCommentGenerator = None):
         """
         Args:
             config: 리포트 설정
+            llm_generator: 공유할 LLM 생성기 (여러 형식을 함께 만들 때, 없으면 설정으로 생성)
         """
         self.config = config or {}
         self.output_dir = Path(self.config.get('output_dir', '../reports'))
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # 요약 구간 (evaluators.yml overall_scoring) 및 상위 종목 수
+        self.scoring = self.config.get('overall_scoring')
+        self.top_k = self.config.get('summary_top_k', 5)
+        
         # LLM 생성기 초기화
         use_llm = self.config.get('use_llm', False)
-        if use_llm:
-            llm_model = self.config.get('llm_model', 'claude-haiku-4-5')
-            api_key = self.config.get('api_key', '').strip() or None
-            self.llm_generator = ClaudeCommentGenerator(model=llm_model, api_key=api_key)
+        if use_llm and llm_generator is not None:
+            self.llm_generator = llm_generator
+        elif use_llm:
+            self.llm_generator = ClaudeCommentGenerator.from_config(self.config)
         else:
             self.llm_generator = None
             print("ℹ️  LLM 기능이 비활성화되었습니다.")
     
-    def generate(self, market: str, date: str, results: List[Dict]) -> str:
+    def generate(self, market: str, date: str, results: List[Dict],
+                 changes: DailyChanges = None) -> str:
         """
         리포트 생성
         
@@ -52,6 +61,7 @@ class MarkdownReporter:
                     },
                     ...
                 ]
+            changes: 전 거래일 대비 변화 (있으면 변화 섹션 포함)
         
         Returns:
             리포트 마크다운 문자열
@@ -67,14 +77,23 @@ class MarkdownReporter:
             ""
         ]
         
-        # 테이블 헤더
-        lines.extend([
-            "| 종목명 | 볼린저밴드 | 일목균형표 | 평가 | 기타 |",
-            "|--------|-----------|-----------|------|------|"
-        ])
+        # 테이블 헤더 (스파크라인이 있으면 차트 컬럼 추가, data URI 이미지)
+        charts = any('sparkline' in result for result in results)
+        if charts:
+            lines.extend([
+                "| 종목명 | 차트 | 볼린저밴드 | 일목균형표 | 평가 | 기타 |",
+                "|--------|------|-----------|-----------|------|------|"
+            ])
+        else:
+            lines.extend([
+                "| 종목명 | 볼린저밴드 | 일목균형표 | 평가 | 기타 |",
+                "|--------|-----------|-----------|------|------|"
+            ])
         
-        # 종목별 행
+        # 종목별 행 (요약 통계도 같은 순회에서 집계)
+        summary = ReportSummary(self.scoring, self.top_k, keep_names=True)
         for result in results:
+            summary.add(result)
             name = result['name']
             evals = result['evaluations']
             
@@ -98,7 +117,14 @@ class MarkdownReporter:
             
             other = f"💰 {price_str} | {bb_comment} | {ich_comment}"
             
-            lines.append(f"| {name} | {bb_emoji} | {ich_emoji} | {overall} | {other} |")
+            if charts:
+                chart = f"![{name}]({data_uri(result['sparkline'])})" if 'sparkline' in result else ""
+                lines.append(f"| {name} | {chart} | {bb_emoji} | {ich_emoji} | {overall} | {other} |")
+            else:
+                lines.append(f"| {name} | {bb_emoji} | {ich_emoji} | {overall} | {other} |")
+        
+        if charts:
+            lines.extend(["", "*차트: 최근 종가선과 볼린저 밴드(보라), 일목균형표 구름(초록: 양운, 회색: 음운)*"])
         
         # 종합 평가
         lines.extend([
@@ -110,27 +136,29 @@ class MarkdownReporter:
         ])
         
         # 최고 평가 종목
-        best = max(results, key=lambda x: x.get('overall_score', 0), default=None)
+        best = summary.best
         if best:
             lines.append(f"- **최고 평가** {best['overall_emoji']}: {best['name']}")
         
-        # 긍정적 종목 (score >= 2.75)
-        positive = [r for r in results if r.get('overall_score', 0) >= 2.75]
+        # 상위 종목
+        if len(summary.top) > 1:
+            names = ", ".join(f"{r['name']} ({r.get('overall_score', 0):.2f})" for r in summary.top)
+            lines.append(f"- **상위 {len(summary.top)}종목**: {names}")
+        
+        # 긍정적 종목 (thumbs_up 이상)
+        positive = summary.signal_names('strong_buy', 'buy')
         if positive:
-            names = ", ".join([r['name'] for r in positive])
-            lines.append(f"- **긍정적** 👍: {names}")
+            lines.append(f"- **긍정적** 👍: {', '.join(positive)}")
         
-        # 중립 종목
-        neutral = [r for r in results if 2.0 <= r.get('overall_score', 0) < 2.75]
+        # 중립 종목 (thinking 이상 thumbs_up 미만)
+        neutral = summary.signal_names('hold')
         if neutral:
-            names = ", ".join([r['name'] for r in neutral])
-            lines.append(f"- **중립** 👌: {names}")
+            lines.append(f"- **중립** 👌: {', '.join(neutral)}")
         
-        # 부정적 종목
-        negative = [r for r in results if r.get('overall_score', 0) < 2.0]
+        # 부정적 종목 (thinking 미만)
+        negative = summary.signal_names('sell')
         if negative:
-            names = ", ".join([r['name'] for r in negative])
-            lines.append(f"- **주의** 👎: {names}")
+            lines.append(f"- **주의** 👎: {', '.join(negative)}")
         
         # 시황 요약
         lines.extend([
@@ -140,13 +168,15 @@ class MarkdownReporter:
         ])
         
         # 통계
-        total = len(results)
-        strong_buy = len([r for r in results if r.get('overall_score', 0) >= 3.5])
-        buy = len([r for r in results if 2.75 <= r.get('overall_score', 0) < 3.5])
-        hold = len([r for r in results if 2.0 <= r.get('overall_score', 0) < 2.75])
-        sell = len([r for r in results if r.get('overall_score', 0) < 2.0])
+        strong_buy = summary.signals['strong_buy']
+        buy = summary.signals['buy']
+        hold = summary.signals['hold']
+        sell = summary.signals['sell']
         
-        lines.append(f"- 총 {total}개 종목 분석")
+        lines.append(f"- 총 {summary.total}개 종목 분석")
+        if summary.total:
+            lines.append(f"- 평균 점수 {summary.mean_score:.2f} (최저 {summary.min_score:.2f}, 최고 {summary.max_score:.2f})")
+            lines.append("- 평가 분포: " + " · ".join(f"{emoji} {count}" for emoji, count in summary.distribution()))
         if strong_buy > 0:
             lines.append(f"- 강한 매수 신호 🔥: {strong_buy}개")
         if buy > 0:
@@ -156,14 +186,21 @@ class MarkdownReporter:
         if sell > 0:
             lines.append(f"- 주의/매도 고려 👎: {sell}개")
         
+        # 전일 대비 변화
+        if changes is not None:
+            lines.append("")
+            lines.extend(changes.markdown_lines())
+        
         
         
         # 종목별 상세 분석 (LLM 활성화 시)
         if self.llm_generator and self.llm_generator.enabled:
             lines.extend(["", "---", "", "## 📝 종목별 상세 분석", ""])
             
+            self.fill_llm_analysis(results)
+            
             for result in results:
-                stock_comment = self.llm_generator.generate_stock_analysis(result)
+                stock_comment = result['llm_analysis']
                 price = result.get('current_price', 0)
                 change_rate = result.get('price_change_rate', 0)
                 price_str = f"{price:,.0f}원" if market == "kr" else f"${price:,.2f}"
@@ -186,6 +223,26 @@ class MarkdownReporter:
         
         return "\n".join(lines)
     
+    def fill_llm_analysis(self, results: List[Dict]):
+        """LLM 개별 종목 분석 (다른 리포터가 이미 생성한 llm_analysis는 재사용)"""
+        if self.llm_generator and self.llm_generator.enabled:
+            pending = [result for result in results if 'llm_analysis' not in result]
+            for result, comment in zip(pending, self.llm_generator.generate_batch(pending)):
+                result['llm_analysis'] = comment
+    
+    def report_path(self, market: str, date: str) -> Path:
+        """
+        리포트 파일 경로 ({output_dir}/{market}_{date}.md)
+        
+        Args:
+            market: 시장
+            date: 날짜
+        
+        Returns:
+            파일 경로
+        """
+        return self.output_dir / f"{market}_{date}.md"
+    
     def save(self, market: str, date: str, content: str) -> str:
         """
         리포트 파일로 저장
@@ -198,14 +255,29 @@ class MarkdownReporter:
         Returns:
             저장된 파일 경로
         """
-        filename = f"{market}_{date}.md"
-        filepath = self.output_dir / filename
+        filepath = self.report_path(market, date)
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(content)
         
         print(f"✅ 리포트 저장: {filepath}")
         return str(filepath)
+    
+    def write(self, market: str, date: str, results: List[Dict],
+              changes: DailyChanges = None) -> str:
+        """
+        리포트 생성 후 파일로 저장
+        
+        Args:
+            market: 시장
+            date: 날짜
+            results: 분석 결과 리스트
+            changes: 전 거래일 대비 변화
+        
+        Returns:
+            저장된 파일 경로
+        """
+        return self.save(market, date, self.generate(market, date, results, changes))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,467 @@
+"""
+종목별 미니 차트 (인라인 SVG 스파크라인)
+저장된 주가 배열로 종가, 볼린저 밴드, 일목균형표 구름을 NumPy로 한 번에 계산해 SVG로 만들고,
+(종목 코드, 마지막 일봉, 차트 설정) 키로 SQLite에 캐시 (Markdown/HTML 공용)
+"""
+
+import base64
+import hashlib
+import json
+import sqlite3
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from metrics import METRICS
+from storage.base import decode_date
+
+# SVG 모양이 바뀌면 올려서 기존 캐시 무효화
+SPARKLINE_VERSION = 1
+
+# viewBox 좌표 (정수 좌표로 SVG를 짧게 유지, 표시 크기는 width/height 속성)
+VIEW_HEIGHT = 60
+X_STEP = 3
+PAD = 2
+
+# 한 번에 계산하는 종목 수 (볼린저 표준편차 임시 배열 크기 제한)
+RENDER_BATCH = 1000
+
+COLORS = {
+    'up': '#dc2626',       # 기간 상승 종가선
+    'down': '#2563eb',     # 기간 하락 종가선
+    'band': '#6366f1',     # 볼린저 밴드
+    'bull': '#16a34a',     # 양운 (선행스팬1 >= 선행스팬2)
+    'bear': '#9ca3af',     # 음운
+}
+
+
+def data_uri(svg: str) -> str:
+    """SVG를 Markdown 이미지용 data URI로 변환"""
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode('utf-8')).decode('ascii')
+
+
+class SparklineCache:
+    """
+    스파크라인 캐시
+
+    종목당 최신 차트 1개만 보관합니다 (새 일봉이 들어오면 같은 종목 행을 덮어씀).
+    따라서 항목 수는 종목 수를 넘지 않고, 조회/저장은 리포트 1개당 쿼리 한 번입니다.
+    """
+
+    def __init__(self, path: str = "../data/chart_cache.db"):
+        """
+        Args:
+            path: 캐시 DB 파일 경로
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sparklines (
+                code TEXT PRIMARY KEY,
+                key TEXT NOT NULL,
+                svg TEXT NOT NULL,
+                created_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def get_many(self, keys: Dict[str, str]) -> Dict[str, str]:
+        """
+        캐시 일괄 조회
+
+        Args:
+            keys: {종목 코드: 캐시 키}
+
+        Returns:
+            {종목 코드: SVG} (키가 같은 종목만)
+        """
+        if not keys:
+            return {}
+        rows = self.conn.execute("""
+            SELECT s.code, s.svg FROM sparklines s
+            JOIN json_each(?) k ON s.code = k.key
+            WHERE s.key = k.value
+        """, (json.dumps(keys),)).fetchall()
+
+        found = dict(rows)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        METRICS.incr('chart_cache', len(found), result='hit')
+        METRICS.incr('chart_cache', len(keys) - len(found), result='miss')
+        return found
+
+    def put_many(self, rows: Iterable[Tuple[str, str, str]]):
+        """
+        캐시 일괄 저장 (종목별 이전 차트 교체)
+
+        Args:
+            rows: [(종목 코드, 캐시 키, SVG), ...]
+        """
+        now = time.time()
+        cursor = self.conn.executemany(
+            "INSERT OR REPLACE INTO sparklines (code, key, svg, created_at) VALUES (?, ?, ?, ?)",
+            ((code, key, svg, now) for code, key, svg in rows)
+        )
+        self.writes += max(cursor.rowcount, 0)
+        self.conn.commit()
+
+    def clear(self) -> int:
+        """
+        전체 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        cursor = self.conn.execute("DELETE FROM sparklines")
+        self.conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계
+
+        Returns:
+            {'entries', 'hits', 'misses', 'writes', 'hit_rate'}
+        """
+        entries = self.conn.execute("SELECT COUNT(*) FROM sparklines").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """캐시 DB 연결 종료"""
+        self.conn.close()
+
+
+class SparklineRenderer:
+    """
+    스파크라인 생성기
+
+    최근 days개 일봉의 종가선, 볼린저 밴드, 일목균형표 구름(선행스팬1/2)을 그립니다.
+    지표 계산 방식과 기간은 평가 도구(BollingerEvaluator, IchimokuEvaluator)와 같으므로
+    차트의 밴드/구름 위치가 리포트의 평가 emoji와 일치합니다. 좌표는 여러 종목을 행렬로 묶어
+    배열 연산으로 한 번에 계산하고 종목별로는 문자열만 이어 붙이므로, 새로 그려도 종목당
+    약 0.2ms이고 캐시에 있는 종목은 조회만 합니다.
+    """
+
+    def __init__(self, config: Dict = None, bollinger: Dict = None, ichimoku: Dict = None,
+                 cache: Optional[SparklineCache] = None):
+        """
+        Args:
+            config: report.yml charts 설정 (days, width, height)
+            bollinger: evaluators.yml bollinger 설정 (period, std_multiplier)
+            ichimoku: evaluators.yml ichimoku 설정 (conversion_period, base_period, span_b_period)
+            cache: 스파크라인 캐시 (None: 캐시 안 함)
+        """
+        import numpy as np  # numpy가 없으면 ImportError (호출 측에서 차트 비활성화)
+        self.np = np
+
+        config = config or {}
+        bollinger = bollinger or {}
+        ichimoku = ichimoku or {}
+
+        self.days = config.get('days', 40)
+        self.width = config.get('width', 120)
+        self.height = config.get('height', 32)
+        self.bb_period = bollinger.get('period', 20)
+        self.bb_std = bollinger.get('std_multiplier', 2.0)
+        self.conversion_period = ichimoku.get('conversion_period', 9)
+        self.base_period = ichimoku.get('base_period', 26)
+        self.span_b_period = ichimoku.get('span_b_period', 52)
+        self.cache = cache
+
+        # 캐시 키에 들어가는 설정 (하나라도 바뀌면 모든 차트를 다시 생성)
+        self.params = {
+            'version': SPARKLINE_VERSION,
+            'days': self.days,
+            'size': [self.width, self.height],
+            'bollinger': [self.bb_period, self.bb_std],
+            'ichimoku': [self.conversion_period, self.base_period, self.span_b_period],
+        }
+        self._params_key = json.dumps(self.params, sort_keys=True)
+
+        # 좌표 정수 -> 문자열 표 (가로 최대 (days - 1) * X_STEP, 세로 최대 VIEW_HEIGHT)
+        self._numbers = tuple(map(str, range(max(self.days * X_STEP, VIEW_HEIGHT) + 1)))
+
+        self.rendered = 0
+        self.cached = 0
+
+    @classmethod
+    def from_config(cls, report_config: Dict, evaluators_config: Dict) -> "SparklineRenderer":
+        """
+        설정 파일로 생성 (report.yml charts, evaluators.yml bollinger/ichimoku)
+
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        """
+        config = report_config.get('charts', {}) or {}
+        renderer = cls(config, evaluators_config.get('bollinger'), evaluators_config.get('ichimoku'))
+        if config.get('cache', True):
+            renderer.cache = SparklineCache(config.get('cache_path', '../data/chart_cache.db'))
+        return renderer
+
+    @property
+    def lookback(self) -> int:
+        """차트 1개에 필요한 일봉 수 (표시 기간 + 지표 계산 기간)"""
+        return self.days + max(self.bb_period, self.span_b_period) - 1
+
+    def scan_start(self, date: str) -> str:
+        """
+        lookback개 일봉을 읽기 위한 조회 시작일 (주말/휴장일 여유 포함)
+
+        Args:
+            date: 기준 날짜 (YYYY-MM-DD)
+        """
+        days = self.lookback * 7 // 5 + 14
+        return (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=days)).strftime('%Y-%m-%d')
+
+    def make_key(self, code: str, last_date: str, last_close: float) -> str:
+        """
+        캐시 키 (종목 코드, 마지막 일봉, 차트 설정)
+
+        Returns:
+            SHA-256 hex
+        """
+        payload = f"{code}|{last_date}|{last_close!r}|{self._params_key}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def render_columns(self, columns: Dict[str, list]) -> Dict[str, str]:
+        """
+        스캔 결과로 종목별 스파크라인 생성 (캐시 적중 종목은 다시 그리지 않음)
+
+        Args:
+            columns: StockDatabase.scan_prices() 결과 (code, date 오름차순)
+
+        Returns:
+            {종목 코드: SVG}
+        """
+        # 종목별 최근 lookback개 일봉 구간 (code 오름차순이므로 종목 경계는 이진 탐색)과 캐시 키
+        codes = columns['code']
+        spans = {}
+        keys = {}
+        first = 0
+        while first < len(codes):
+            code = codes[first]
+            last = bisect_right(codes, code, first)
+            spans[code] = (max(first, last - self.lookback), last)
+            keys[code] = self.make_key(code, decode_date(int(columns['date'][last - 1])),
+                                       float(columns['close'][last - 1]))
+            first = last
+
+        charts = self.cache.get_many(keys) if self.cache is not None else {}
+        self.cached += len(charts)
+
+        # 캐시에 없는 종목만 RENDER_BATCH개씩 묶어 한 번에 계산
+        pending = [code for code in spans if code not in charts]
+        new = []
+        for start in range(0, len(pending), RENDER_BATCH):
+            codes = pending[start:start + RENDER_BATCH]
+            series = {name: [columns[name][slice(*spans[code])] for code in codes]
+                      for name in ('high', 'low', 'close')}
+            for code, svg in zip(codes, self.render_many(series['high'], series['low'], series['close'])):
+                charts[code] = svg
+                new.append((code, keys[code], svg))
+        self.rendered += len(new)
+
+        if new and self.cache is not None:
+            self.cache.put_many(new)
+        return charts
+
+    def render(self, highs: Sequence[float], lows: Sequence[float], closes: Sequence[float]) -> str:
+        """
+        스파크라인 SVG 1개 생성
+
+        Args:
+            highs: 고가 (오래된 순)
+            lows: 저가 (오래된 순)
+            closes: 종가 (오래된 순)
+
+        Returns:
+            SVG 문자열
+        """
+        return self.render_many([highs], [lows], [closes])[0]
+
+    def render_many(self, highs: List[Sequence[float]], lows: List[Sequence[float]],
+                    closes: List[Sequence[float]]) -> List[str]:
+        """
+        여러 종목 스파크라인 SVG 생성
+
+        종목별 일봉을 왼쪽을 NaN으로 채운 (종목 수 x 일봉 수) 행렬로 만들어 밴드/구름/세로 좌표를
+        모든 종목에 대해 한 번에 계산하고, 종목별로는 정수 좌표를 문자열로 잇기만 합니다.
+
+        Args:
+            highs: 종목별 고가 (오래된 순, 종목마다 길이가 달라도 됨)
+            lows: 종목별 저가
+            closes: 종목별 종가
+
+        Returns:
+            종목 순서의 SVG 문자열 리스트 (width x height, 일봉이 없으면 빈 SVG)
+        """
+        np = self.np
+        rows = len(closes)
+        n = max((len(values) for values in closes), default=0)
+        if n == 0:
+            return [self._svg(np.empty(0), 0, np.empty(0), (), (), False, False, False)] * rows
+
+        def matrix(series):
+            values = np.full((rows, n), np.nan)
+            for row, data in enumerate(series):
+                if len(data):
+                    values[row, n - len(data):] = data
+            return values
+
+        highs, lows, closes = matrix(highs), matrix(lows), matrix(closes)
+        view = np.lib.stride_tricks.sliding_window_view
+
+        # 볼린저 밴드 (BollingerEvaluator.evaluate_history와 같은 표본 표준편차, 일봉이 부족한 구간은 NaN)
+        upper = np.full((rows, n), np.nan)
+        lower = np.full((rows, n), np.nan)
+        period = self.bb_period
+        if 2 <= period <= n:
+            windows = view(closes, period, axis=1)
+            sma = windows.mean(axis=2)
+            std = windows.std(axis=2, ddof=1)
+            upper[:, period - 1:] = sma + std * self.bb_std
+            lower[:, period - 1:] = sma - std * self.bb_std
+
+        # 일목균형표 구름 (IchimokuEvaluator와 같이 해당 시점 값, 선행스팬2가 부족하면 선행스팬1로 대체)
+        def midpoint(period: int):
+            values = np.full((rows, n), np.nan)
+            if 0 < period <= n:
+                values[:, period - 1:] = (view(highs, period, axis=1).max(axis=2)
+                                          + view(lows, period, axis=1).min(axis=2)) / 2
+            return values
+
+        span_a = (midpoint(self.conversion_period) + midpoint(self.base_period)) / 2
+        span_b = midpoint(self.span_b_period)
+        span_b = np.where(np.isnan(span_b), span_a, span_b)
+        floor = np.fmin(span_a, span_b)
+
+        # 표시 구간: 최근 days개 중 밴드가 계산된 시점부터 (밴드가 없는 종목은 종가가 있는 구간 전체)
+        window = slice(max(0, n - self.days), n)
+        closes, upper, lower = closes[:, window], upper[:, window], lower[:, window]
+        span_a, span_b, floor = span_a[:, window], span_b[:, window], floor[:, window]
+        shown = ~np.isnan(closes) & (~np.isnan(upper) | np.isnan(upper).all(axis=1, keepdims=True))
+        starts = np.where(shown.any(axis=1), shown.argmax(axis=1), shown.shape[1])
+        hidden = np.arange(shown.shape[1]) < starts[:, None]
+        for values in (closes, upper, lower, span_a, span_b, floor):
+            values[hidden] = np.nan
+
+        # 세로 좌표: 종목별 표시 구간 전체 값의 최저/최고를 viewBox 높이에 맞춤
+        with np.errstate(invalid='ignore'):
+            stacked = np.stack((closes, upper, lower, span_a, span_b))
+            empty = np.isnan(stacked).all(axis=(0, 2))
+            stacked[:, empty, :] = 0.0
+            low = np.nanmin(stacked, axis=(0, 2))[:, None]
+            high = np.nanmax(stacked, axis=(0, 2))[:, None]
+            scale = np.where(high > low, (VIEW_HEIGHT - 2 * PAD) / np.where(high > low, high - low, 1.0), 0.0)
+            ys = np.rint(np.where(scale > 0, PAD + (high - stacked) * scale, VIEW_HEIGHT // 2))
+            ys[np.isnan(stacked)] = np.nan
+        y_close, y_upper, y_lower, y_span_a, y_span_b = ys
+        y_floor = np.fmin(y_span_a, y_span_b)
+
+        def first_defined(values):
+            # 종목별 값이 처음 있는 위치 (없으면 -1)
+            defined = ~np.isnan(values)
+            return np.where(defined.any(axis=1), defined.argmax(axis=1), -1)
+
+        band_from = first_defined(y_upper)
+        cloud_from = first_defined(y_span_a)
+        bull = (span_a > floor).any(axis=1)
+        bear = (span_b > floor).any(axis=1)
+        rising = closes[np.arange(rows), np.minimum(starts, closes.shape[1] - 1)] <= closes[:, -1]
+
+        xs = np.arange(closes.shape[1]) * X_STEP
+        return [self._svg(xs, starts[row], y_close[row], (band_from[row], y_upper[row], y_lower[row]),
+                          (cloud_from[row], y_span_a[row], y_span_b[row], y_floor[row]),
+                          bull[row], bear[row], rising[row])
+                for row in range(rows)]
+
+    def _svg(self, xs, start: int, close, band: Tuple, cloud: Tuple,
+             bull: bool, bear: bool, rising: bool) -> str:
+        """
+        종목 1개의 SVG 문자열 생성
+
+        Args:
+            xs: 가로 좌표 (표시 구간 첫 일봉이 0)
+            start: 표시 구간 시작 위치 (그 앞은 NaN)
+            close: 종가 세로 좌표
+            band: (값이 처음 있는 위치 또는 -1, 상단 세로 좌표, 하단 세로 좌표)
+            cloud: (값이 처음 있는 위치 또는 -1, 선행스팬1, 선행스팬2, 둘 중 아래쪽 세로 좌표)
+            bull: 양운 구간 존재 여부
+            bear: 음운 구간 존재 여부
+            rising: 표시 구간 종가 상승 여부
+        """
+        count = len(close) - start
+        head = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                f'viewBox="0 0 {max(count - 1, 1) * X_STEP} {VIEW_HEIGHT}" preserveAspectRatio="none">')
+        if count <= 0:
+            return head + '</svg>'
+
+        np = self.np
+
+        def points(x, y) -> str:
+            # "x1 y1 x2 y2 ..." (SVG points는 공백 구분 숫자 쌍, 정수 문자열은 미리 만든 표에서 조회)
+            pairs = np.empty(2 * len(x), dtype=np.intp)
+            pairs[0::2] = x
+            pairs[1::2] = y
+            return ' '.join(map(self._numbers.__getitem__, pairs.tolist()))
+
+        def area(first: int, top, bottom) -> str:
+            # 위쪽 선을 왼쪽->오른쪽, 아래쪽 선을 오른쪽->왼쪽으로 이은 다각형 (값이 있는 구간만)
+            if first < 0:
+                return ''
+            x = xs[first - start:count]
+            return points(np.concatenate((x, x[::-1])), np.concatenate((top[first:], bottom[first:][::-1])))
+
+        parts = [head]
+
+        # 양운/음운: 구간마다 두 선 중 위쪽까지 채우고 반대쪽은 높이 0
+        cloud_from, span_a, span_b, floor = cloud
+        if bull:
+            parts.append(f'<polygon points="{area(cloud_from, span_a, floor)}" fill="{COLORS["bull"]}" '
+                         f'fill-opacity=".2"/>')
+        if bear:
+            parts.append(f'<polygon points="{area(cloud_from, span_b, floor)}" fill="{COLORS["bear"]}" '
+                         f'fill-opacity=".2"/>')
+
+        band_points = area(*band)
+        if band_points:
+            parts.append(f'<polygon points="{band_points}" fill="{COLORS["band"]}" fill-opacity=".12"/>')
+
+        color = COLORS['up'] if rising else COLORS['down']
+        parts.append(f'<polyline points="{points(xs[:count], close[start:])}" fill="none" stroke="{color}" '
+                     f'stroke-width="1.2" vector-effect="non-scaling-stroke"/>')
+        parts.append('</svg>')
+        return ''.join(parts)
+
+    def stats(self) -> Dict:
+        """
+        생성 통계
+
+        Returns:
+            {'rendered', 'cached'} (+ 캐시 통계)
+        """
+        stats = {'rendered': self.rendered, 'cached': self.cached}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+    def close(self):
+        """캐시 DB 연결 종료"""
+        if self.cache is not None:
+            self.cache.close()
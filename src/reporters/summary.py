@@ -0,0 +1,181 @@
+"""
+리포트 요약 통계
+분석 결과를 한 번 순회하며 종합 평가 구간별 개수, 신호별 종목, 상위 종목, 점수 분포를 계산 (Markdown/HTML 공용)
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from evaluators.base import BaseEvaluator, OVERALL_EMOJIS
+
+# 요약 신호: 이름 -> (하한 구간 키, 상한 구간 키), None은 제한 없음
+SIGNALS = {
+    'strong_buy': ('fire_fire', None),
+    'buy': ('thumbs_up', 'fire_fire'),
+    'hold': ('thinking', 'thumbs_up'),
+    'sell': (None, 'thinking'),
+}
+
+
+def signal_ranges(thresholds: List[Tuple[float, str]]) -> List[Tuple[str, Optional[float], Optional[float]]]:
+    """
+    신호별 점수 범위
+
+    Args:
+        thresholds: BaseEvaluator.overall_thresholds() 결과
+
+    Returns:
+        [(신호 이름, 하한 또는 None, 상한 또는 None), ...] SIGNALS 순서
+    """
+    limits = {key: threshold for threshold, key in thresholds}
+    return [(name, limits[low] if low else None, limits[high] if high else None)
+            for name, (low, high) in SIGNALS.items()]
+
+
+def bucket_of(score: float, thresholds: List[Tuple[float, str]]) -> int:
+    """
+    점수가 속한 구간 순위 (0: 가장 높은 구간, 가장 낮은 구간 하한보다 낮아도 마지막 구간)
+
+    Args:
+        score: 종합 점수
+        thresholds: BaseEvaluator.overall_thresholds() 결과
+    """
+    for rank, (threshold, _) in enumerate(thresholds):
+        if score >= threshold:
+            return rank
+    return len(thresholds) - 1
+
+
+def signal_of(score: float, ranges: List[Tuple[str, Optional[float], Optional[float]]]) -> str:
+    """
+    점수의 신호 이름
+
+    Args:
+        score: 종합 점수
+        ranges: signal_ranges() 결과
+    """
+    for name, low, high in ranges:
+        if (low is None or score >= low) and (high is None or score < high):
+            return name
+    return ranges[-1][0]
+
+
+class ReportSummary:
+    """
+    리포트 요약 집계기
+
+    add()로 종목을 하나씩 넣으면 구간/신호별 개수와 점수 합계를 갱신하고, 상위 종목은 크기 top_k의
+    힙으로 유지하므로 종목 수 n에 대해 O(n log k)입니다. 구간 경계는 evaluators.yml의
+    overall_scoring을 따르며, 종합 평가 emoji(BaseEvaluator.get_overall_emoji)와 같은 구간입니다.
+    """
+
+    def __init__(self, scoring: Dict = None, top_k: int = 5, keep_names: bool = False):
+        """
+        Args:
+            scoring: evaluators.yml overall_scoring (없으면 기본 구간)
+            top_k: 상위 종목 수
+            keep_names: 신호별 종목명 목록 보관 여부 (종목 수에 비례하는 메모리)
+        """
+        self.thresholds = BaseEvaluator.overall_thresholds(scoring)
+        self.top_k = top_k
+
+        self._signals = signal_ranges(self.thresholds)
+
+        self.total = 0
+        self.score_sum = 0.0
+        self.min_score: Optional[float] = None
+        self.max_score: Optional[float] = None
+        self.buckets = {key: 0 for _, key in self.thresholds}
+        self.signals = {name: 0 for name in SIGNALS}
+        self.names = {name: [] for name in SIGNALS} if keep_names else None
+        self._top: List[Tuple[float, int, Dict]] = []
+
+    @classmethod
+    def from_results(cls, results: Iterable[Dict], scoring: Dict = None, top_k: int = 5,
+                     keep_names: bool = False) -> "ReportSummary":
+        """
+        분석 결과 전체로 요약 생성
+
+        Args:
+            results: 분석 결과 리스트
+            scoring: evaluators.yml overall_scoring
+            top_k: 상위 종목 수
+            keep_names: 신호별 종목명 목록 보관 여부
+
+        Returns:
+            ReportSummary
+        """
+        summary = cls(scoring, top_k, keep_names)
+        for result in results:
+            summary.add(result)
+        return summary
+
+    def add(self, result: Dict):
+        """
+        종목 1개 집계
+
+        Args:
+            result: 분석 결과 ('overall_score', 'name')
+        """
+        score = result.get('overall_score', 0)
+        index = self.total
+        self.total += 1
+        self.score_sum += score
+        if self.min_score is None or score < self.min_score:
+            self.min_score = score
+        if self.max_score is None or score > self.max_score:
+            self.max_score = score
+
+        self.buckets[self.thresholds[bucket_of(score, self.thresholds)][1]] += 1
+
+        signal = signal_of(score, self._signals)
+        self.signals[signal] += 1
+        if self.names is not None:
+            self.names[signal].append((index, result['name']))
+
+        # 점수가 같으면 먼저 나온 종목 우선 (-index가 클수록 앞)
+        if self.top_k > 0:
+            entry = (score, -index, result)
+            if len(self._top) < self.top_k:
+                heapq.heappush(self._top, entry)
+            elif entry[:2] > self._top[0][:2]:
+                heapq.heapreplace(self._top, entry)
+
+    @property
+    def top(self) -> List[Dict]:
+        """상위 종목 (점수 내림차순)"""
+        return [result for _, _, result in sorted(self._top, key=lambda entry: entry[:2], reverse=True)]
+
+    @property
+    def best(self) -> Optional[Dict]:
+        """최고 평가 종목 (없으면 None)"""
+        top = self.top
+        return top[0] if top else None
+
+    @property
+    def mean_score(self) -> float:
+        """평균 종합 점수"""
+        return self.score_sum / self.total if self.total else 0.0
+
+    def distribution(self) -> List[Tuple[str, int]]:
+        """
+        구간별 종목 수 (높은 구간부터)
+
+        Returns:
+            [(emoji, 종목 수), ...]
+        """
+        return [(OVERALL_EMOJIS[key], self.buckets[key]) for _, key in self.thresholds]
+
+    def signal_names(self, *signals: str) -> List[str]:
+        """
+        신호별 종목명 (결과 순서, keep_names=True 필요)
+
+        Args:
+            signals: SIGNALS 이름 (여러 개면 결과 순서로 합침)
+
+        Returns:
+            종목명 리스트
+        """
+        if self.names is None:
+            raise ValueError("keep_names=True로 생성한 요약에서만 종목명을 조회할 수 있습니다")
+        return [name for _, name in heapq.merge(*(self.names[signal] for signal in signals))]
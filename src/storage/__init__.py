@@ -0,0 +1,23 @@
+"""주가 저장소 모듈"""
+
+from .base import PriceStore
+from .sqlite_store import SQLitePriceStore
+
+__all__ = ['PriceStore', 'SQLitePriceStore', 'ParquetPriceStore', 'MmapPriceCache', 'PriceSeries']
+
+# pyarrow / numpy 기반 구현은 첫 사용 시점에 import
+# (설치되지 않았으면 from storage import ... 에서 ImportError)
+_LAZY = {
+    'ParquetPriceStore': '.parquet_store',
+    'MmapPriceCache': '.mmap_store',
+    'PriceSeries': '.mmap_store',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
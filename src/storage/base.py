@@ -0,0 +1,99 @@
+"""
+주가(OHLCV) 저장소 베이스 클래스
+StockDatabase는 이 인터페이스를 통해 주가 데이터를 저장/조회
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Optional, Iterable, Iterator
+
+
+# scan() 결과 컬럼 순서
+SCAN_COLUMNS = ('code', 'market', 'date', 'open', 'high', 'low', 'close', 'volume')
+
+
+def encode_date(date: str) -> int:
+    """'YYYY-MM-DD' -> YYYYMMDD 정수"""
+    return int(date.replace('-', ''))
+
+
+def decode_date(value: int) -> str:
+    """YYYYMMDD 정수 -> 'YYYY-MM-DD'"""
+    return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
+
+
+class PriceStore(ABC):
+    """주가 저장소 추상 베이스 클래스"""
+
+    @abstractmethod
+    def save_price_data(self, code: str, market: str, data: List[Dict]):
+        """
+        주가 데이터 저장 (같은 종목/날짜는 덮어씀)
+
+        Args:
+            code: 종목 코드
+            market: 시장 (KRX, NASDAQ, NYSE 등)
+            data: 주가 데이터 리스트 [{'date': '2026-02-10', 'open': 100, ...}, ...]
+        """
+        pass
+
+    @abstractmethod
+    def get_price_data(self, code: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, limit: int = 60) -> List[Dict]:
+        """
+        주가 데이터 조회
+
+        Returns:
+            [{'code', 'market', 'date': 'YYYY-MM-DD', 'open', 'high', 'low', 'close', 'volume'}, ...] (최신 순)
+        """
+        pass
+
+    @abstractmethod
+    def get_latest_date(self, code: str) -> Optional[str]:
+        """
+        종목의 최신 데이터 날짜 조회
+
+        Returns:
+            최신 날짜 (YYYY-MM-DD) 또는 None
+        """
+        pass
+
+    @abstractmethod
+    def scan(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+             codes: Optional[Iterable[str]] = None, market: Optional[str] = None) -> Dict[str, list]:
+        """
+        전체 종목 주가 스캔 (백테스트, 유니버스 매트릭스용)
+
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            codes: 종목 코드 목록 (기본: 전체)
+            market: 시장 (기본: 전체)
+
+        Returns:
+            컬럼 형식 {'code': [...], 'market': [...], 'date': [YYYYMMDD, ...], 'open': [...], ...}
+            (code, date 오름차순)
+        """
+        pass
+
+    def iter_batches(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     codes: Optional[Iterable[str]] = None, market: Optional[str] = None,
+                     batch_size: int = 50_000) -> Iterator[Dict[str, list]]:
+        """
+        스캔 결과를 batch_size 행 이하의 컬럼 묶음으로 나눠 반환 (대량 내보내기용)
+
+        기본 구현은 scan() 결과를 나누므로, 메모리를 일정하게 유지하려면 저장소별로 재정의합니다.
+
+        Yields:
+            scan()과 같은 컬럼 형식 딕셔너리
+        """
+        columns = self.scan(start_date, end_date, codes, market)
+        for start in range(0, len(columns['date']), batch_size):
+            yield {name: values[start:start + batch_size] for name, values in columns.items()}
+
+    def flush(self):
+        """버퍼링된 쓰기 반영 (필요한 저장소만 구현)"""
+        pass
+
+    def close(self):
+        """저장소 종료"""
+        self.flush()
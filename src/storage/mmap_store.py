@@ -0,0 +1,327 @@
+"""
+메모리 맵 OHLCV 캐시 (읽기 최적화)
+종목별 고정 폭 바이너리 파일을 NumPy memmap으로 열어 복사 없이 조회
+
+    {root}/{market}/{code}.ohlcv
+
+파일 구조:
+    헤더 64 bytes  magic(8) | 레코드 크기(u4) | 예약(u4) | 레코드 수(i8) | 첫 날짜(i8) | 마지막 날짜(i8) | 패딩
+    레코드         date(i8, YYYYMMDD) | open | high | low | close (f8) | volume(i8)  (날짜 오름차순)
+                   값 없음은 가격 NaN, 거래량 -1 (읽을 때 None)
+"""
+
+import os
+import struct
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable
+
+import numpy as np
+
+from .base import encode_date, decode_date
+
+
+# 마지막 바이트는 형식 버전 (v2: 거래량 없음을 0 대신 MISSING_VOLUME으로 기록, 이전 버전 파일은 다시 생성)
+MAGIC = b'OHLCV\x00\x00\x02'
+HEADER = struct.Struct('<8sIIqqq')
+HEADER_SIZE = 64
+
+OHLCV_DTYPE = np.dtype([
+    ('date', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<i8'),
+])
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+
+# 거래량 없음 (정수 컬럼이라 NaN 대신 사용)
+MISSING_VOLUME = -1
+
+
+class PriceSeries:
+    """
+    종목 주가 시계열 뷰 (최신순)
+
+    기존 주가 데이터 리스트(List[Dict])처럼 len(), 인덱싱, 순회를 지원하며,
+    column()은 memmap 위의 NumPy 뷰를 복사 없이 반환합니다.
+    """
+
+    def __init__(self, code: str, market: str, records: np.ndarray):
+        """
+        Args:
+            code: 종목 코드
+            market: 시장
+            records: OHLCV_DTYPE 레코드 배열 (날짜 오름차순)
+        """
+        self.code = code
+        self.market = market
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # 최신순 슬라이스 -> 오름차순 레코드 범위
+            start, stop, step = index.indices(len(self.records))
+            if step != 1:
+                raise ValueError("PriceSeries는 step 슬라이스를 지원하지 않습니다")
+            n = len(self.records)
+            return PriceSeries(self.code, self.market, self.records[n - max(stop, start):n - start])
+
+        n = len(self.records)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(index)
+        return self._row(self.records[n - 1 - index])
+
+    def __iter__(self):
+        for record in self.records[::-1]:
+            yield self._row(record)
+
+    def _row(self, record) -> Dict:
+        date, open_, high, low, close, volume = record.tolist()
+        row = {
+            'code': self.code,
+            'market': self.market,
+            'date': decode_date(date),
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': None if volume == MISSING_VOLUME else volume
+        }
+        for field in PRICE_FIELDS:
+            if row[field] != row[field]:  # NaN -> None
+                row[field] = None
+        return row
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        컬럼 뷰 (최신순, 복사 없음)
+
+        Args:
+            field: date / open / high / low / close / volume
+
+        Returns:
+            NumPy 배열 뷰 (date는 YYYYMMDD 정수, 값 없음은 가격 NaN / 거래량 MISSING_VOLUME)
+        """
+        return self.records[field][::-1]
+
+    def latest(self, limit: int) -> 'PriceSeries':
+        """최근 limit 건"""
+        return PriceSeries(self.code, self.market, self.records[max(0, len(self.records) - limit):])
+
+    def between(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> 'PriceSeries':
+        """
+        기간 조회 (날짜 인덱스 이진 탐색)
+
+        Args:
+            start_date: 시작 날짜 (YYYY-MM-DD, 포함)
+            end_date: 종료 날짜 (YYYY-MM-DD, 포함)
+        """
+        dates = self.records['date']
+        lo = np.searchsorted(dates, encode_date(start_date), 'left') if start_date else 0
+        hi = np.searchsorted(dates, encode_date(end_date), 'right') if end_date else len(dates)
+        return PriceSeries(self.code, self.market, self.records[lo:hi])
+
+    def to_list(self) -> List[Dict]:
+        """주가 데이터 리스트로 변환 (최신순)"""
+        return list(self)
+
+
+class MmapPriceCache:
+    """
+    종목별 memmap OHLCV 파일 캐시
+
+    StockDatabase의 주가 저장소 옆에서 전체 이력을 고정 폭 바이너리로 유지합니다.
+    일별 갱신은 파일 끝에 추가(append)하며, 기존 날짜는 제자리에서 덮어씁니다.
+    """
+
+    def __init__(self, root: str = "../data/ohlcv"):
+        """
+        Args:
+            root: 캐시 디렉토리
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # (market, code) -> (레코드 수, memmap)
+        self._maps = {}
+
+    def _path(self, code: str, market: str) -> Path:
+        return self.root / market / f"{code}.ohlcv"
+
+    def exists(self, code: str, market: str) -> bool:
+        """캐시 파일 존재 여부"""
+        return self._path(code, market).exists()
+
+    @staticmethod
+    def _read_header(f) -> Optional[Dict]:
+        magic, record_size, _, count, first, last = HEADER.unpack(f.read(HEADER.size))
+        if magic[:-1] != MAGIC[:-1] or record_size != OHLCV_DTYPE.itemsize:
+            raise ValueError("OHLCV 파일 형식이 아닙니다")
+        if magic != MAGIC:
+            return None  # 이전 형식 버전 (다시 생성)
+        return {'count': count, 'first_date': first, 'last_date': last}
+
+    @staticmethod
+    def _write_header(f, count: int, first: int, last: int):
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, OHLCV_DTYPE.itemsize, 0, count, first, last).ljust(HEADER_SIZE, b'\0'))
+
+    def get_header(self, code: str, market: str) -> Optional[Dict]:
+        """
+        헤더 조회 (레코드 수, 첫/마지막 날짜)
+
+        Returns:
+            {'count', 'first_date', 'last_date'} (날짜는 YYYYMMDD 정수) 또는 None (파일 없음, 이전 형식 버전)
+        """
+        try:
+            with open(self._path(code, market), 'rb') as f:
+                return self._read_header(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def to_records(data: Iterable[Dict]) -> np.ndarray:
+        """주가 데이터 리스트 -> 레코드 배열 (날짜 오름차순, 중복 날짜는 마지막 값)"""
+        by_date = {}
+        for row in data:
+            by_date[encode_date(row['date'])] = row
+
+        records = np.empty(len(by_date), dtype=OHLCV_DTYPE)
+        for i, date in enumerate(sorted(by_date)):
+            row = by_date[date]
+            records[i] = (
+                date,
+                *(np.nan if row.get(field) is None else row[field] for field in PRICE_FIELDS),
+                MISSING_VOLUME if row.get('volume') is None else row['volume']
+            )
+        return records
+
+    @staticmethod
+    def columns_to_records(columns: Dict[str, list]) -> np.ndarray:
+        """PriceStore.scan() 컬럼 결과 -> 레코드 배열 (scan 결과는 날짜 오름차순)"""
+        records = np.empty(len(columns['date']), dtype=OHLCV_DTYPE)
+        records['date'] = columns['date']
+        for field in PRICE_FIELDS:
+            records[field] = np.array(columns[field], dtype=np.float64)
+        records['volume'] = [MISSING_VOLUME if volume is None else volume for volume in columns['volume']]
+        return records
+
+    def write(self, code: str, market: str, records: np.ndarray):
+        """
+        종목 캐시 파일 전체 기록 (임시 파일 후 교체, 열린 memmap은 이전 파일 유지)
+
+        Args:
+            records: OHLCV_DTYPE 레코드 배열 (날짜 오름차순)
+        """
+        path = self._path(code, market)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+
+        with open(tmp, 'wb') as f:
+            first = int(records['date'][0]) if len(records) else 0
+            last = int(records['date'][-1]) if len(records) else 0
+            self._write_header(f, len(records), first, last)
+            f.write(np.ascontiguousarray(records).tobytes())
+
+        os.replace(tmp, path)
+        self._maps.pop((market, code), None)
+
+    def append(self, code: str, market: str, data: List[Dict]) -> bool:
+        """
+        일별 갱신 (새 날짜는 끝에 추가, 기존 날짜는 제자리 덮어쓰기)
+
+        마지막 날짜 이전의 새 날짜가 섞여 있으면 파일을 다시 씁니다.
+
+        Args:
+            data: 주가 데이터 리스트
+
+        Returns:
+            갱신 여부 (캐시 파일이 없거나 이전 형식 버전이면 False)
+        """
+        path = self._path(code, market)
+        if not path.exists() or not data:
+            return False
+
+        new = self.to_records(data)
+
+        if self.get_header(code, market) is None:
+            # 이전 형식 버전은 삭제 (다음 load()에서 주가 저장소로 다시 생성)
+            self.remove(code, market)
+            return False
+
+        with open(path, 'r+b') as f:
+            header = self._read_header(f)
+            count = header['count']
+            existing = np.memmap(f, dtype=OHLCV_DTYPE, mode='r+', offset=HEADER_SIZE,
+                                 shape=(count,)) if count else np.empty(0, dtype=OHLCV_DTYPE)
+
+            positions = np.searchsorted(existing['date'], new['date'])
+            if count:
+                found = existing['date'][np.minimum(positions, count - 1)] == new['date']
+            else:
+                found = np.zeros(len(new), dtype=bool)
+            tail = new[~found]
+
+            if len(tail) and count and tail['date'][0] <= header['last_date']:
+                # 중간 삽입 -> 전체 재작성
+                merged = np.concatenate([existing[~np.isin(existing['date'], new['date'])], new])
+                merged.sort(order='date')
+                del existing
+                f.close()
+                self.write(code, market, merged)
+                return True
+
+            if found.any():
+                existing[positions[found]] = new[found]
+                existing.flush()
+            del existing
+
+            if len(tail):
+                # 레코드를 먼저 쓰고 헤더의 레코드 수를 마지막에 갱신
+                f.seek(HEADER_SIZE + count * OHLCV_DTYPE.itemsize)
+                f.write(np.ascontiguousarray(tail).tobytes())
+                f.flush()
+                first = header['first_date'] if count else int(tail['date'][0])
+                self._write_header(f, count + len(tail), first, int(tail['date'][-1]))
+
+        return True
+
+    def load(self, code: str, market: str) -> Optional[PriceSeries]:
+        """
+        종목 시계열 로드 (memmap, 복사 없음)
+
+        Returns:
+            PriceSeries 또는 None (캐시 파일 없음)
+        """
+        header = self.get_header(code, market)
+        if header is None:
+            return None
+
+        count = header['count']
+        cached = self._maps.get((market, code))
+        if cached is None or cached[0] != count:
+            if count:
+                records = np.memmap(self._path(code, market), dtype=OHLCV_DTYPE, mode='r',
+                                    offset=HEADER_SIZE, shape=(count,))
+            else:
+                records = np.empty(0, dtype=OHLCV_DTYPE)
+            cached = (count, records)
+            self._maps[(market, code)] = cached
+
+        return PriceSeries(code, market, cached[1])
+
+    def remove(self, code: str, market: str):
+        """종목 캐시 파일 삭제"""
+        self._maps.pop((market, code), None)
+        self._path(code, market).unlink(missing_ok=True)
+
+    def close(self):
+        """열린 memmap 해제"""
+        self._maps.clear()
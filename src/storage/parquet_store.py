@@ -0,0 +1,321 @@
+"""
+Parquet 주가 저장소 (컬럼 기반)
+시장/연도별 Hive 파티션 디렉토리에 OHLCV 이력을 저장
+
+    {root}/market=KRX/year=2026/part-<seq>.parquet
+"""
+
+import time
+import uuid
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable, Iterator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .base import PriceStore, SCAN_COLUMNS, encode_date, decode_date
+
+
+# 파일 스키마 (market, year는 디렉토리 파티션 컬럼)
+FILE_SCHEMA = pa.schema([
+    ('code', pa.string()),
+    ('date', pa.int32()),
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('volume', pa.int64()),
+    ('_seq', pa.int64()),  # 쓰기 순서 (같은 종목/날짜 중복 시 최신 값 사용)
+])
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('market', pa.string()), ('year', pa.int32())]), flavor='hive'
+)
+
+
+class ParquetPriceStore(PriceStore):
+    """Parquet/Arrow 기반 주가 저장소"""
+
+    def __init__(self, root: str = "../data/prices", buffer_rows: int = 100_000,
+                 row_group_size: int = 8192):
+        """
+        Args:
+            root: 저장 디렉토리
+            buffer_rows: 쓰기 버퍼 크기 (행 수, 초과 시 파일로 기록)
+            row_group_size: Parquet row group 크기 (작을수록 종목 단위 조회 시 건너뛰는 범위가 큼)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.buffer_rows = buffer_rows
+        self.row_group_size = row_group_size
+
+        # 메모리 버퍼 {market: [pa.Table, ...]}
+        self._buffer = {}
+        self._buffered = 0
+        self._dataset = None
+        self._years = None
+
+    # ----- 쓰기 -----
+
+    def save_price_data(self, code: str, market: str, data: List[Dict]):
+        table = self._to_table(code, data)
+        if table.num_rows == 0:
+            return
+
+        self._buffer.setdefault(market, []).append(table)
+        self._buffered += table.num_rows
+
+        if self._buffered >= self.buffer_rows:
+            self.flush()
+
+    @staticmethod
+    def _to_table(code: str, data: List[Dict]) -> pa.Table:
+        """주가 데이터 리스트 -> 파일 스키마 Table (잘못된 행은 경고 후 제외)"""
+        try:
+            rows = data
+            dates = [encode_date(row['date']) for row in rows]
+        except Exception:
+            rows, dates = [], []
+            for row in data:
+                try:
+                    dates.append(encode_date(row['date']))
+                    rows.append(row)
+                except Exception as e:
+                    print(f"⚠️  데이터 저장 오류 ({code}, {row.get('date')}): {e}")
+
+        columns = {
+            'code': [code] * len(rows),
+            'date': dates,
+            'open': [row.get('open') for row in rows],
+            'high': [row.get('high') for row in rows],
+            'low': [row.get('low') for row in rows],
+            'close': [row.get('close') for row in rows],
+            'volume': [row.get('volume') for row in rows],
+            '_seq': [time.time_ns()] * len(rows),
+        }
+        return pa.table(columns, schema=FILE_SCHEMA)
+
+    def flush(self):
+        """버퍼를 시장/연도 파티션별 Parquet 파일 하나씩으로 기록"""
+        if not self._buffer:
+            return
+
+        for market, tables in self._buffer.items():
+            table = pa.concat_tables(tables)
+            years = pc.divide(table['date'], 10000)
+            for year in pc.unique(years).to_pylist():
+                self._write_partition(market, year, table.filter(pc.equal(years, year)))
+
+        self._buffer = {}
+        self._buffered = 0
+        self._dataset = None
+        self._years = None
+
+    def _write_partition(self, market: str, year: int, table: pa.Table) -> Path:
+        directory = self.root / f"market={market}" / f"year={year}"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # 이름 순서 = 쓰기 순서
+        path = directory / f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+        pq.write_table(table.sort_by([('code', 'ascending'), ('date', 'ascending')]),
+                       path, row_group_size=self.row_group_size, compression='zstd')
+        return path
+
+    def compact(self) -> Dict:
+        """
+        파티션별 파일을 하나로 병합 (중복 종목/날짜 제거, code/date 정렬)
+
+        Returns:
+            {'partitions': 병합한 파티션 수, 'files_before': n, 'files_after': n}
+        """
+        self.flush()
+
+        files_before = 0
+        partitions = 0
+
+        for directory in sorted(self.root.glob("market=*/year=*")):
+            files = sorted(directory.glob("*.parquet"))
+            files_before += len(files)
+            if len(files) <= 1:
+                continue
+
+            table = self._deduplicate(pq.ParquetDataset(files).read())
+            market = directory.parent.name.split('=', 1)[1]
+            year = int(directory.name.split('=', 1)[1])
+            self._write_partition(market, year, table.select(FILE_SCHEMA.names))
+
+            for path in files:
+                path.unlink()
+            partitions += 1
+
+        self._dataset = None
+        self._years = None
+        files_after = len(list(self.root.glob("market=*/year=*/*.parquet")))
+
+        return {'partitions': partitions, 'files_before': files_before, 'files_after': files_after}
+
+    # ----- 읽기 -----
+
+    def _get_dataset(self) -> Optional[ds.Dataset]:
+        """파티션 데이터셋 (쓰기 전까지 재사용)"""
+        self.flush()
+
+        if self._dataset is None:
+            if not any(self.root.glob("market=*/year=*/*.parquet")):
+                return None
+            self._dataset = ds.dataset(str(self.root), format='parquet', partitioning=PARTITIONING)
+
+        return self._dataset
+
+    def _get_years(self) -> List[int]:
+        """저장된 연도 파티션 (최신 순)"""
+        self.flush()
+
+        if self._years is None:
+            self._years = sorted({
+                int(path.name.split('=', 1)[1]) for path in self.root.glob("market=*/year=*")
+                if any(path.glob("*.parquet"))
+            }, reverse=True)
+
+        return self._years
+
+    @staticmethod
+    def _deduplicate(table: pa.Table) -> pa.Table:
+        """(code, date) 중복 시 _seq가 가장 큰 행만 남기고 code, date 순으로 정렬"""
+        if table.num_rows == 0:
+            return table
+
+        table = table.sort_by([('code', 'ascending'), ('date', 'ascending'), ('_seq', 'ascending')])
+
+        codes = table['code']
+        dates = table['date']
+        same_as_next = pc.and_(
+            pc.equal(codes.slice(0, len(codes) - 1), codes.slice(1)),
+            pc.equal(dates.slice(0, len(dates) - 1), dates.slice(1))
+        )
+        keep = pa.concat_arrays([
+            pc.invert(same_as_next).combine_chunks(),
+            pa.array([True])
+        ])
+
+        return table.filter(keep)
+
+    def _read(self, filter_expr, columns: Optional[List[str]] = None) -> pa.Table:
+        dataset = self._get_dataset()
+        if dataset is None:
+            return pa.table({name: [] for name in SCAN_COLUMNS + ('_seq',)})
+
+        if columns is not None:
+            columns = list(dict.fromkeys(columns + ['code', 'date', '_seq']))
+
+        table = dataset.to_table(columns=columns, filter=filter_expr)
+        return self._deduplicate(table)
+
+    @staticmethod
+    def _date_filter(expr, start_date: Optional[str], end_date: Optional[str]):
+        # 연도 파티션 프루닝 + 파일 내 row group 통계 프루닝
+        if start_date:
+            start = encode_date(start_date)
+            expr = expr & (ds.field('year') >= start // 10000) & (ds.field('date') >= start)
+        if end_date:
+            end = encode_date(end_date)
+            expr = expr & (ds.field('year') <= end // 10000) & (ds.field('date') <= end)
+        return expr
+
+    def _read_newest(self, expr, start_date: Optional[str], end_date: Optional[str],
+                     limit: int, columns: Optional[List[str]] = None) -> pa.Table:
+        """최신 연도 파티션부터 limit 건이 찰 때까지 조회 (오래된 순 Table)"""
+        first = encode_date(start_date) // 10000 if start_date else None
+        last = encode_date(end_date) // 10000 if end_date else None
+        expr = self._date_filter(expr, start_date, end_date)
+
+        tables = []
+        rows = 0
+        for year in self._get_years():
+            if (last is not None and year > last) or (first is not None and year < first):
+                continue
+
+            table = self._read(expr & (ds.field('year') == year), columns)
+            if table.num_rows:
+                tables.insert(0, table)
+                rows += table.num_rows
+                if rows >= limit:
+                    break
+
+        if not tables:
+            return self._read(ds.scalar(False), columns)
+
+        table = pa.concat_tables(tables)
+        return table.slice(max(0, table.num_rows - limit))
+
+    def get_price_data(self, code: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, limit: int = 60) -> List[Dict]:
+        table = self._read_newest(ds.field('code') == code, start_date, end_date, limit)
+        if table.num_rows == 0:
+            return []
+
+        rows = table.select(['market', 'date', 'open', 'high', 'low', 'close', 'volume']).to_pylist()
+
+        return [
+            {
+                'code': code,
+                'market': row['market'],
+                'date': decode_date(row['date']),
+                'open': row['open'],
+                'high': row['high'],
+                'low': row['low'],
+                'close': row['close'],
+                'volume': row['volume']
+            }
+            for row in reversed(rows)
+        ]
+
+    def get_latest_date(self, code: str) -> Optional[str]:
+        table = self._read_newest(ds.field('code') == code, None, None, 1, columns=['date'])
+        if table.num_rows == 0:
+            return None
+        return decode_date(table['date'][0].as_py())
+
+    def scan_table(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                   codes: Optional[Iterable[str]] = None,
+                   market: Optional[str] = None) -> pa.Table:
+        """
+        전체 종목 주가 스캔 (Arrow Table 그대로 반환)
+
+        Returns:
+            SCAN_COLUMNS 컬럼의 pyarrow.Table (code, date 오름차순)
+        """
+        expr = ds.scalar(True)
+        if market:
+            expr = expr & (ds.field('market') == market)
+        if codes is not None:
+            expr = expr & ds.field('code').isin(list(codes))
+        expr = self._date_filter(expr, start_date, end_date)
+
+        return self._read(expr).select(list(SCAN_COLUMNS))
+
+    def scan(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+             codes: Optional[Iterable[str]] = None, market: Optional[str] = None) -> Dict[str, list]:
+        table = self.scan_table(start_date, end_date, codes, market)
+        return {name: table[name].to_pylist() for name in SCAN_COLUMNS}
+
+    def iter_batches(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     codes: Optional[Iterable[str]] = None, market: Optional[str] = None,
+                     batch_size: int = 50_000) -> Iterator[Dict[str, list]]:
+        # 연도 파티션 단위로 읽어 나눔 (메모리 상한 = 연도 파티션 하나, 연도 -> code -> date 순)
+        first = encode_date(start_date) // 10000 if start_date else None
+        last = encode_date(end_date) // 10000 if end_date else None
+        codes = list(codes) if codes is not None else None
+
+        for year in sorted(self._get_years()):
+            if (first is not None and year < first) or (last is not None and year > last):
+                continue
+
+            year_start = max(start_date or '', f"{year:04d}-01-01")
+            year_end = min(end_date or '9999-12-31', f"{year:04d}-12-31")
+            table = self.scan_table(year_start, year_end, codes, market)
+
+            for batch in table.to_batches(max_chunksize=batch_size):
+                yield {name: batch.column(name).to_pylist() for name in SCAN_COLUMNS}
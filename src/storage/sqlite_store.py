@@ -0,0 +1,200 @@
+"""
+SQLite 주가 저장소 (기본)
+stock_prices (symbol_id, date) WITHOUT ROWID 테이블 + symbols 차원 테이블 사용
+"""
+
+import json
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple, TYPE_CHECKING
+
+from .base import PriceStore, SCAN_COLUMNS, encode_date, decode_date
+
+if TYPE_CHECKING:
+    from database import StockDatabase
+
+
+class SQLitePriceStore(PriceStore):
+    """StockDatabase 연결을 공유하는 SQLite 주가 저장소"""
+
+    def __init__(self, db: "StockDatabase"):
+        """
+        Args:
+            db: 연결/스키마/아카이브를 관리하는 StockDatabase
+        """
+        self.db = db
+        self._symbol_ids = {}
+
+    def _get_symbol_id(self, code: str, market: Optional[str] = None) -> Optional[int]:
+        """
+        종목 코드의 symbol_id 조회 (market 지정 시 없으면 생성)
+
+        Args:
+            code: 종목 코드
+            market: 시장 (지정 시 symbols 테이블에 등록/갱신)
+
+        Returns:
+            symbol_id 또는 None
+        """
+        cached = self._symbol_ids.get(code)
+        if cached is not None and market is None:
+            return cached[0]
+        if cached is not None and cached[1] == market:
+            return cached[0]
+
+        cursor = self.db.conn.cursor()
+
+        if market is not None:
+            cursor.execute("""
+                INSERT INTO symbols (code, market) VALUES (?, ?)
+                ON CONFLICT(code) DO UPDATE SET market = excluded.market
+                WHERE market != excluded.market
+            """, (code, market))
+
+        cursor.execute("SELECT symbol_id, market FROM symbols WHERE code = ?", (code,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        self._symbol_ids[code] = (row['symbol_id'], row['market'])
+        return row['symbol_id']
+
+    def save_price_data(self, code: str, market: str, data: List[Dict]):
+        symbol_id = self._get_symbol_id(code, market)
+
+        cursor = self.db.conn.cursor()
+
+        for row in data:
+            try:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO stock_prices 
+                    (symbol_id, date, open, high, low, close, volume)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    symbol_id,
+                    encode_date(row['date']),
+                    row.get('open'),
+                    row.get('high'),
+                    row.get('low'),
+                    row.get('close'),
+                    row.get('volume')
+                ))
+            except Exception as e:
+                print(f"⚠️  데이터 저장 오류 ({code}, {row.get('date')}): {e}")
+
+        self.db.conn.commit()
+
+    def get_price_data(self, code: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, limit: int = 60) -> List[Dict]:
+        symbol_id = self._get_symbol_id(code)
+        if symbol_id is None:
+            return []
+
+        market = self._symbol_ids[code][1]
+
+        query = f"""
+            SELECT date, open, high, low, close, volume
+            FROM {self.db._source('stock_prices')} WHERE symbol_id = ?
+        """
+        params = [symbol_id]
+
+        if start_date:
+            query += " AND date >= ?"
+            params.append(encode_date(start_date))
+
+        if end_date:
+            query += " AND date <= ?"
+            params.append(encode_date(end_date))
+
+        query += " ORDER BY date DESC LIMIT ?"
+        params.append(limit)
+
+        cursor = self.db.conn.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+        return [
+            {
+                'code': code,
+                'market': market,
+                'date': decode_date(row['date']),
+                'open': row['open'],
+                'high': row['high'],
+                'low': row['low'],
+                'close': row['close'],
+                'volume': row['volume']
+            }
+            for row in rows
+        ]
+
+    def get_latest_date(self, code: str) -> Optional[str]:
+        symbol_id = self._get_symbol_id(code)
+        if symbol_id is None:
+            return None
+
+        cursor = self.db.conn.cursor()
+        cursor.execute(
+            f"SELECT MAX(date) as latest FROM {self.db._source('stock_prices')} WHERE symbol_id = ?",
+            (symbol_id,)
+        )
+        row = cursor.fetchone()
+        return decode_date(row['latest']) if row and row['latest'] else None
+
+    def _scan_query(self, start_date: Optional[str], end_date: Optional[str],
+                    codes: Optional[Iterable[str]], market: Optional[str]) -> Tuple[str, list]:
+        query = f"""
+            SELECT s.code, s.market, p.date, p.open, p.high, p.low, p.close, p.volume
+            FROM {self.db._source('stock_prices')} p
+            JOIN symbols s ON s.symbol_id = p.symbol_id
+            WHERE 1 = 1
+        """
+        params = []
+
+        if start_date:
+            query += " AND p.date >= ?"
+            params.append(encode_date(start_date))
+
+        if end_date:
+            query += " AND p.date <= ?"
+            params.append(encode_date(end_date))
+
+        if market:
+            query += " AND s.market = ?"
+            params.append(market)
+
+        if codes is not None:
+            query += " AND s.code IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(codes)))
+
+        query += " ORDER BY s.code, p.date"
+        return query, params
+
+    def scan(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+             codes: Optional[Iterable[str]] = None, market: Optional[str] = None) -> Dict[str, list]:
+        query, params = self._scan_query(start_date, end_date, codes, market)
+
+        # Row 객체 생성 없이 튜플로 받아 컬럼으로 전치
+        cursor = self.db.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+        if not rows:
+            return {name: [] for name in SCAN_COLUMNS}
+
+        return {name: list(column) for name, column in zip(SCAN_COLUMNS, zip(*rows))}
+
+    def iter_batches(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                     codes: Optional[Iterable[str]] = None, market: Optional[str] = None,
+                     batch_size: int = 50_000) -> Iterator[Dict[str, list]]:
+        query, params = self._scan_query(start_date, end_date, codes, market)
+
+        # 별도 읽기 연결 사용 (다른 스레드에서 호출 가능)
+        conn = self.db.open_reader()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield {name: list(column) for name, column in zip(SCAN_COLUMNS, zip(*rows))}
+        finally:
+            conn.close()